@@ -11,14 +11,39 @@
 
 from __future__ import annotations
 
-import configparser
+import fcntl
+import fnmatch
+import hashlib
+import json
 import os
-import subprocess
-import sys
-from typing import Any, Dict, List, Optional
+import re
+import tempfile
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+)
 
+from ansible import constants as C
 from ansible.errors import AnsibleActionFail
 from ansible.plugins.action import ActionBase
+from ansible_collections.o0_o.controller.plugins.module_utils.subsets import (
+    COSTS,
+    GATHER_SUBSET_CHOICES,
+    PROFILES,
+)
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors import (
+    load_collector,
+)
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
 
 
 class ActionModule(ActionBase):
@@ -32,6 +57,9 @@ class ActionModule(ActionBase):
 
     The plugin provides modular fact collection through subset filtering
     and supports comprehensive controller environment introspection.
+    Each subset is collected by a class in plugin_utils/collectors whose
+    module is only imported when the subset is first used (see
+    _collector).
 
     .. note::
        This plugin operates locally on the controller and does not
@@ -42,169 +70,722 @@ class ActionModule(ActionBase):
     _requires_connection = False
     _supports_check_mode = True
     _supports_async = False
-    _supports_diff = False
+    _supports_diff = True
 
-    def user(
-        self, task_vars: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    DEFAULT_CACHE_PATH = "~/.ansible/o0_controller_cache"
+    DEFAULT_CACHE_TTL = 3600
+    DEFAULT_MAX_WORKERS = 4
+    PROFILE_ENV = "O0_CONTROLLER_PROFILE"
+    # Host variable receiving the facts with publish=host_vars, distinct
+    # from the o0_controller fact, which would take precedence over it
+    PUBLISH_VAR = "o0_controller_published"
+
+    COSTS = COSTS
+    PROFILES = PROFILES
+
+    # Timing record of the collector running on each thread
+    _local = threading.local()
+    _timings: Dict[str, Dict[str, Any]] = {}
+
+    # Fact cache directory of the current run, or None without cache
+    _cache_dir: Optional[str] = None
+
+    # Directory of the indexes that outlive a worker process whether or
+    # not the fact cache is enabled, or None outside collector()
+    _index_dir: Optional[str] = None
+
+    # Subsets allowed to remove the stale items they find
+    _prune: FrozenSet[str] = frozenset()
+
+    # Subsets left out of the last collection by gather_timeout
+    _skipped: List[str] = []
+
+    # Subsets reported as None by collector_timeout in the last collection
+    _timed_out: List[str] = []
+
+    # Seconds the process subset samples the process tree for rates
+    _process_sample: float = 0.0
+
+    # Directories searched for virtual environments by the interpreters
+    # subset, or None for its defaults
+    _venv_roots: Optional[List[str]] = None
+
+    # Fact paths whose dict keys are exported as the value of a label
+    # rather than as part of the metric name
+    EXPORT_LABELS = {
+        ("resources", "load"): "minutes",
+        ("run_stats", "modules"): "module",
+        ("fact_cache", "sizes"): "bucket",
+    }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the action with no collector created yet."""
+        super().__init__(*args, **kwargs)
+        self._collectors: Dict[str, CommonCollector] = {}
+
+    def _collector(self, subset: str) -> CommonCollector:
+        """
+        Return the collector of a subset, creating it on first use.
+
+        The collector class is looked up in the COLLECTORS registry and
+        its module imported only then, so a run imports the collectors
+        of the subsets it gathers and no others.
+
+        :param str subset: Collector subset name
+        :returns CommonCollector: Collector bound to this action
+        :raises KeyError: If the subset is not registered
         """
-        Return current controller user ID, username, and group info.
+        collector = self._collectors.get(subset)
+        if collector is None:
+            collector = load_collector(subset)(self)
+            self._collectors[subset] = collector
 
-        Collects information about the user running the Ansible
-        controller process including user ID, username, primary group
-        ID, and group name.
+        return collector
 
+    def _cache_fingerprint(
+        self, subset: str, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the inputs that a cached subset result depends on.
+
+        The fingerprint always includes the effective user ID. File
+        backed subsets add the path of their input file and the stat
+        fields that change when that file is replaced or modified.
+        Subsets that read site-packages also add the mtime of each
+        site-packages directory reported by the interpreter, which
+        changes whenever a distribution is installed, upgraded or
+        removed. Those directories come from the persisted probe result
+        (see PackagesCollector._probe_python), so an unchanged
+        interpreter is not run again to check a cache entry.
+
+        :param str subset: Collector subset name
         :param Optional[Dict[str, Any]] task_vars: Task variables
             dictionary
-        :returns Dict[str, Any]: User information dictionary with id,
-            name, and group details
-        :raises AnsibleActionFail: If any subprocess call fails
+        :returns Optional[Dict[str, Any]]: Fingerprint dictionary, or
+            None if the subset cannot be cached
         """
         task_vars = task_vars or {}
-        self._display.v("Collecting controller user info...")
+        fingerprint = {"subset": subset, "euid": os.geteuid()}
+
+        if subset == "user":
+            return fingerprint
+
+        if subset == "config":
+            path = task_vars.get("ansible_config_file")
+            fields = ("st_mtime_ns", "st_size")
+        elif subset in ("python", "packages"):
+            path = task_vars.get("ansible_playbook_python")
+            fields = ("st_ino", "st_mtime_ns")
+        else:
+            return None
+
+        if not path:
+            return None
+
+        fingerprint["path"] = path
+        try:
+            st = os.stat(path)
+        except OSError:
+            fingerprint["stat"] = None
+            return fingerprint
+
+        fingerprint["stat"] = [getattr(st, f) for f in fields]
+
+        if subset in ("python", "packages"):
+            try:
+                site_dirs = self._collector("packages")._site_packages(path)
+            except AnsibleActionFail:
+                # Left to the collector to report
+                return None
+            for site_dir in site_dirs:
+                try:
+                    mtime = os.stat(site_dir).st_mtime_ns
+                except OSError:
+                    mtime = None
+                fingerprint["stat"].append([site_dir, mtime])
+
+        return fingerprint
+
+    def _cache_file(self, cache_path: str, fingerprint: Dict[str, Any]) -> str:
+        """
+        Return the cache entry path for a fingerprint.
+
+        Entries are named after the stable part of the fingerprint
+        (subset, user and input path) so that a changed input replaces
+        its previous entry instead of accumulating a new one.
 
-        user_id = os.geteuid()
+        :param str cache_path: Cache directory
+        :param Dict[str, Any] fingerprint: Subset fingerprint
+        :returns str: Path to the cache entry file
+        """
+        identity = {k: v for k, v in fingerprint.items() if k != "stat"}
+        digest = hashlib.sha256(
+            json.dumps(identity, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:32]
+
+        return os.path.join(
+            cache_path, f"{fingerprint['subset']}-{digest}.json"
+        )
+
+    def _cache_load(
+        self,
+        cache_path: str,
+        fingerprint: Dict[str, Any],
+        cache_ttl: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached subset result if it is still valid.
+
+        An entry is valid when its stored fingerprint matches the
+        current one exactly and it is younger than the TTL.
+
+        :param str cache_path: Cache directory
+        :param Dict[str, Any] fingerprint: Current subset fingerprint
+        :param int cache_ttl: Maximum entry age in seconds, or 0 for no
+            expiry
+        :returns Optional[Dict[str, Any]]: Cached entry with a 'data'
+            key, or None on a miss
+        """
+        path = self._cache_file(cache_path, fingerprint)
 
         try:
-            user_name = subprocess.run(
-                ["id", "-un", "--", str(user_id)],
-                capture_output=True,
-                encoding="utf-8",
-                check=True,
-            ).stdout.rstrip("\r\n")
-
-            group_id = subprocess.run(
-                ["id", "-g", "--", str(user_id)],
-                capture_output=True,
-                encoding="utf-8",
-                check=True,
-            ).stdout.rstrip("\r\n")
-
-            group_name = subprocess.run(
-                ["id", "-gn", "--", str(user_id)],
-                capture_output=True,
-                encoding="utf-8",
-                check=True,
-            ).stdout.rstrip("\r\n")
-
-        except subprocess.CalledProcessError as e:
-            raise AnsibleActionFail(f"Failed to get user info: {e}") from e
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None
+        if entry.get("fingerprint") != fingerprint:
+            self._display.vv(f"Controller fact cache stale: {path}")
+            return None
+        if cache_ttl and time.time() - entry.get("time", 0) > cache_ttl:
+            self._display.vv(f"Controller fact cache expired: {path}")
+            return None
+
+        return entry
+
+    def _cache_store(
+        self, cache_path: str, fingerprint: Dict[str, Any], data: Any
+    ) -> None:
+        """
+        Atomically write a subset result to the cache.
+
+        Failures are reported at high verbosity and otherwise ignored
+        since the cache is only an optimization.
+
+        :param str cache_path: Cache directory
+        :param Dict[str, Any] fingerprint: Current subset fingerprint
+        :param Any data: Collected subset data
+        """
+        path = self._cache_file(cache_path, fingerprint)
+        entry = {"fingerprint": fingerprint, "time": time.time(), "data": data}
+
+        try:
+            self._write_json(path, entry)
+        except (OSError, TypeError, ValueError) as e:
+            self._display.vv(f"Unable to write controller fact cache: {e}")
+
+    @classmethod
+    def _write_json(cls, path: str, data: Any) -> None:
+        """
+        Atomically replace a file with the JSON encoding of data.
+
+        :param str path: Destination file path
+        :param Any data: JSON serializable data
+        :raises OSError: If the file cannot be written
+        :raises TypeError: If data is not JSON serializable
+        """
+        cls._write_text(
+            path, json.dumps(data, separators=(",", ":")), suffix=".json"
+        )
+
+    @staticmethod
+    def _write_text(
+        path: str,
+        text: str,
+        suffix: str = ".tmp",
+        mode: Optional[int] = None,
+    ) -> None:
+        """
+        Atomically replace a file with text.
+
+        The parent directory is created (mode 0700) if it is missing and
+        the text is written to a temporary file in the same directory
+        before being renamed over the destination, so readers never see
+        a partial document.
+
+        :param str path: Destination file path
+        :param str text: File content
+        :param str suffix: Suffix of the temporary file name
+        :param Optional[int] mode: Permissions of the file, or None to
+            keep those of mkstemp (0600)
+        :raises OSError: If the file cannot be written
+        """
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=".tmp-", suffix=suffix
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                if mode is not None:
+                    os.fchmod(f.fileno(), mode)
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _snapshot(
+        self, facts: Dict[str, Any], snapshot_path: str
+    ) -> Dict[str, Any]:
+        """
+        Compare facts with the last snapshot and store them as the next.
+
+        The snapshot is the o0_controller namespace without _meta,
+        written as compact JSON. It is only rewritten when something
+        changed and never in check mode. A missing or unreadable
+        snapshot counts as empty, so every fact is reported as changed.
+        Subsets skipped by gather_timeout keep their snapshot values.
+
+        :param Dict[str, Any] facts: Facts returned by collector()
+        :param str snapshot_path: Snapshot file path
+        :returns Dict[str, Any]: Dotted paths of the changed keys, and
+            trees of their values before and after
+        """
+        after = {
+            k: v for k, v in facts["o0_controller"].items() if k != "_meta"
+        }
+        # Normalize to JSON types so tuples compare equal to lists
+        after = json.loads(json.dumps(after, default=str))
+
+        try:
+            with open(snapshot_path, encoding="utf-8") as f:
+                before = json.load(f)
+        except (OSError, ValueError):
+            self._display.vv(f"No usable snapshot at {snapshot_path}")
+            before = {}
+
+        for subset in self._skipped:
+            if subset in before:
+                after[subset] = before[subset]
+
+        paths = self._diff_paths(before, after)
+
+        if paths and not self._task.check_mode:
+            self._write_json(snapshot_path, after)
 
         return {
-            "id": user_id,
-            "name": user_name,
-            "group": {"id": group_id, "name": group_name},
+            "keys": [".".join(p) for p in paths],
+            "before": self._subtree(before, paths),
+            "after": self._subtree(after, paths),
         }
 
-    def config(
-        self, task_vars: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    def _export(
+        self, facts: Dict[str, Any], export_path: str, wall: float
+    ) -> None:
         """
-        Read Ansible config file as specified in task_vars.
+        Write the numeric facts and collector timings as Prometheus text.
 
-        Parses the Ansible configuration file and extracts all sections
-        and their settings for controller introspection.
+        The file follows the node_exporter textfile format: every
+        number, and every boolean as 0 or 1, reached through nested
+        dicts of the o0_controller namespace (except _meta) becomes a
+        gauge named after its key path, and the keys of the dicts in
+        EXPORT_LABELS become label values instead. Lists are not
+        exported. A fact whose sanitized name is already taken by
+        another fact, or whose series is already present, is left out.
+        Infinities and NaN are written as +Inf, -Inf and NaN. The timing
+        of each collector, the cache hits and misses, the skipped
+        subsets and the time of the export are added. The file is
+        replaced atomically and is world-readable, for node_exporter to
+        pick up.
 
-        :param Optional[Dict[str, Any]] task_vars: Task variables
-            dictionary
-        :returns Dict[str, Any]: Configuration dictionary with path and
-            settings information
-        :raises AnsibleActionFail: If ansible_config_file is missing
-            from task_vars
+        :param Dict[str, Any] facts: Facts returned by collector()
+        :param str export_path: Destination file path
+        :param float wall: Seconds spent in collector()
         """
-        task_vars = task_vars or {}
-        self._display.v("Collecting controller Ansible config info...")
+        metrics: Dict[str, Dict[str, Any]] = {}
 
-        path = task_vars.get("ansible_config_file")
-        if not path:
-            raise AnsibleActionFail(
-                "'ansible_config_file' is missing from task_vars"
+        def add(name, value, help_text, labels=None):
+            if isinstance(value, bool):
+                value = int(value)
+            elif not isinstance(value, (int, float)):
+                return
+            name = "o0_controller_" + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+            labels = labels or {}
+            metric = metrics.setdefault(
+                name, {"help": help_text, "samples": []}
             )
+            if metric["help"] != help_text or any(
+                labels == other for other, _ in metric["samples"]
+            ):
+                self._display.vv(f"Not exporting {help_text}: {name} is taken")
+                return
+            metric["samples"].append((labels, value))
 
-        config = {"path": path, "settings": {}}
+        def walk(value, path, labels):
+            if not isinstance(value, dict):
+                add(
+                    "_".join(path),
+                    value,
+                    f"Controller fact o0_controller.{'.'.join(path)}",
+                    labels,
+                )
+                return
+            label = self.EXPORT_LABELS.get(tuple(path))
+            for key, item in value.items():
+                if label is None:
+                    walk(item, path + [str(key)], labels)
+                else:
+                    walk(item, path, {**labels, label: str(key)})
 
-        cfg = configparser.ConfigParser()
-        cfg.read(path)
+        for subset, data in facts["o0_controller"].items():
+            if subset != "_meta":
+                walk(data, [subset], {})
 
-        for section in cfg.sections():
-            config["settings"][section] = dict(cfg.items(section))
+        cache_hits = cache_misses = 0
+        for subset, record in self._timings.items():
+            labels = {"subset": subset}
+            add(
+                "collector_seconds",
+                record["wall"],
+                "Collector wall time",
+                labels,
+            )
+            add(
+                "collector_cpu_seconds",
+                record["cpu"],
+                "Collector CPU time",
+                labels,
+            )
+            add(
+                "collector_subprocesses",
+                record["subprocesses"]["count"],
+                "Subprocesses run by the collector",
+                labels,
+            )
+            add(
+                "collector_cached",
+                record["cached"],
+                "Whether the fact cache was used",
+                labels,
+            )
+            cache_hits += record["cached"]
+            cache_misses += record["cacheable"] and not record["cached"]
+        if self._cache_dir:
+            add("cache_hits", cache_hits, "Subsets read from the fact cache")
+            add(
+                "cache_misses",
+                cache_misses,
+                "Cacheable subsets gathered without the fact cache",
+            )
+        add(
+            "skipped_subsets",
+            len(self._skipped),
+            "Subsets skipped by gather_timeout",
+        )
+        add("gather_seconds", round(wall, 6), "Wall time of fact gathering")
+        add(
+            "export_timestamp_seconds",
+            round(time.time(), 3),
+            "Time of the export",
+        )
 
-        return config
+        def number(value):
+            if value != value:
+                return "NaN"
+            if value in (float("inf"), float("-inf")):
+                return "+Inf" if value > 0 else "-Inf"
+            return repr(value)
 
-    def python(
-        self, task_vars: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        def escape(value):
+            return (
+                value.replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+            )
+
+        lines = []
+        for name, metric in metrics.items():
+            lines.append(f"# HELP {name} {escape(metric['help'])}")
+            lines.append(f"# TYPE {name} gauge")
+            for labels, value in metric["samples"]:
+                pairs = ",".join(
+                    f'{k}="{escape(v)}"' for k, v in labels.items()
+                )
+                series = f"{name}{{{pairs}}}" if pairs else name
+                lines.append(f"{series} {number(value)}")
+
+        self._write_text(export_path, "\n".join(lines) + "\n", mode=0o644)
+
+    @staticmethod
+    def _diff_paths(before: Any, after: Any) -> List[List[str]]:
         """
-        Return Python interpreter info and pip version (if available).
+        Return the key paths where two fact trees differ.
 
-        Collects information about the Python interpreter running
-        Ansible and attempts to determine the pip version if available.
+        Dictionaries are compared key by key; any other values,
+        including lists, are compared as a whole.
 
+        :param Any before: Previous facts
+        :param Any after: Current facts
+        :returns List[List[str]]: Sorted key paths of added, removed and
+            changed values
+        """
+        paths = []
+        stack = [([], before, after)]
+
+        while stack:
+            path, old, new = stack.pop()
+            if not (isinstance(old, dict) and isinstance(new, dict)):
+                paths.append(path)
+                continue
+
+            for key in set(old) | set(new):
+                if key not in old or key not in new:
+                    paths.append(path + [key])
+                elif old[key] != new[key]:
+                    stack.append((path + [key], old[key], new[key]))
+
+        return sorted(paths)
+
+    @staticmethod
+    def _subtree(tree: Dict[str, Any], paths: List[List[str]]) -> Dict:
+        """
+        Return the parts of a fact tree found at the given key paths.
+
+        :param Dict[str, Any] tree: Fact tree
+        :param List[List[str]] paths: Key paths
+        :returns Dict: Tree holding only those paths that exist in tree
+        """
+        subtree = {}
+
+        for path in paths:
+            node = tree
+            for key in path:
+                if not isinstance(node, dict) or key not in node:
+                    break
+                node = node[key]
+            else:
+                parent = subtree
+                for key in path[:-1]:
+                    parent = parent.setdefault(key, {})
+                parent[path[-1]] = node
+
+        return subtree
+
+    def _resolvers(
+        self, subset: str, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Callable[[], Any]]]:
+        """
+        Return resolvers for the leaves of a subset, in fact order.
+
+        Each resolver computes the value at one dotted key path of the
+        subset. A collector provides them with a
+        ``_<subset>_resolvers`` method, whose lookups shared by several
+        leaves (such as the passwd entry or the interpreter probe) run
+        at most once, and only when a leaf that needs them is resolved.
+        Subsets without resolvers are only collected as a whole.
+
+        :param str subset: Collector subset name
         :param Optional[Dict[str, Any]] task_vars: Task variables
             dictionary
-        :returns Dict[str, Any]: Python interpreter and pip information
-        :raises AnsibleActionFail: If ansible_playbook_python is
-            missing
-            from task_vars
+        :returns Optional[Dict[str, Callable[[], Any]]]: Resolvers keyed
+            by dotted key path, or None
+        :raises AnsibleActionFail: If a task variable the subset needs
+            is missing
         """
-        task_vars = task_vars or {}
-        self._display.v("Collecting controller Python info...")
+        collector = self._collector(subset)
+        resolvers = getattr(collector, f"_{subset}_resolvers", None)
+        if resolvers is None:
+            return None
 
-        path = task_vars.get("ansible_playbook_python")
-        if not path:
-            raise AnsibleActionFail(
-                "'ansible_playbook_python' is missing from task_vars"
-            )
+        return resolvers(task_vars=task_vars)
 
-        python = {
-            "interpreter": {
-                "path": path,
-                "version": {"id": sys.version.split()[0]},
-            }
-        }
+    def _resolve(
+        self,
+        subset: str,
+        resolvers: Dict[str, Callable[[], Any]],
+        patterns: List[List[str]],
+    ) -> Dict[str, Any]:
+        """
+        Compute only the leaves of a subset selected by filter patterns.
 
-        try:
-            # Try to get pip version from the same interpreter
-            pip_argv = [path, "-m", "pip", "--version"]
-            pip_output = subprocess.run(
-                pip_argv, capture_output=True, encoding="utf-8", check=True
-            ).stdout.rstrip("\r\n")
-            python["pip"] = {"version": {"id": pip_output.split()[1]}}
-        except Exception:
-            self._display.vv("pip not available for this interpreter")
-            python["pip"] = None
-
-        return python
+        Leaves whose key path no pattern can match are never resolved.
+
+        :param str subset: Collector subset name
+        :param Dict[str, Callable[[], Any]] resolvers: Leaf resolvers
+            from _resolvers()
+        :param List[List[str]] patterns: Filter patterns split on '.'
+        :returns Dict[str, Any]: Subset data holding only the selected
+            key paths
+        """
+        data = {}
+        for key, resolve in resolvers.items():
+            path = key.split(".")
+            match = self._filter_match([subset, *path], patterns)
+            if match is False:
+                continue
+
+            value = resolve()
+            if match is None:
+                if not isinstance(value, dict):
+                    continue
+                value = self._prune_facts([subset, *path], value, patterns)
+                if not value:
+                    continue
+
+            node = data
+            for k in path[:-1]:
+                node = node.setdefault(k, {})
+            node[path[-1]] = value
+
+        return data
+
+    @staticmethod
+    def _filter_match(
+        path: List[str], patterns: List[List[str]]
+    ) -> Optional[bool]:
+        """
+        Match a key path against filter patterns.
+
+        Patterns are compared one key at a time with fnmatch, so ``*``
+        stands for a single key. A pattern selects the whole subtree
+        under every path it matches.
+
+        :param List[str] path: Key path under o0_controller
+        :param List[List[str]] patterns: Filter patterns split on '.'
+        :returns Optional[bool]: True if a pattern selects the path and
+            everything under it, None if a pattern may select something
+            below it, and False otherwise
+        """
+        match = False
+
+        for pattern in patterns:
+            if not all(
+                fnmatch.fnmatchcase(k, p) for k, p in zip(path, pattern)
+            ):
+                continue
+            if len(pattern) <= len(path):
+                return True
+            match = None
+
+        return match
+
+    def _prune_facts(
+        self, path: List[str], tree: Any, patterns: List[List[str]]
+    ) -> Any:
+        """
+        Return the parts of a fact tree selected by filter patterns.
+
+        :param List[str] path: Key path of tree under o0_controller
+        :param Any tree: Fact tree
+        :param List[List[str]] patterns: Filter patterns split on '.'
+        :returns Any: Tree holding only the selected key paths, or tree
+            itself if it is not a dictionary
+        """
+        if not isinstance(tree, dict):
+            return tree
+
+        pruned = {}
+        for key, value in tree.items():
+            match = self._filter_match([*path, key], patterns)
+            if match:
+                pruned[key] = value
+            elif match is None and isinstance(value, dict):
+                value = self._prune_facts([*path, key], value, patterns)
+                if value:
+                    pruned[key] = value
+
+        return pruned
 
     def collector(
         self,
         gather_subset: Optional[List[str]] = None,
         task_vars: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+        cache_path: Optional[str] = None,
+        parallel: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        collector_timeout: Optional[float] = None,
+        meta: bool = False,
+        prune: Optional[List[str]] = None,
+        filter: Optional[List[str]] = None,
+        gather_profile: str = "default",
+        gather_timeout: Optional[float] = None,
+        process_sample: float = 0.0,
+        venv_roots: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Run selected collectors and return merged fact data.
 
         Coordinates the collection of different fact categories based on
         the specified subset filter, supporting modular fact gathering.
+        When caching is enabled, each subset result is reused from disk
+        for as long as its fingerprint is unchanged and within the TTL.
+        When parallel collection is enabled, collectors run concurrently
+        on a bounded thread pool (see _schedule). With a filter, only
+        the subsets and leaves that match it are computed (see
+        _filter_match and _resolve), and subsets in which nothing
+        matches are left out. The gather_profile limits 'all' to
+        the collectors of the cost classes in PROFILES; subsets named
+        explicitly are always gathered. With a gather_timeout, the
+        subsets that have not finished by the deadline are left out of
+        the facts and listed in _skipped.
 
         :param Optional[List[str]] gather_subset: Collector subset names
             or ['all']
         :param Optional[Dict[str, Any]] task_vars: Task variables from
             controller
+        :param bool cache: Whether to use the on-disk fact cache
+        :param int cache_ttl: Maximum cache entry age in seconds, or 0
+            for no expiry
+        :param Optional[str] cache_path: Cache directory, defaults to
+            DEFAULT_CACHE_PATH
+        :param bool parallel: Whether to run collectors concurrently
+        :param int max_workers: Maximum number of concurrent collectors
+        :param Optional[float] collector_timeout: Seconds after which a
+            parallel collector is reported as None, or None to wait
+        :param bool meta: Whether to add per-collector timing under
+            the _meta key
+        :param Optional[List[str]] prune: Subsets allowed to remove
+            the stale items they find
+        :param Optional[List[str]] filter: Dotted key paths or globs
+            under o0_controller to return, or None for everything
+        :param str gather_profile: Key of PROFILES selecting the cost
+            classes gathered for 'all'
+        :param Optional[float] gather_timeout: Seconds after which
+            collection stops and returns what has finished, or None to
+            wait
+        :param float process_sample: Seconds between the two readings
+            of the process tree used for rates, or 0 for no rates
+        :param Optional[List[str]] venv_roots: Directories holding one
+            virtual environment per subdirectory, or None for the
+            interpreters subset's defaults
         :returns Dict[str, Any]: Merged fact data under o0_controller
             namespace
-        :raises AnsibleActionFail: When invalid gather_subset values are
-            provided
+        :raises AnsibleActionFail: When invalid gather_subset or
+            gather_profile values are provided
         """
         gather_subset = gather_subset or ["all"]
         task_vars = task_vars or {}
 
-        all_collectors = ["user", "config", "python"]
+        if gather_profile not in self.PROFILES:
+            raise AnsibleActionFail(
+                f"Invalid gather_profile: {gather_profile}"
+            )
+        deadline = None
+        if gather_timeout is not None:
+            deadline = time.monotonic() + gather_timeout
+
+        all_collectors = list(self.COSTS)
+        costs = self.PROFILES[gather_profile]
         subsets = set()
 
         for s in gather_subset:
             if s == "all":
-                subsets = set(all_collectors)
+                subsets = {c for c in all_collectors if self.COSTS[c] in costs}
             elif s == "!all":
                 subsets = set()
             elif s.startswith("!") and s[1:] in all_collectors:
@@ -214,14 +795,358 @@ class ActionModule(ActionBase):
             else:
                 raise AnsibleActionFail(f"Invalid gather_subset: {s}")
 
-        facts = {}
-        for s in all_collectors:
-            if s in subsets:
-                self._display.vv(f"Gathering controller fact subset: {s}")
-                facts[s] = getattr(self, s)(task_vars=task_vars)
+        index_dir = os.path.expanduser(cache_path or self.DEFAULT_CACHE_PATH)
+        cache_path = index_dir if cache else None
+        self._cache_dir = cache_path
+        self._index_dir = index_dir
+        self._prune = frozenset(prune or [])
+        self._process_sample = max(0.0, process_sample)
+        self._venv_roots = venv_roots
+
+        patterns = [p.split(".") for p in filter or []]
+        selected = [s for s in all_collectors if s in subsets]
+        if patterns:
+            # Subsets that no pattern can match are not collected at all
+            selected = [
+                s
+                for s in selected
+                if self._filter_match([s], patterns) is not False
+            ]
+        self._timings = {}
+        self._timed_out = []
+        start = time.perf_counter()
+
+        if parallel and len(selected) > 1 or deadline is not None:
+            # Without parallel, a single worker keeps the subsets in order
+            facts = self._schedule(
+                selected,
+                task_vars=task_vars,
+                cache_path=cache_path,
+                cache_ttl=cache_ttl,
+                max_workers=max_workers if parallel else 1,
+                timeout=collector_timeout if parallel else None,
+                patterns=patterns,
+                deadline=deadline,
+            )
+        else:
+            facts = {}
+            for s in selected:
+                facts[s] = self._collect(
+                    s,
+                    task_vars=task_vars,
+                    cache_path=cache_path,
+                    cache_ttl=cache_ttl,
+                    patterns=patterns,
+                )
+
+        self._skipped = [s for s in selected if s not in facts]
+        if patterns:
+            # A subset in which no key matches is left out, not empty
+            facts = {s: v for s, v in facts.items() if v != {}}
+        if self._skipped:
+            self._display.warning(
+                f"Controller fact gathering stopped after {gather_timeout}s; "
+                f"skipped subsets: {', '.join(self._skipped)}"
+            )
+
+        if meta:
+            # An abandoned collector may have recorded timings by then
+            abandoned = set(self._timed_out) | set(self._skipped)
+            facts["_meta"] = {
+                "wall": round(time.perf_counter() - start, 6),
+                "parallel": bool(parallel and len(selected) > 1),
+                "collectors": {
+                    s: (
+                        {**self._timings.get(s, {}), "timed_out": True}
+                        if s in abandoned
+                        else self._timings[s]
+                    )
+                    for s in selected
+                },
+            }
 
         return {"o0_controller": facts}
 
+    def _schedule(
+        self,
+        subsets: List[str],
+        task_vars: Optional[Dict[str, Any]] = None,
+        cache_path: Optional[str] = None,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None,
+        patterns: Optional[List[List[str]]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run collectors concurrently on a bounded set of daemon threads.
+
+        Results are returned in the order of ``subsets`` regardless of
+        completion order. A collector that runs longer than ``timeout``
+        seconds (counted from its own start, or from the start of
+        scheduling while it is still queued) is reported as None with a
+        warning; its thread is abandoned rather than waited for. At the
+        ``deadline`` every unfinished collector is abandoned the same
+        way and left out of the result, and queued collectors are never
+        started. The threads are daemon threads, so an abandoned
+        collector does not hold up the exit of the worker process. The
+        subsets reported as None are listed in _timed_out.
+        Errors raised by a collector do not interrupt the others and
+        are re-raised once every collector has finished, in subset
+        order.
+
+        :param List[str] subsets: Ordered collector subset names
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :param Optional[str] cache_path: Cache directory, or None to
+            bypass the cache
+        :param int cache_ttl: Maximum cache entry age in seconds
+        :param int max_workers: Maximum number of concurrent collectors
+        :param Optional[float] timeout: Per-collector timeout in seconds
+        :param Optional[List[List[str]]] patterns: Filter patterns split
+            on '.', or None to collect everything
+        :param Optional[float] deadline: time.monotonic() value after
+            which unfinished collectors are skipped, or None to wait
+        :returns Dict[str, Any]: Subset data keyed by subset name, for
+            the subsets that finished by the deadline
+        :raises AnsibleActionFail: If a collector fails
+        """
+        begin = time.monotonic()
+        started = {}
+        # Subset results as (value, exception) pairs, guarded by finished
+        results: Dict[str, Tuple[Any, Optional[Exception]]] = {}
+        finished = threading.Condition()
+        queued = list(reversed(subsets))
+
+        def worker():
+            while True:
+                with finished:
+                    if not queued:
+                        return
+                    subset = queued.pop()
+                    started[subset] = time.monotonic()
+                try:
+                    result = (
+                        self._collect(
+                            subset,
+                            task_vars=task_vars,
+                            cache_path=cache_path,
+                            cache_ttl=cache_ttl,
+                            patterns=patterns,
+                        ),
+                        None,
+                    )
+                except Exception as e:
+                    result = (None, e)
+                with finished:
+                    results[subset] = result
+                    finished.notify()
+
+        # Unlike a ThreadPoolExecutor's, these threads are not joined at
+        # interpreter exit, so a hung collector cannot block the worker
+        for i in range(max(1, min(max_workers, len(subsets)))):
+            threading.Thread(
+                target=worker, name=f"o0_controller_{i}", daemon=True
+            ).start()
+
+        pending = set(subsets)
+        timed_out = set()
+        skipped = set()
+        with finished:
+            while True:
+                pending -= set(results)
+                if not pending:
+                    break
+                wait_for = None
+                now = time.monotonic()
+                if deadline is not None:
+                    if now >= deadline:
+                        skipped = set(pending)
+                        break
+                    wait_for = deadline - now
+                if timeout is not None:
+                    remaining = {
+                        s: timeout - (now - started.get(s, begin))
+                        for s in pending
+                    }
+                    expired = {s for s, r in remaining.items() if r <= 0}
+                    queued[:] = [s for s in queued if s not in expired]
+                    timed_out |= expired
+                    pending -= expired
+                    if not pending:
+                        break
+                    soonest = min(remaining[s] for s in pending)
+                    if wait_for is None or soonest < wait_for:
+                        wait_for = soonest
+                finished.wait(wait_for)
+            # Whatever is still queued is abandoned without being started
+            queued.clear()
+        self._timed_out = [s for s in subsets if s in timed_out]
+
+        self._display.vvv(
+            f"Scheduled {len(subsets)} controller collectors in "
+            f"{time.monotonic() - begin:.3f}s"
+        )
+
+        facts = {}
+        for s in subsets:
+            if s in skipped:
+                continue
+            if s in timed_out:
+                self._display.warning(
+                    f"Controller fact subset '{s}' timed out after "
+                    f"{timeout}s and was reported as null"
+                )
+                facts[s] = None
+                continue
+            value, error = results[s]
+            if error is not None:
+                raise error
+            facts[s] = value
+
+        return facts
+
+    def _collect(
+        self,
+        subset: str,
+        task_vars: Optional[Dict[str, Any]] = None,
+        cache_path: Optional[str] = None,
+        cache_ttl: int = DEFAULT_CACHE_TTL,
+        patterns: Optional[List[List[str]]] = None,
+    ) -> Any:
+        """
+        Run a single collector, consulting the fact cache if enabled.
+
+        When filter patterns select only part of the subset, the
+        selected leaves are resolved lazily (see _resolve). Subsets
+        without leaf resolvers are collected and cached as a whole, then
+        pruned.
+
+        :param str subset: Collector subset name
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :param Optional[str] cache_path: Cache directory, or None to
+            bypass the cache
+        :param int cache_ttl: Maximum cache entry age in seconds
+        :param Optional[List[List[str]]] patterns: Filter patterns split
+            on '.', or None to collect everything
+        :returns Any: Collected subset data
+        """
+        collector = self._collector(subset)
+        record = {
+            "wall": None,
+            "cpu": None,
+            "cacheable": False,
+            "cached": False,
+        }
+        record["subprocesses"] = {"count": 0, "durations": []}
+        self._timings[subset] = record
+        self._local.record = record
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+
+        try:
+            patterns = patterns or []
+            whole = not patterns or self._filter_match([subset], patterns)
+
+            fingerprint = None
+            if cache_path:
+                fingerprint = self._cache_fingerprint(subset, task_vars)
+                record["cacheable"] = fingerprint is not None
+
+            if fingerprint is not None:
+                entry = self._cache_load(cache_path, fingerprint, cache_ttl)
+                if entry is not None:
+                    self._display.vv(
+                        f"Using cached controller fact subset: {subset}"
+                    )
+                    record["cached"] = True
+                    if whole:
+                        return entry["data"]
+                    return self._prune_facts(
+                        [subset], entry["data"], patterns
+                    )
+
+            resolvers = None
+            if not whole:
+                resolvers = self._resolvers(subset, task_vars)
+            if resolvers is not None:
+                # Partial results are never cached
+                record["cacheable"] = False
+                self._display.vv(f"Resolving controller fact subset: {subset}")
+                return self._resolve(subset, resolvers, patterns)
+
+            self._display.vv(f"Gathering controller fact subset: {subset}")
+            data = getattr(collector, subset)(task_vars=task_vars)
+
+            if fingerprint is not None:
+                self._cache_store(cache_path, fingerprint, data)
+
+            if whole:
+                return data
+            return self._prune_facts([subset], data, patterns)
+        finally:
+            record["wall"] = round(time.perf_counter() - wall, 6)
+            record["cpu"] = round(time.thread_time() - cpu, 6)
+            self._local.record = None
+            self._display.vvv(
+                f"Controller fact subset {subset}: "
+                f"wall {record['wall']:.3f}s, cpu {record['cpu']:.3f}s, "
+                f"{record['subprocesses']['count']} subprocesses"
+                + (", cached" if record["cached"] else "")
+            )
+
+    def _single_flight(
+        self, key: str, compute: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Compute a result once and share it with concurrent workers.
+
+        Every worker process of a run shares Ansible's local tmp
+        directory. The first worker to take an exclusive lock on the
+        key's lock file computes the result and atomically writes it to
+        the key's result file. Workers that were waiting on the lock, or
+        that arrive later, read the result file instead of computing.
+        If computing fails no result is written, so the next waiter
+        tries again and reports its own error.
+
+        :param str key: Identifier shared by all workers of one task
+        :param Callable[[], Dict[str, Any]] compute: Produces the result
+        :returns Dict[str, Any]: Computed or shared result
+        """
+        base = os.path.join(C.DEFAULT_LOCAL_TMP, f"o0_controller-{key}")
+        result_path = f"{base}.json"
+
+        def read():
+            try:
+                with open(result_path, encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return None
+
+        shared = read()
+        if shared is not None:
+            self._display.vv(f"Using shared controller facts: {result_path}")
+            return shared
+
+        with open(f"{base}.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            shared = read()
+            if shared is not None:
+                self._display.vv(
+                    f"Using shared controller facts: {result_path}"
+                )
+                return shared
+
+            result = compute()
+            try:
+                self._write_json(result_path, result)
+            except (OSError, TypeError, ValueError) as e:
+                self._display.vv(f"Unable to share controller facts: {e}")
+
+        return result
+
     def run(
         self,
         tmp: Optional[str] = None,
@@ -230,9 +1155,57 @@ class ActionModule(ActionBase):
         """
         Main entry point for the controller facts action plugin.
 
+        Runs the plugin under cProfile when the environment variable
+        named by PROFILE_ENV is set to a directory. Each invocation then
+        writes an ``o0_controller-<pid>.pstats`` file there.
+
+        :param Optional[str] tmp: Temporary directory path (unused)
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Standard Ansible result dictionary
+        :raises AnsibleActionFail: When fact gathering fails
+        """
+        profile_dir = os.environ.get(self.PROFILE_ENV)
+        if not profile_dir:
+            return self._run(tmp, task_vars)
+
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(self._run, tmp, task_vars)
+        finally:
+            path = os.path.join(
+                os.path.expanduser(profile_dir),
+                f"o0_controller-{os.getpid()}.pstats",
+            )
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                profiler.dump_stats(path)
+                self._display.vvv(f"Wrote controller facts profile: {path}")
+            except OSError as e:
+                self._display.warning(
+                    f"Unable to write controller facts profile: {e}"
+                )
+
+    def _run(
+        self,
+        tmp: Optional[str] = None,
+        task_vars: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Gather controller facts for run().
+
         Gathers facts about the Ansible controller host based on the
         specified subset filter and returns them under the o0_controller
-        fact namespace.
+        fact namespace. With snapshot_path, only the facts that differ
+        from the last snapshot are returned (see _snapshot). With export,
+        the numeric facts are also written as Prometheus text (see
+        _export). With publish=host_vars they are returned as add_host
+        data, so the strategy stores them once as the PUBLISH_VAR
+        variable of publish_host rather than as facts of every host, and
+        workers that only read a single_flight result return nothing.
+        The strategy then sets changed to whether that variable changed.
 
         :param Optional[str] tmp: Temporary directory path (unused)
         :param Optional[Dict[str, Any]] task_vars: Task variables
@@ -244,18 +1217,12 @@ class ActionModule(ActionBase):
         .. note::
            This method operates locally on the controller host and does
            not require a connection to remote hosts. It warns when not
-           run with run_once: true.
+           run with run_once: true, unless single_flight is enabled so
+           that only one worker computes the facts.
         """
         task_vars = task_vars or {}
         tmp = None  # tmp is unused in modern Ansible
 
-        if not self._task.run_once:
-            self._display.warning(
-                "The o0_o.controller.facts module is intended to run on the "
-                "controller with `run_once: true`. Running this per-host is "
-                "unnecessary."
-            )
-
         # Fail early if run from a Windows controller
         if os.name == "nt":
             raise AnsibleActionFail(
@@ -268,32 +1235,164 @@ class ActionModule(ActionBase):
                 "type": "list",
                 "elements": "str",
                 "default": ["all"],
-                "choices": [
-                    "all",
-                    "user",
-                    "config",
-                    "python",
-                    "!all",
-                    "!user",
-                    "!config",
-                    "!python",
-                ],
-            }
+                "choices": GATHER_SUBSET_CHOICES,
+            },
+            "cache": {"type": "bool", "default": False},
+            "cache_ttl": {
+                "type": "int",
+                "default": self.DEFAULT_CACHE_TTL,
+            },
+            "cache_path": {"type": "path"},
+            "parallel": {"type": "bool", "default": False},
+            "max_workers": {
+                "type": "int",
+                "default": self.DEFAULT_MAX_WORKERS,
+            },
+            "collector_timeout": {"type": "float"},
+            "single_flight": {"type": "bool", "default": False},
+            "meta": {"type": "bool", "default": False},
+            "prune": {
+                "type": "list",
+                "elements": "str",
+                "default": [],
+                "choices": ["ssh", "fact_cache", "storage"],
+            },
+            "snapshot_path": {"type": "path"},
+            "publish": {
+                "type": "str",
+                "default": "facts",
+                "choices": ["facts", "host_vars"],
+            },
+            "publish_host": {"type": "str"},
+            "filter": {"type": "list", "elements": "str", "default": []},
+            "gather_profile": {
+                "type": "str",
+                "default": "default",
+                "choices": list(self.PROFILES),
+            },
+            "gather_timeout": {"type": "float"},
+            "process_sample": {"type": "float", "default": 0.0},
+            "venv_roots": {"type": "list", "elements": "path"},
+            "export": {"type": "path"},
         }
 
         validation_result, new_module_args = self.validate_argument_spec(
-            argument_spec=argument_spec
+            argument_spec=argument_spec,
+            required_if=[("publish", "host_vars", ["publish_host"])],
         )
         gather_subset = new_module_args["gather_subset"]
+        single_flight = new_module_args["single_flight"]
+
+        publish_host = None
+        if new_module_args["publish"] == "host_vars":
+            publish_host = new_module_args["publish_host"]
+            inventory_hosts = (task_vars.get("groups") or {}).get("all")
+            if publish_host not in (inventory_hosts or []):
+                # add_host would add it, and an implicit localhost would
+                # then match 'all' for the rest of the run
+                raise AnsibleActionFail(
+                    f"publish_host '{publish_host}' is not in the inventory"
+                )
+            # Only the worker that computes the facts publishes them
+            single_flight = True
+
+        if not self._task.run_once and not single_flight:
+            self._display.warning(
+                "The o0_o.controller.facts module is intended to run on the "
+                "controller with `run_once: true`. Running this per-host is "
+                "unnecessary."
+            )
 
         result = super(ActionModule, self).run(tmp, task_vars)
 
-        result.update(
-            {
-                "ansible_facts": self.collector(
-                    gather_subset=gather_subset, task_vars=task_vars
-                )
+        snapshot_path = new_module_args["snapshot_path"]
+        export_path = new_module_args["export"]
+        computed = []
+
+        def collect():
+            computed.append(True)
+            start = time.perf_counter()
+            facts = self.collector(
+                gather_subset=gather_subset,
+                task_vars=task_vars,
+                cache=new_module_args["cache"],
+                cache_ttl=new_module_args["cache_ttl"],
+                cache_path=new_module_args["cache_path"],
+                parallel=new_module_args["parallel"],
+                max_workers=new_module_args["max_workers"],
+                collector_timeout=new_module_args["collector_timeout"],
+                meta=new_module_args["meta"],
+                prune=new_module_args["prune"],
+                filter=new_module_args["filter"],
+                gather_profile=new_module_args["gather_profile"],
+                gather_timeout=new_module_args["gather_timeout"],
+                process_sample=new_module_args["process_sample"],
+                venv_roots=new_module_args["venv_roots"],
+            )
+            if export_path and not self._task.check_mode:
+                wall = time.perf_counter() - start
+                try:
+                    self._export(facts, export_path, wall)
+                except OSError as e:
+                    self._display.warning(
+                        f"Unable to export controller facts to "
+                        f"{export_path}: {e}"
+                    )
+            changes = None
+            if snapshot_path:
+                changes = self._snapshot(facts, snapshot_path)
+            return {
+                "facts": facts,
+                "changes": changes,
+                "skipped": self._skipped,
+            }
+
+        if single_flight and not self._task.run_once:
+            key = hashlib.sha256(
+                json.dumps(
+                    [str(self._task._uuid), new_module_args],
+                    sort_keys=True,
+                    default=str,
+                ).encode("utf-8")
+            ).hexdigest()[:32]
+            collected = self._single_flight(key, collect)
+        else:
+            collected = collect()
+
+        facts = collected["facts"]
+        if new_module_args["gather_timeout"] is not None:
+            result["skipped_subsets"] = collected["skipped"]
+        if any(
+            isinstance(v, dict) and v.get("pruned")
+            for v in facts["o0_controller"].values()
+        ):
+            result["changed"] = True
+
+        changes = collected["changes"]
+        if changes is not None:
+            # Only report what differs from the last snapshot
+            namespace = dict(changes["after"])
+            if "_meta" in facts["o0_controller"]:
+                namespace["_meta"] = facts["o0_controller"]["_meta"]
+            facts = {"o0_controller": namespace}
+            result["changed_keys"] = changes["keys"]
+            if changes["keys"]:
+                result["changed"] = True
+            if self._task.diff:
+                result["diff"] = {
+                    "before": changes["before"],
+                    "after": changes["after"],
+                }
+
+        if publish_host is None:
+            result.update({"ansible_facts": facts})
+        elif computed:
+            # Stored once as host vars of publish_host by the strategy
+            # instead of as facts of every host the task runs for
+            result["add_host"] = {
+                "host_name": publish_host,
+                "groups": [],
+                "host_vars": {self.PUBLISH_VAR: facts["o0_controller"]},
             }
-        )
 
         return result
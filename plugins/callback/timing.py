@@ -0,0 +1,98 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+DOCUMENTATION = r"""
+---
+name: timing
+type: aggregate
+short_description: Record task and host durations for controller facts
+version_added: '1.1.0'
+description:
+  - Measures how long every task takes on every host and aggregates the
+    durations per task, per module and per host.
+  - Durations are added to fixed-size histograms as results arrive, so
+    memory does not grow with the number of results.
+  - The aggregate is read by the C(run_stats) subset of
+    M(o0_o.controller.facts) and produces no output of its own.
+requirements:
+  - Enable this callback with C(callbacks_enabled) in the config file or
+    E(ANSIBLE_CALLBACKS_ENABLED).
+author:
+  - oØ.o (@o0-o)
+"""
+
+from typing import Any
+
+from ansible.plugins.callback import CallbackBase
+from ansible_collections.o0_o.controller.plugins.plugin_utils.timing import (
+    start_recording,
+)
+
+
+class CallbackModule(CallbackBase):
+    """Record task and host durations into the run's TimingRecorder."""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "o0_o.controller.timing"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._recorder = start_recording()
+
+    def v2_playbook_on_task_start(
+        self, task: Any, is_conditional: Any
+    ) -> None:
+        """Record the start of a task."""
+        self._recorder.task_start(
+            task._uuid, task.get_name(), task.resolved_action or task.action
+        )
+
+    def v2_playbook_on_handler_task_start(self, task: Any) -> None:
+        """Record the start of a handler."""
+        self.v2_playbook_on_task_start(task, False)
+
+    def v2_runner_on_start(self, host: Any, task: Any) -> None:
+        """Record the start of a task on a host."""
+        self._recorder.host_start(host.get_name(), task._uuid)
+
+    def v2_runner_on_ok(self, result: Any) -> None:
+        """Record a successful result."""
+        self._host_end(result)
+
+    def v2_runner_on_skipped(self, result: Any) -> None:
+        """Record a skipped result."""
+        self._host_end(result)
+
+    def v2_runner_on_failed(
+        self, result: Any, ignore_errors: bool = False
+    ) -> None:
+        """Record a failed result."""
+        self._host_end(result, failed=True)
+
+    def v2_runner_on_unreachable(self, result: Any) -> None:
+        """Record an unreachable host."""
+        self._host_end(result, failed=True)
+
+    def _host_end(self, result: Any, failed: bool = False) -> None:
+        """
+        Record the end of a task on a host.
+
+        :param Any result: Task result
+        :param bool failed: Whether the task failed or the host was
+            unreachable
+        """
+        self._recorder.host_end(
+            result._host.get_name(), result._task._uuid, failed=failed
+        )
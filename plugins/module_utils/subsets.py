@@ -0,0 +1,60 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""
+Registry of the controller fact subsets.
+
+Each subset is collected by a class in the module of the same name in
+plugins/plugin_utils/collectors, which only runs on the controller.
+The registry lives here so that the facts module can build its
+gather_subset choices from it.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+# Collector class and cost class of each subset, in fact order: cheap
+# collectors read a few files or system calls, moderate ones parse a
+# file tree or run at most one (memoized) subprocess, and expensive ones
+# scan directories, probe sockets or walk inventory variables
+COLLECTORS: Dict[str, Tuple[str, str]] = {
+    "user": ("UserCollector", "cheap"),
+    "config": ("ConfigCollector", "moderate"),
+    "python": ("PythonCollector", "moderate"),
+    "interpreters": ("InterpretersCollector", "expensive"),
+    "packages": ("PackagesCollector", "moderate"),
+    "resources": ("ResourcesCollector", "cheap"),
+    "advisor": ("AdvisorCollector", "moderate"),
+    "process": ("ProcessCollector", "moderate"),
+    "ssh": ("SshCollector", "expensive"),
+    "fact_cache": ("FactCacheCollector", "expensive"),
+    "storage": ("StorageCollector", "expensive"),
+    "inventory": ("InventoryCollector", "expensive"),
+    "collections": ("CollectionsCollector", "expensive"),
+    "run_stats": ("RunStatsCollector", "cheap"),
+}
+
+COSTS: Dict[str, str] = {name: cost for name, (_, cost) in COLLECTORS.items()}
+
+# Cost classes gathered for 'all' by each gather_profile
+PROFILES: Dict[str, Tuple[str, ...]] = {
+    "fast": ("cheap",),
+    "default": ("cheap", "moderate"),
+    "full": ("cheap", "moderate", "expensive"),
+}
+
+GATHER_SUBSET_CHOICES: List[str] = [
+    "all",
+    *COLLECTORS,
+    "!all",
+    *(f"!{name}" for name in COLLECTORS),
+]
@@ -21,7 +21,8 @@ version_added: '1.0.0'
 description:
   - Collects facts from the controller host that is running Ansible.
   - Includes current user information, Python interpreter and pip version,
-    and the currently loaded Ansible configuration file.
+    the distributions installed for the playbook interpreter, and the
+    currently loaded Ansible configuration file.
   - This module runs only on the controller and does not connect to any
     managed node.
 options:
@@ -33,19 +34,303 @@ options:
     type: list
     elements: str
     default: [all]
-    choices: [all, user, config, python, '!all', '!user', '!config', '!python']
+    choices:
+      - all
+      - user
+      - config
+      - python
+      - interpreters
+      - packages
+      - resources
+      - advisor
+      - process
+      - ssh
+      - fact_cache
+      - storage
+      - inventory
+      - collections
+      - run_stats
+      - '!all'
+      - '!user'
+      - '!config'
+      - '!python'
+      - '!interpreters'
+      - '!packages'
+      - '!resources'
+      - '!advisor'
+      - '!process'
+      - '!ssh'
+      - '!fact_cache'
+      - '!storage'
+      - '!inventory'
+      - '!collections'
+      - '!run_stats'
+  cache:
+    description:
+      - Store each subset result in an on-disk cache and reuse it on
+        later runs.
+      - Entries are keyed by a fingerprint of their inputs (the effective
+        user ID, the config file path, mtime and size for C(config), and
+        the interpreter path, inode and mtime for C(python)) and are
+        invalidated as soon as any of these change.
+    type: bool
+    default: false
+    version_added: '1.1.0'
+  cache_ttl:
+    description:
+      - Maximum age in seconds of a cache entry before it is recomputed.
+      - Use C(0) to keep entries until their fingerprint changes.
+    type: int
+    default: 3600
+    version_added: '1.1.0'
+  cache_path:
+    description:
+      - Directory holding the controller fact cache.
+      - The interpreter probe results of the C(interpreters), C(python)
+        and C(packages) subsets are kept there even without
+        O(cache=true).
+      - Defaults to C(~/.ansible/o0_controller_cache).
+    type: path
+    version_added: '1.1.0'
+  parallel:
+    description:
+      - Run the selected collectors concurrently on a bounded thread pool
+        so that wall time approaches that of the slowest collector.
+      - Results keep the same key order as sequential collection.
+    type: bool
+    default: false
+    version_added: '1.1.0'
+  max_workers:
+    description:
+      - Maximum number of collectors run at once when O(parallel=true).
+    type: int
+    default: 4
+    version_added: '1.1.0'
+  collector_timeout:
+    description:
+      - Seconds each collector may run when O(parallel=true) before it
+        is abandoned and its subset is reported as V(null) with a
+        warning.
+      - An abandoned collector runs on in a daemon thread, which does
+        not delay the exit of the worker process.
+      - A collector still queued behind others is timed from the start
+        of collection.
+      - By default collectors are waited for indefinitely.
+    type: float
+    version_added: '1.1.0'
+  single_flight:
+    description:
+      - When the task runs for many hosts without C(run_once), let only
+        the first worker process gather the facts and have every other
+        worker of the same task read its result.
+      - Coordination uses a lock file and a result file in Ansible's
+        local temporary directory, which is removed at the end of the
+        run.
+      - The C(run_once) warning is not shown when this is enabled.
+    type: bool
+    default: false
+    version_added: '1.1.0'
+  meta:
+    description:
+      - Add an C(o0_controller._meta) section with the wall time, CPU
+        time, subprocess count and subprocess durations of each
+        collector, and whether its result came from the cache.
+      - The same figures are displayed at C(-vvv) regardless of this
+        option.
+      - To profile the whole action, set the E(O0_CONTROLLER_PROFILE)
+        environment variable to a directory; each run then writes an
+        C(o0_controller-<pid>.pstats) file there.
+    type: bool
+    default: false
+    version_added: '1.1.0'
+  prune:
+    description:
+      - Subsets allowed to remove the stale items they find.
+      - C(ssh) removes ControlMaster sockets in the control path
+        directory that refuse connections because their master has
+        exited.
+      - C(fact_cache) removes file-backed fact cache entries older than
+        C(fact_caching_timeout).
+      - C(storage) removes C(ansible-local-*) and C(ansible-tmp-*)
+        directories owned by the user in the C(local_tmp) and
+        C(remote_tmp) directories once the process that created them has
+        exited and they have not been modified for a day.
+      - Nothing is removed in check mode. The task reports C(changed)
+        when anything was removed.
+    type: list
+    elements: str
+    default: []
+    choices:
+      - ssh
+      - fact_cache
+      - storage
+    version_added: '1.1.0'
+  snapshot_path:
+    description:
+      - File holding the facts from the previous run with this option.
+      - When set, only the facts that differ from the snapshot are
+        returned, their key paths are listed in RV(changed_keys) and the
+        task reports C(changed) when there are any. The snapshot is then
+        replaced with the current facts, except in check mode.
+      - Keys that were removed are listed in RV(changed_keys) but do not
+        appear in the facts.
+      - C(o0_controller._meta) is never compared or stored.
+      - In diff mode the old and new values of the changed keys are
+        shown.
+    type: path
+    version_added: '1.1.0'
+  publish:
+    description:
+      - Where the gathered facts are stored.
+      - C(facts) returns them as C(ansible_facts), so a task running for
+        many hosts stores a copy in the facts of every one of them.
+      - C(host_vars) stores them once as the C(o0_controller_published)
+        variable of O(publish_host), the way M(ansible.builtin.add_host)
+        does, to be read through
+        C(hostvars[publish_host].o0_controller_published). Only the
+        worker that gathers the facts publishes them, so O(single_flight)
+        is implied when the task runs without C(run_once).
+      - The variable is not named C(o0_controller), because a fact of
+        that name left by an earlier task would take precedence over it.
+      - Published variables are kept in memory for the rest of the
+        playbook run and are not written to the fact cache.
+      - As with M(ansible.builtin.add_host), the task then reports
+        C(changed) when the published variable differs from the one the
+        host had, regardless of O(snapshot_path).
+    type: str
+    default: facts
+    choices:
+      - facts
+      - host_vars
+    version_added: '1.1.0'
+  publish_host:
+    description:
+      - Inventory host that receives the facts when O(publish=host_vars).
+      - Required when O(publish=host_vars).
+      - The host must be in the inventory. The implicit C(localhost) is
+        not, since publishing to it would add it to the C(all) group.
+    type: str
+    version_added: '1.1.0'
+  filter:
+    description:
+      - Only return the facts at these key paths under C(o0_controller),
+        written with dots (for example C(python.interpreter.path)).
+      - Each key may be a shell-style glob, where C(*) stands for a
+        single key (for example C(user.gr*) or
+        C(resources.limits.*.soft)). A path selects everything below it.
+      - Subsets that no path can match are not collected. Within the
+        C(user), C(config), C(python) and C(resources) subsets only the
+        requested values are computed, so for example
+        C(python.interpreter.path) does not run the interpreter and
+        C(config.path) does not parse the config file. Other subsets are
+        collected in full and then filtered.
+      - A subset in which no path matches any key is left out of the
+        result.
+      - Applies to the subsets selected by O(gather_subset).
+    type: list
+    elements: str
+    default: []
+    version_added: '1.1.0'
+  gather_profile:
+    description:
+      - Limits C(all) in O(gather_subset) to collectors of the given cost.
+      - C(fast) gathers the cheap subsets, C(user), C(resources) and
+        C(run_stats), which only read a few files and system calls or
+        memory.
+      - C(default) adds the moderate subsets C(config), C(python),
+        C(packages), C(advisor) and C(process), which parse files or run
+        at most one interpreter probe.
+      - C(full) adds the expensive subsets C(interpreters), C(ssh),
+        C(fact_cache), C(storage), C(inventory) and C(collections), which
+        run several interpreters, scan directories, probe sockets or walk
+        inventory variables.
+      - Subsets named explicitly in O(gather_subset) are gathered
+        regardless of the profile.
+    type: str
+    default: default
+    choices:
+      - fast
+      - default
+      - full
+    version_added: '1.1.0'
+  gather_timeout:
+    description:
+      - Seconds after which collection stops and the facts gathered so
+        far are returned.
+      - Subsets that have not finished are left out of the facts, listed
+        in RV(skipped_subsets) and reported in a warning. Their
+        collectors are abandoned rather than waited for, like those
+        that exceed O(collector_timeout).
+      - Without O(parallel=true) the subsets are gathered one at a time
+        in order, so the ones after a slow subset are skipped too.
+      - By default collection runs to completion.
+    type: float
+    version_added: '1.1.0'
+  process_sample:
+    description:
+      - Seconds to wait between two readings of the process tree by the
+        C(process) subset, which then adds CPU and memory rates.
+      - A window of a second or less is usually enough to tell a busy
+        main process from an idle one.
+      - With V(0), the process tree is read once and no rates are
+        reported.
+    type: float
+    default: 0
+    version_added: '1.1.0'
+  venv_roots:
+    description:
+      - Directories holding one virtual environment per subdirectory,
+        searched by the C(interpreters) subset in addition to E(PATH).
+      - By default C(~/.virtualenvs), C(~/.venvs) and
+        C(~/.pyenv/versions).
+    type: list
+    elements: path
+    version_added: '1.1.0'
+  export:
+    description:
+      - File to write the numeric controller facts and collector timings
+        to, in the Prometheus text format read by the node_exporter
+        textfile collector. Its name must end in C(.prom) for
+        node_exporter to read it.
+      - Every number and boolean in the gathered facts becomes a gauge
+        named after its key path, such as
+        C(o0_controller_resources_limits_nofile_soft). Lists, such as
+        the individual packages, are not exported; their counts are.
+      - The keys of C(resources.load), C(run_stats.modules) and
+        C(fact_cache.sizes) become the C(minutes), C(module) and
+        C(bucket) labels of a single gauge.
+      - A fact whose name, once reduced to letters, digits and
+        underscores, is already taken by another fact is left out.
+      - C(o0_controller_collector_seconds),
+        C(o0_controller_collector_cpu_seconds),
+        C(o0_controller_collector_subprocesses) and
+        C(o0_controller_collector_cached) are reported per C(subset)
+        label. When O(cache) is enabled, C(o0_controller_cache_hits)
+        counts the subsets read from the cache and
+        C(o0_controller_cache_misses) those gathered afresh and stored
+        in it.
+      - The file is replaced atomically, so the exporter never reads a
+        partial file. Nothing is written in check mode.
+    type: path
+    version_added: '1.1.0'
 author:
   - oØ.o (@o0-o)
 seealso:
   - module: ansible.builtin.setup
 notes:
   - This module must be run via its action plugin.
+  - Intended to run with C(run_once=true). Use O(single_flight=true) when
+    that is not possible.
   - Only supported on POSIX-style controller systems.
   - Will raise an error if run from Windows.
 attributes:
   check_mode:
     description: This module supports check mode.
     support: full
+  diff_mode:
+    description: Shows the facts that changed when O(snapshot_path) is
+      set.
+    support: full
   async:
     description: This module does not support async operation.
     support: none
@@ -70,9 +355,134 @@ EXAMPLES = r"""
       - user
       - config
       - '!python'
+
+- name: Review performance settings against controller limits
+  o0_o.controller.facts:
+    gather_subset:
+      - advisor
+
+- name: Show warnings from the performance review
+  ansible.builtin.debug:
+    msg: "{{ item.rationale }}"
+  loop: "{{ o0_controller.advisor.recommendations }}"
+  when: item.severity == 'warning'
+
+- name: Survey the Python interpreters, reusing unchanged results
+  o0_o.controller.facts:
+    gather_subset:
+      - interpreters
+    venv_roots:
+      - /opt/venvs
+    cache: true
+
+- name: Show the quickest interpreter that can run ansible-core
+  ansible.builtin.debug:
+    var: o0_controller.interpreters.fastest_with_ansible
+
+- name: Sample the CPU and memory use of ansible-playbook and its workers
+  o0_o.controller.facts:
+    gather_subset:
+      - process
+    process_sample: 0.5
+
+- name: Show whether the main process is saturating a CPU
+  ansible.builtin.debug:
+    msg: "{{ o0_controller.process.processes[0].cpu_rate }}"
+
+- name: Count SSH multiplexing sockets and remove stale ones
+  o0_o.controller.facts:
+    gather_subset:
+      - ssh
+    prune:
+      - ssh
+
+- name: Remove expired entries from the jsonfile fact cache
+  o0_o.controller.facts:
+    gather_subset:
+      - fact_cache
+    prune:
+      - fact_cache
+
+- name: Report free space and remove temp dirs left by crashed runs
+  o0_o.controller.facts:
+    gather_subset:
+      - storage
+    prune:
+      - storage
+
+- name: Show the variables using the most controller memory
+  o0_o.controller.facts:
+    gather_subset:
+      - inventory
+
+- name: Print the heaviest variables
+  ansible.builtin.debug:
+    var: o0_controller.inventory.top_variables
+
+- name: Show the slowest tasks so far (with the timing callback enabled)
+  o0_o.controller.facts:
+    gather_subset:
+      - run_stats
+
+- name: Print the tasks with the highest 95th percentile duration
+  ansible.builtin.debug:
+    var: o0_controller.run_stats.slowest_tasks
+
+- name: Log only the controller facts that changed since the last job
+  o0_o.controller.facts:
+    snapshot_path: /var/lib/ansible/controller-facts.json
+  register: controller_facts
+
+- name: Gather the cheap controller facts in under 50ms
+  o0_o.controller.facts:
+    gather_profile: fast
+    gather_timeout: 0.05
+
+- name: Look up the playbook interpreter without probing it
+  o0_o.controller.facts:
+    filter:
+      - python.interpreter.path
+
+- name: Store the controller facts once on localhost for every host
+  o0_o.controller.facts:
+    publish: host_vars
+    publish_host: localhost
+
+- name: Read the published controller facts from any host
+  ansible.builtin.debug:
+    var: hostvars['localhost'].o0_controller_published.user.id
+
+- name: Gather controller facts, reusing cached results for up to a day
+  o0_o.controller.facts:
+    cache: true
+    cache_ttl: 86400
+
+- name: Gather controller facts concurrently, giving up on slow subsets
+  o0_o.controller.facts:
+    parallel: true
+    collector_timeout: 5
+
+- name: Export controller metrics for the node_exporter textfile collector
+  o0_o.controller.facts:
+    export: /var/lib/node_exporter/textfile/ansible_controller.prom
 """
 
 RETURN = r"""
+changed_keys:
+  description: Dotted key paths under C(o0_controller) that differ from
+    the snapshot.
+  returned: when O(snapshot_path) is set
+  type: list
+  elements: str
+  sample: ["python.interpreter.version.id"]
+  version_added: '1.1.0'
+skipped_subsets:
+  description: Subsets left out because O(gather_timeout) was reached.
+  returned: when O(gather_timeout) is set
+  type: list
+  elements: str
+  sample: ["collections"]
+  version_added: '1.1.0'
 ansible_facts:
   description: Dictionary of gathered controller facts.
   returned: always
@@ -103,6 +513,22 @@ ansible_facts:
                 name:
                   type: str
                   description: Group name.
+            groups:
+              type: list
+              elements: dict
+              description:
+                - Primary and supplementary groups, primary group first.
+                - Each item has the same C(id) and C(name) keys as
+                  C(group). C(name) is null for a group without an entry.
+              version_added: '1.1.0'
+            home:
+              type: str
+              description: Home directory.
+              version_added: '1.1.0'
+            shell:
+              type: str
+              description: Login shell.
+              version_added: '1.1.0'
         config:
           description: Parsed Ansible config file and values.
           type: dict
@@ -115,7 +541,10 @@ ansible_facts:
               type: dict
               description: Sectioned config key/values.
         python:
-          description: Python and pip information.
+          description:
+            - Python and pip information for C(ansible_playbook_python).
+            - Gathered by running a single probe with that interpreter,
+              or in process when it is the interpreter running Ansible.
           type: dict
           returned: when subset includes 'python'
           contains:
@@ -126,6 +555,15 @@ ansible_facts:
                 path:
                   type: str
                   description: Path to the Python interpreter.
+                executable:
+                  type: str
+                  description: Interpreter path with symlinks resolved.
+                  version_added: '1.1.0'
+                implementation:
+                  type: str
+                  description: Python implementation, such as
+                    C(CPython).
+                  version_added: '1.1.0'
                 version:
                   type: dict
                   description: Version metadata.
@@ -133,6 +571,24 @@ ansible_facts:
                     id:
                       type: str
                       description: Python version string.
+                prefix:
+                  type: str
+                  description: Value of C(sys.prefix).
+                  version_added: '1.1.0'
+                base_prefix:
+                  type: str
+                  description: Value of C(sys.base_prefix).
+                  version_added: '1.1.0'
+                venv:
+                  type: bool
+                  description: Whether the interpreter runs in a virtual
+                    environment.
+                  version_added: '1.1.0'
+                paths:
+                  type: dict
+                  description: Installation paths from
+                    C(sysconfig.get_paths()).
+                  version_added: '1.1.0'
             pip:
               type: dict
               description: pip installation metadata.
@@ -145,9 +601,533 @@ ansible_facts:
                     id:
                       type: str
                       description: pip version string.
+        interpreters:
+          description:
+            - Python interpreters on E(PATH) and in the environments
+              under O(venv_roots), probed concurrently with a bounded
+              number of subprocesses.
+            - Paths that run the same binary in the same environment are
+              reported once, in discovery order, starting with
+              C(ansible_playbook_python).
+            - A probe result is reused while the inode and mtime of the
+              binary and the mtime of its site-packages directory are
+              unchanged. Results are kept in the O(cache_path) directory
+              across tasks and runs, even without O(cache=true), so a
+              survey only runs new or changed interpreters.
+          type: dict
+          returned: when subset includes 'interpreters'
+          version_added: '1.1.0'
+          contains:
+            venv_roots:
+              type: list
+              elements: str
+              description: Expanded venv root directories.
+            count:
+              type: int
+              description: Number of distinct interpreters.
+            probed:
+              type: int
+              description: Number of interpreters run by this survey.
+            fastest_with_ansible:
+              type: str
+              description: Path of the interpreter with the shortest
+                probe time among those that can import ansible-core, or
+                V(null) if there is none.
+            interpreters:
+              type: list
+              elements: dict
+              description:
+                - Each interpreter's C(path), other C(aliases) to it,
+                  C(version), C(implementation), C(executable),
+                  C(prefix) and whether it is a C(venv).
+                - C(ansible_core) holds whether ansible is
+                  C(importable), found without importing it, and the
+                  ansible-core C(version).
+                - C(probe_seconds) is the wall time of the probe, which
+                  is mostly interpreter startup.
+                - Interpreters that cannot be probed have an C(error)
+                  message and V(null) values.
+        packages:
+          description:
+            - Distributions installed for C(ansible_playbook_python),
+              read from the metadata in the site-packages directories
+              on its C(sys.path) without running pip.
+          type: dict
+          returned: when subset includes 'packages'
+          version_added: '1.1.0'
+          contains:
+            paths:
+              type: list
+              elements: str
+              description: Scanned site-packages directories, resolved
+                to real paths, in C(sys.path) order.
+            count:
+              type: int
+              description: Number of distributions found.
+            distributions:
+              type: list
+              elements: dict
+              description: Distributions sorted by normalized name.
+              contains:
+                name:
+                  type: str
+                  description: Distribution name.
+                version:
+                  type: str
+                  description: Distribution version.
+                path:
+                  type: str
+                  description: Site-packages directory it was found in.
+        resources:
+          description:
+            - Controller CPU, memory, load and resource limits, read from
+              C(/proc), C(/sys/fs/cgroup) and C(getrlimit) without
+              subprocesses.
+            - Values that cannot be determined are null, as are unlimited
+              limits.
+          type: dict
+          returned: when subset includes 'resources'
+          version_added: '1.1.0'
+          contains:
+            cpu:
+              type: dict
+              description: CPU counts.
+              contains:
+                count:
+                  type: int
+                  description: Online CPUs.
+                available:
+                  type: int
+                  description: CPUs in this process's affinity mask.
+                quota:
+                  type: float
+                  description: cgroup CPU quota expressed in CPUs.
+                effective:
+                  type: int
+                  description: Available CPUs capped by the quota.
+            load:
+              type: dict
+              description: Load averages keyed by C(1), C(5) and C(15)
+                minutes.
+            memory:
+              type: dict
+              description: C(total_bytes) and C(available_bytes) from
+                C(/proc/meminfo).
+            swap:
+              type: dict
+              description: C(total_bytes) and C(free_bytes) from
+                C(/proc/meminfo).
+            cgroup:
+              type: dict
+              description: cgroup C(version), C(cpu_quota),
+                C(memory_limit_bytes), C(memory_usage_bytes) and
+                C(pids_limit).
+            limits:
+              type: dict
+              description: C(soft) and C(hard) values of C(nofile)
+                (RLIMIT_NOFILE) and C(nproc) (RLIMIT_NPROC).
+        advisor:
+          description:
+            - Performance review of the effective C(forks), C(pipelining),
+              C(strategy), C(gathering), C(fact_caching), C(ssh_args) and
+              C(internal_poll_interval) settings against the controller
+              resources and the inventory size.
+            - C(forks) is the play's, and the other settings are resolved
+              by Ansible's config manager as they are for the play.
+          type: dict
+          returned: when subset includes 'advisor'
+          version_added: '1.1.0'
+          contains:
+            hosts:
+              type: int
+              description: Number of hosts in the inventory.
+            settings:
+              type: dict
+              description: Resolved values of the settings reviewed.
+            forks:
+              type: dict
+              description: Fork sizing.
+              contains:
+                ceilings:
+                  type: dict
+                  description:
+                    - Maximum forks allowed by each of C(hosts), C(cpu),
+                      C(nofile), C(nproc) and C(memory), where known.
+                    - Per-fork costs are estimates of 4 file descriptors,
+                      3 processes and 64 MiB, and 10 forks per CPU.
+                recommended:
+                  type: int
+                  description: Lowest of the ceilings.
+            recommendations:
+              type: list
+              elements: dict
+              description: Suggested changes, most relevant first.
+              contains:
+                setting:
+                  type: str
+                  description: Setting name.
+                value:
+                  type: raw
+                  description: Current value.
+                recommended:
+                  type: raw
+                  description: Suggested value.
+                severity:
+                  type: str
+                  description: C(warning) or C(info).
+                rationale:
+                  type: str
+                  description: Explanation computed from the inputs.
+        process:
+          description:
+            - Resource usage of the Ansible process tree, read from
+              C(/proc).
+            - The root is the C(ansible-playbook) (or C(ansible),
+              C(ansible-console) or C(ansible-pull)) process that
+              forked the worker running the task. Without one, it is
+              the worker itself.
+            - A main process with a C(cpu_rate) close to 1 is CPU-bound,
+              while an C(rss_bytes) that grows with the inventory points
+              at memory spent on copies of host variables in the
+              workers.
+          type: dict
+          returned: when subset includes 'process'
+          version_added: '1.1.0'
+          contains:
+            root_found:
+              type: bool
+              description: Whether an Ansible command process was found.
+            sample_window:
+              type: float
+              description: Seconds between the two readings, or
+                V(null) without O(process_sample).
+            processes:
+              type: list
+              elements: dict
+              description:
+                - The root and all of its descendants, parents first.
+                - Each has its C(pid), C(ppid), command C(name), C(role)
+                  (C(parent), C(worker) for the root's direct children,
+                  or C(child)), C(rss_bytes), C(cpu_seconds) of user and
+                  system time, open C(fds) (V(null) if unreadable) and
+                  C(threads).
+                - With O(process_sample), C(cpu_rate) in CPUs and
+                  C(rss_rate) in bytes per second are added, or V(null)
+                  for processes that started during the window.
+            totals:
+              type: dict
+              description: C(count) of processes and of C(workers), and
+                the sum of C(rss_bytes), C(cpu_seconds), C(fds) and
+                C(threads), plus C(cpu_rate) and C(rss_rate) with
+                O(process_sample).
+        ssh:
+          description:
+            - SSH ControlMaster sockets in the control path directory.
+            - Each socket is probed with a connection attempt. Sockets
+              that refuse it are stale.
+          type: dict
+          returned: when subset includes 'ssh'
+          version_added: '1.1.0'
+          contains:
+            control_path_dir:
+              type: str
+              description: Directory scanned, from
+                C(ansible_control_path_dir) or the C(control_path_dir)
+                option of the ssh connection plugin.
+            exists:
+              type: bool
+              description: Whether the directory could be read.
+            sockets:
+              type: dict
+              description: Counts of C(live), C(stale) and C(unknown)
+                sockets.
+            age:
+              type: dict
+              description: C(min), C(max) and C(mean) age in seconds of
+                the live sockets, or V(null) when there are none.
+            pruned:
+              type: int
+              description: Number of stale sockets removed.
+        fact_cache:
+          description:
+            - Fact cache plugin settings and, for the C(jsonfile), C(yaml)
+              and C(pickle) plugins, statistics of the cache directory.
+            - C(forks) is the play's, and the other settings are resolved
+              by Ansible's config manager as they are for the play.
+          type: dict
+          returned: when subset includes 'fact_cache'
+          version_added: '1.1.0'
+          contains:
+            plugin:
+              type: str
+              description: Value of C(fact_caching).
+            connection:
+              type: str
+              description: Value of C(fact_caching_connection).
+            timeout:
+              type: int
+              description: Value of C(fact_caching_timeout) in seconds.
+            file_backed:
+              type: bool
+              description: Whether the plugin stores one file per host.
+            prefix:
+              type: str
+              description: Value of C(fact_caching_prefix). Only the
+                files named with it are counted as entries.
+              returned: when file_backed and connection is set
+            path:
+              type: str
+              description: Expanded cache directory.
+              returned: when file_backed and connection is set
+            exists:
+              type: bool
+              description: Whether the cache directory could be read.
+              returned: when file_backed and connection is set
+            entries:
+              type: int
+              description: Number of cache files.
+              returned: when file_backed and connection is set
+            bytes:
+              type: int
+              description: Total size of the cache files.
+              returned: when file_backed and connection is set
+            sizes:
+              type: dict
+              description: Number of files per size bucket, keyed by
+                the bucket's upper bound in bytes (a power of two).
+              returned: when file_backed and connection is set
+            expired:
+              type: int
+              description: Number of files older than the timeout.
+              returned: when file_backed and connection is set
+            pruned:
+              type: int
+              description: Number of expired files removed.
+              returned: when file_backed and connection is set
+        storage:
+          description:
+            - Free space on the filesystems holding the Ansible home and
+              temporary directories, and the Ansible temporary
+              directories left behind by processes that have exited.
+            - C(ansible-local-*) and C(ansible-tmp-*) directories are
+              live while the process whose PID is in their name runs,
+              and stale once it has exited and they have not been
+              modified for a day, which leaves time for async jobs
+              still using them.
+          type: dict
+          returned: when subset includes 'storage'
+          version_added: '1.1.0'
+          contains:
+            home:
+              type: dict
+              description: C(path) of the Ansible home directory, from
+                C(ANSIBLE_HOME), the config or C(~/.ansible), and its
+                C(filesystem).
+            tmp:
+              type: list
+              elements: dict
+              description:
+                - One entry per temporary directory, with the C(path),
+                  the C(settings) naming it (C(local_tmp), C(remote_tmp)
+                  or both) and whether it C(exists).
+                - C(filesystem) holds C(free_bytes), C(total_bytes),
+                  C(free_inodes) and C(total_inodes), or V(null) when
+                  the directory cannot be read.
+                - C(temp_dirs) counts C(live), C(stale) and C(unknown)
+                  directories, and C(stale_bytes) and C(stale_inodes)
+                  sum the disk usage of the stale ones.
+            pruned:
+              type: int
+              description: Number of stale directories removed.
+        inventory:
+          description:
+            - Inventory size and an estimate of the memory held by host
+              variables.
+            - Variables of an evenly spaced sample of at most 200 hosts
+              are measured without templating, and totals are
+              extrapolated to every host.
+            - Objects shared between hosts are counted for each host,
+              so estimates are upper bounds.
+          type: dict
+          returned: when subset includes 'inventory'
+          version_added: '1.1.0'
+          contains:
+            hosts:
+              type: int
+              description: Number of hosts in the inventory.
+            groups:
+              type: int
+              description: Number of groups, including C(all) and
+                C(ungrouped).
+            sampled_hosts:
+              type: int
+              description: Number of hosts whose variables were measured.
+            bytes:
+              type: dict
+              description: C(mean_per_host) and C(estimated_total) size
+                of host variables in bytes.
+            top_groups:
+              type: list
+              elements: dict
+              description: The 10 groups with the largest
+                C(estimated_bytes), with their C(name), number of
+                C(hosts) and number of C(sampled) hosts.
+            top_variables:
+              type: list
+              elements: dict
+              description: The 10 variables with the largest
+                C(estimated_bytes), with their C(name), the number of
+                sampled C(hosts) defining them and their C(mean_bytes).
+            truncated:
+              type: bool
+              description: Whether a variable was too large to measure
+                completely.
+        collections:
+          description:
+            - Collections installed in the C(ansible_collections)
+              directory of each C(collections_path) entry and, when
+              C(collections_scan_sys_path) is enabled, each C(sys.path)
+              entry, in the order Ansible searches them.
+            - Versions are read from C(MANIFEST.json), or C(galaxy.yml)
+              for source checkouts, and only re-read when the file's
+              mtime changes.
+          type: dict
+          returned: when subset includes 'collections'
+          version_added: '1.1.0'
+          contains:
+            paths:
+              type: list
+              elements: str
+              description: C(ansible_collections) directories scanned.
+            count:
+              type: int
+              description: Number of distinct collections.
+            shadowed:
+              type: int
+              description: Number of installs hidden by an earlier one.
+            collections:
+              type: list
+              elements: dict
+              description: Installed collections in search order.
+              contains:
+                namespace:
+                  type: str
+                  description: Collection namespace.
+                name:
+                  type: str
+                  description: Collection name.
+                version:
+                  type: str
+                  description: Collection version, or V(null) if
+                    unknown.
+                path:
+                  type: str
+                  description: Collection directory.
+                shadowed_by:
+                  type: str
+                  description: Path of the install Ansible loads
+                    instead, or V(null) if this one is used.
+        run_stats:
+          description:
+            - Durations of the tasks of the current playbook run, as
+              aggregated by the P(o0_o.controller.timing#callback)
+              callback, which must be enabled.
+            - Covers the results received before the current task
+              started. Durations are in seconds and quantiles are
+              estimated from log-scaled histograms, within 5%.
+          type: dict
+          returned: when subset includes 'run_stats'
+          version_added: '1.1.0'
+          contains:
+            enabled:
+              type: bool
+              description: Whether the timing callback is enabled. The
+                other keys are only returned when it is.
+            started:
+              type: float
+              description: Epoch time the run started.
+            elapsed:
+              type: float
+              description: Seconds since the run started.
+            overall:
+              type: dict
+              description: C(count), C(total), C(p50), C(p95), C(p99)
+                and C(max) of the duration of every task on every host.
+            modules:
+              type: dict
+              description: The same summary for each module or action,
+                keyed by its name.
+            slowest_tasks:
+              type: list
+              elements: dict
+              description: The 10 tasks with the highest C(p95), with
+                their C(name), C(action) and duration summary over the
+                hosts they ran on.
+            slowest_hosts:
+              type: list
+              elements: dict
+              description: The 10 hosts with the highest C(total)
+                duration, with their C(name), the C(count) of task
+                results, the C(max) duration and the number of
+                C(failed) or unreachable results.
+        _meta:
+          description: Collection instrumentation.
+          type: dict
+          returned: when O(meta=true)
+          version_added: '1.1.0'
+          contains:
+            wall:
+              type: float
+              description: Total collection wall time in seconds.
+            parallel:
+              type: bool
+              description: Whether collectors ran concurrently.
+            collectors:
+              type: dict
+              description:
+                - Per-subset timings keyed by subset name.
+                - A subset abandoned by O(collector_timeout) or
+                  O(gather_timeout) has C(timed_out=true), with the
+                  timings recorded by then. One that never started only
+                  has C(timed_out).
+              contains:
+                wall:
+                  type: float
+                  description: Wall time in seconds.
+                cpu:
+                  type: float
+                  description: CPU time of the collecting thread in
+                    seconds.
+                cacheable:
+                  type: bool
+                  description: Whether the subset result can be stored
+                    in the cache, when O(cache) is enabled.
+                cached:
+                  type: bool
+                  description: Whether the result came from the cache.
+                subprocesses:
+                  type: dict
+                  description: Subprocesses spawned by the collector.
+                  contains:
+                    count:
+                      type: int
+                      description: Number of subprocesses.
+                    durations:
+                      type: list
+                      elements: float
+                      description: Wall time of each subprocess in
+                        seconds.
+                timed_out:
+                  type: bool
+                  description: Whether the collector was abandoned.
+                  returned: when the collector was abandoned
 """
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.o0_o.controller.plugins.module_utils.subsets import (
+    GATHER_SUBSET_CHOICES,
+    PROFILES,
+)
 
 
 def main():
@@ -157,21 +1137,45 @@ def main():
             "type": "list",
             "elements": "str",
             "default": ["all"],
-            "choices": [
-                "all",
-                "user",
-                "config",
-                "python",
-                "!all",
-                "!user",
-                "!config",
-                "!python",
-            ],
-        }
+            "choices": GATHER_SUBSET_CHOICES,
+        },
+        "cache": {"type": "bool", "default": False},
+        "cache_ttl": {"type": "int", "default": 3600},
+        "cache_path": {"type": "path"},
+        "parallel": {"type": "bool", "default": False},
+        "max_workers": {"type": "int", "default": 4},
+        "collector_timeout": {"type": "float"},
+        "single_flight": {"type": "bool", "default": False},
+        "meta": {"type": "bool", "default": False},
+        "prune": {
+            "type": "list",
+            "elements": "str",
+            "default": [],
+            "choices": ["ssh", "fact_cache", "storage"],
+        },
+        "snapshot_path": {"type": "path"},
+        "publish": {
+            "type": "str",
+            "default": "facts",
+            "choices": ["facts", "host_vars"],
+        },
+        "publish_host": {"type": "str"},
+        "filter": {"type": "list", "elements": "str", "default": []},
+        "gather_profile": {
+            "type": "str",
+            "default": "default",
+            "choices": list(PROFILES),
+        },
+        "gather_timeout": {"type": "float"},
+        "process_sample": {"type": "float", "default": 0.0},
+        "venv_roots": {"type": "list", "elements": "path"},
+        "export": {"type": "path"},
     }
 
     module = AnsibleModule(
-        argument_spec=argument_spec, supports_check_mode=True
+        argument_spec=argument_spec,
+        required_if=[("publish", "host_vars", ["publish_host"])],
+        supports_check_mode=True,
     )
 
     module.fail_json(msg="This module must be run via its action plugin.")
@@ -0,0 +1,41 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""
+Controller fact collectors.
+
+Each subset listed in the COLLECTORS registry is collected by a class in
+the module of the same name in this package. Importing the package does
+not import any collector; use load_collector() for that.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+from ansible_collections.o0_o.controller.plugins.module_utils.subsets import (
+    COLLECTORS,
+)
+
+
+def load_collector(subset: str) -> type:
+    """
+    Import the module of a collector and return its class.
+
+    :param str subset: Collector subset name
+    :returns type: CommonCollector subclass providing the subset's
+        collector method
+    :raises KeyError: If the subset is not registered
+    """
+    class_name = COLLECTORS[subset][0]
+    module = importlib.import_module(f"{__name__}.{subset}")
+
+    return getattr(module, class_name)
@@ -0,0 +1,305 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for performance recommendations."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, Optional
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.resources import (
+    ResourcesCollector,
+)
+
+
+class AdvisorCollector(ResourcesCollector):
+    """
+    Collect the advisor subset from the settings and resources.
+
+    The fork ceilings use the per-fork estimates in the ADVISOR_*
+    attributes.
+    """
+
+    # Per-fork estimates used by the advisor: file descriptors held by
+    # the main process, processes (worker, ssh client and master) and
+    # resident memory, plus descriptors reserved for everything else
+    ADVISOR_FDS_PER_FORK = 4
+    ADVISOR_FDS_RESERVED = 64
+    ADVISOR_PROCS_PER_FORK = 3
+    ADVISOR_MEMORY_PER_FORK = 64 * 1024 * 1024
+    ADVISOR_FORKS_PER_CPU = 10
+
+    # Settings the advice is based on, reported alongside it
+    ADVISOR_SETTINGS = (
+        "forks",
+        "pipelining",
+        "strategy",
+        "gathering",
+        "fact_caching",
+        "ssh_args",
+        "internal_poll_interval",
+    )
+
+    def advisor(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate performance-relevant settings against the controller.
+
+        Resolves forks, pipelining, strategy, gathering, fact_caching,
+        ssh_args and internal_poll_interval (ADVISOR_SETTINGS) and
+        checks them against the CPU, memory, process and file descriptor
+        limits from resources() and the inventory size from
+        task_vars['groups']. The fork ceilings use the per-fork
+        estimates in the ADVISOR_* class attributes.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Resolved settings, inventory size, fork
+            ceilings and a list of recommendations, each with setting,
+            value, recommended, severity and rationale keys
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller performance advice...")
+
+        settings = {
+            name: self._config_value(name, task_vars)
+            for name in self.ADVISOR_SETTINGS
+        }
+        res = self.resources(task_vars=task_vars)
+        hosts = len((task_vars.get("groups") or {}).get("all") or [])
+        forks = settings["forks"]
+
+        ceilings = {"hosts": hosts or None}
+        cpus = res["cpu"]["effective"]
+        if cpus:
+            ceilings["cpu"] = cpus * self.ADVISOR_FORKS_PER_CPU
+
+        nofile = res["limits"]["nofile"]["soft"]
+        if nofile:
+            ceilings["nofile"] = max(
+                1,
+                (nofile - self.ADVISOR_FDS_RESERVED)
+                // self.ADVISOR_FDS_PER_FORK,
+            )
+
+        nproc = [
+            n
+            for n in (
+                res["limits"]["nproc"]["soft"],
+                res["cgroup"]["pids_limit"],
+            )
+            if n
+        ]
+        if nproc:
+            ceilings["nproc"] = max(
+                1, min(nproc) // self.ADVISOR_PROCS_PER_FORK
+            )
+
+        memory = res["memory"]["available_bytes"]
+        limit = res["cgroup"]["memory_limit_bytes"]
+        if limit is not None:
+            headroom = limit - (res["cgroup"]["memory_usage_bytes"] or 0)
+            memory = headroom if memory is None else min(memory, headroom)
+        if memory is not None:
+            ceilings["memory"] = max(1, memory // self.ADVISOR_MEMORY_PER_FORK)
+
+        bounded = [v for v in ceilings.values() if v]
+        recommended_forks = min(bounded) if bounded else None
+
+        recommendations = []
+
+        def recommend(setting, recommended, severity, rationale):
+            recommendations.append(
+                {
+                    "setting": setting,
+                    "value": settings[setting],
+                    "recommended": recommended,
+                    "severity": severity,
+                    "rationale": rationale,
+                }
+            )
+
+        resource_ceilings = {
+            "cpu": (
+                f"{cpus} effective CPUs at "
+                f"{self.ADVISOR_FORKS_PER_CPU} forks per CPU"
+            ),
+            "nofile": (
+                f"RLIMIT_NOFILE headroom for ssh multiplexing "
+                f"(soft limit {nofile}, {self.ADVISOR_FDS_PER_FORK} "
+                f"descriptors per fork, {self.ADVISOR_FDS_RESERVED} "
+                "reserved)"
+            ),
+            "nproc": (
+                f"the process limit {min(nproc) if nproc else None} at "
+                f"{self.ADVISOR_PROCS_PER_FORK} processes per fork"
+            ),
+            "memory": (
+                f"{memory} bytes of available memory at "
+                f"{self.ADVISOR_MEMORY_PER_FORK} bytes per fork"
+            ),
+        }
+        exceeded = [
+            name
+            for name in resource_ceilings
+            if ceilings.get(name) and forks > ceilings[name]
+        ]
+        for name in exceeded:
+            recommend(
+                "forks",
+                recommended_forks,
+                "warning",
+                f"forks={forks} exceeds {resource_ceilings[name]}, which "
+                f"allows at most {ceilings[name]}",
+            )
+        if not exceeded and hosts and forks > hosts:
+            recommend(
+                "forks",
+                hosts,
+                "info",
+                f"forks={forks} exceeds the {hosts} inventory hosts; the "
+                "extra workers are never used",
+            )
+        elif (
+            not exceeded
+            and recommended_forks
+            and forks < recommended_forks
+            and hosts > forks
+        ):
+            recommend(
+                "forks",
+                recommended_forks,
+                "info",
+                f"forks={forks} runs {hosts} hosts in "
+                f"{math.ceil(hosts / forks)} batches per task; controller "
+                f"limits allow {recommended_forks} forks "
+                f"({math.ceil(hosts / recommended_forks)} batches)",
+            )
+
+        if not settings["pipelining"]:
+            recommend(
+                "pipelining",
+                True,
+                "warning",
+                "pipelining=False copies every module to the host before "
+                "running it, costing extra SSH operations per task per "
+                "host",
+            )
+
+        if settings["strategy"] == "linear" and hosts > forks:
+            recommend(
+                "strategy",
+                "free",
+                "info",
+                f"strategy=linear waits for all {hosts} hosts at every "
+                f"task with only {forks} running at once; 'free' lets "
+                "fast hosts move ahead when tasks are independent",
+            )
+
+        if settings["gathering"] == "implicit":
+            recommend(
+                "gathering",
+                "smart",
+                "info",
+                "gathering=implicit gathers facts for every play even "
+                "when they are already known; 'smart' reuses them",
+            )
+        if settings["fact_caching"] == "memory" and (
+            settings["gathering"] == "smart" or hosts > forks
+        ):
+            recommend(
+                "fact_caching",
+                "jsonfile",
+                "info",
+                "fact_caching=memory discards facts after each run, so "
+                f"all {hosts} hosts are gathered again on the next run",
+            )
+
+        persist = self._control_persist(settings["ssh_args"])
+        if persist == 0:
+            recommend(
+                "ssh_args",
+                "-o ControlMaster=auto -o ControlPersist=60s",
+                "warning",
+                "ssh_args does not enable ControlPersist, so every task "
+                "opens a new SSH connection to every host",
+            )
+        elif persist and 0 < persist < 300 and hosts > forks:
+            recommend(
+                "ssh_args",
+                "-o ControlMaster=auto -o ControlPersist=300s",
+                "info",
+                f"ControlPersist={persist}s may expire while "
+                f"{math.ceil(hosts / forks)} batches of hosts run each "
+                "task, forcing reconnections",
+            )
+
+        interval = settings["internal_poll_interval"]
+        if interval < 0.001:
+            recommend(
+                "internal_poll_interval",
+                0.001,
+                "warning",
+                f"internal_poll_interval={interval} busy-polls worker "
+                "results and burns controller CPU",
+            )
+        elif interval > 0.1:
+            recommend(
+                "internal_poll_interval",
+                0.001,
+                "info",
+                f"internal_poll_interval={interval} adds up to "
+                f"{interval}s of latency to every task result",
+            )
+
+        return {
+            "hosts": hosts,
+            "settings": settings,
+            "forks": {
+                "ceilings": ceilings,
+                "recommended": recommended_forks,
+            },
+            "recommendations": recommendations,
+        }
+
+    @staticmethod
+    def _control_persist(ssh_args: str) -> Optional[int]:
+        """
+        Return the ControlPersist time enabled by ssh arguments.
+
+        :param str ssh_args: ssh_args setting
+        :returns Optional[int]: Seconds (-1 for indefinitely), 0 when
+            multiplexing is disabled, or None if the time is not
+            understood
+        """
+        options = {}
+        for match in re.finditer(r"-o\s*(\w+)\s*=?\s*(\S+)", ssh_args or ""):
+            options[match.group(1).lower()] = match.group(2).lower()
+
+        if options.get("controlmaster", "no") == "no":
+            return 0
+
+        persist = options.get("controlpersist", "no")
+        if persist == "no":
+            return 0
+        if persist == "yes":
+            return -1
+
+        units = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+        parts = re.findall(r"(\d+)([smhdw]?)", persist)
+        if not parts:
+            return None
+
+        # A time of 0 keeps the master open indefinitely, like 'yes'
+        return sum(int(n) * units[u] for n, u in parts) or -1
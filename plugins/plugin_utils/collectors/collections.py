@@ -0,0 +1,203 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the installed Ansible collections."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class CollectionsCollector(CommonCollector):
+    """
+    Collect the collections subset from the collections path.
+
+    Collection versions are kept in _collection_index, which is
+    persisted under the action's _cache_dir when the fact cache is
+    enabled.
+    """
+
+    # Collection versions shared by every instance in a worker process,
+    # keyed by metadata file and invalidated by its mtime
+    _collection_index: Dict[str, Dict[str, Any]] = {}
+
+    def collections(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the collections installed on the collections path.
+
+        Roots are taken from collections_path, as resolved by Ansible's
+        config manager, followed by sys.path when
+        collections_scan_sys_path is enabled, in the order Ansible
+        searches them. Namespace directories are scanned concurrently
+        and versions are read from MANIFEST.json, or galaxy.yml for
+        source checkouts, at most once per file mtime (see
+        _collection_version). A collection found again in a later root
+        is flagged as shadowed, since Ansible loads the first one.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Scanned roots, collection count,
+            shadowed count and the collections in search order
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller collections info...")
+
+        roots = []
+        paths = list(self._config_value("collections_path", task_vars))
+        if self._config_value("collections_scan_sys_path", task_vars):
+            paths.extend(sys.path)
+        for path in paths:
+            if not path:
+                continue
+            root = os.path.realpath(os.path.expanduser(path))
+            if os.path.basename(root) != "ansible_collections":
+                root = os.path.join(root, "ansible_collections")
+            if root not in roots and os.path.isdir(root):
+                roots.append(root)
+
+        namespaces = []
+        for root in roots:
+            try:
+                with os.scandir(root) as entries:
+                    namespaces.extend(
+                        sorted(e.path for e in entries if e.is_dir())
+                    )
+            except OSError:
+                continue
+
+        index = self._collection_index
+        index_path = None
+        if self._cache_dir:
+            index_path = os.path.join(self._cache_dir, "collection-index.json")
+            if not index:
+                try:
+                    with open(index_path, encoding="utf-8") as f:
+                        index.update(json.load(f))
+                except (OSError, ValueError):
+                    pass
+        before = dict(index)
+
+        with ThreadPoolExecutor(
+            max_workers=self.DEFAULT_MAX_WORKERS
+        ) as executor:
+            scanned = list(executor.map(self._read_namespace, namespaces))
+
+        seen = {}
+        collections = []
+        for found in scanned:
+            for c in found:
+                fqcn = f"{c['namespace']}.{c['name']}"
+                c["shadowed_by"] = seen.get(fqcn)
+                seen.setdefault(fqcn, c["path"])
+                collections.append(c)
+
+        if index_path and index != before:
+            try:
+                self._write_json(index_path, index)
+            except (OSError, TypeError, ValueError) as e:
+                self._display.vv(f"Unable to write collection index: {e}")
+
+        return {
+            "paths": roots,
+            "count": len(seen),
+            "shadowed": sum(1 for c in collections if c["shadowed_by"]),
+            "collections": collections,
+        }
+
+    def _read_namespace(self, namespace_dir: str) -> List[Dict[str, Any]]:
+        """
+        Return the collections in a single namespace directory.
+
+        :param str namespace_dir: ansible_collections/<namespace>
+            directory
+        :returns List[Dict[str, Any]]: Collections with namespace, name,
+            version and path keys, sorted by name
+        """
+        namespace = os.path.basename(namespace_dir)
+        collections = []
+
+        try:
+            with os.scandir(namespace_dir) as entries:
+                paths = sorted(e.path for e in entries if e.is_dir())
+        except OSError:
+            return collections
+
+        for path in paths:
+            collections.append(
+                {
+                    "namespace": namespace,
+                    "name": os.path.basename(path),
+                    "version": self._collection_version(path),
+                    "path": path,
+                }
+            )
+
+        return collections
+
+    def _collection_version(self, path: str) -> Optional[str]:
+        """
+        Return the version of an installed collection.
+
+        The version is parsed from MANIFEST.json, or from galaxy.yml when
+        there is no manifest, and memoized in the collection index by
+        the metadata file's path and mtime. The index lives in memory
+        for the life of the worker process and, when the fact cache is
+        enabled, is also persisted next to the cache entries.
+
+        :param str path: Collection directory
+        :returns Optional[str]: Collection version, or None if it has no
+            readable metadata
+        """
+        for name in ("MANIFEST.json", "galaxy.yml"):
+            meta = os.path.join(path, name)
+            try:
+                mtime = os.stat(meta).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = self._collection_index.get(meta)
+            if entry and entry.get("mtime_ns") == mtime:
+                return entry["version"]
+
+            self._display.vvv(f"Reading collection metadata: {meta}")
+            version = None
+            try:
+                with open(meta, encoding="utf-8", errors="replace") as f:
+                    if name == "MANIFEST.json":
+                        info = json.load(f).get("collection_info") or {}
+                        version = info.get("version")
+                    else:
+                        for line in f:
+                            match = re.match(r"version:\s*(\S+)", line)
+                            if match:
+                                version = match.group(1).strip("'\"")
+                                break
+            except (OSError, ValueError, AttributeError):
+                pass
+
+            self._collection_index[meta] = {
+                "mtime_ns": mtime,
+                "version": version,
+            }
+            return version
+
+        return None
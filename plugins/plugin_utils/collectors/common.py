@@ -0,0 +1,157 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Base class of the controller fact collectors."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from ansible import constants as C
+from ansible.plugins.loader import (
+    cache_loader,
+    connection_loader,
+    shell_loader,
+)
+
+
+class CommonCollector:
+    """
+    Base of the collector classes, and the settings they interpret.
+
+    The facts action plugin creates one collector per subset it runs
+    (see ActionModule._collector). The options of the current run, the
+    instrumentation record and the display are read from that action.
+    Settings are read through Ansible's own config manager, so they
+    resolve exactly as they do for the play that runs the action.
+    """
+
+    # Ansible settings used to interpret the controller environment: a
+    # base config name, or (plugin type, plugin name, option) for the
+    # options of a plugin
+    SETTINGS: Dict[str, Union[str, Tuple[str, str, str]]] = {
+        "forks": "DEFAULT_FORKS",
+        "pipelining": ("connection", "ssh", "pipelining"),
+        "strategy": "DEFAULT_STRATEGY",
+        "gathering": "DEFAULT_GATHERING",
+        "fact_caching": "CACHE_PLUGIN",
+        "fact_caching_connection": "CACHE_PLUGIN_CONNECTION",
+        "fact_caching_timeout": "CACHE_PLUGIN_TIMEOUT",
+        "ssh_args": ("connection", "ssh", "ssh_args"),
+        "internal_poll_interval": "DEFAULT_INTERNAL_POLL_INTERVAL",
+        "control_path_dir": ("connection", "ssh", "control_path_dir"),
+        "home": "ANSIBLE_HOME",
+        "remote_tmp": ("shell", "sh", "remote_tmp"),
+        "collections_path": "COLLECTIONS_PATHS",
+        "collections_scan_sys_path": "COLLECTIONS_SCAN_SYS_PATH",
+    }
+
+    PLUGIN_LOADERS = {
+        "cache": cache_loader,
+        "connection": connection_loader,
+        "shell": shell_loader,
+    }
+
+    def __init__(self, action: Any) -> None:
+        """
+        Bind the collector to the facts action that runs it.
+
+        :param Any action: facts ActionModule instance
+        """
+        self._action = action
+
+    @property
+    def _display(self) -> Any:
+        """Display of the action."""
+        return self._action._display
+
+    @property
+    def _task(self) -> Any:
+        """Task running the action."""
+        return self._action._task
+
+    @property
+    def _local(self) -> Any:
+        """Thread-local timing record of the collector being run."""
+        return self._action._local
+
+    @property
+    def _cache_dir(self) -> Optional[str]:
+        """Fact cache directory of this run, or None without cache."""
+        return self._action._cache_dir
+
+    @property
+    def _index_dir(self) -> Optional[str]:
+        """Directory of the indexes kept across worker processes."""
+        return self._action._index_dir
+
+    @property
+    def _prune(self) -> FrozenSet[str]:
+        """Subsets allowed to remove the stale items they find."""
+        return self._action._prune
+
+    @property
+    def _process_sample(self) -> float:
+        """Seconds the process subset samples the process tree for."""
+        return self._action._process_sample
+
+    @property
+    def _venv_roots(self) -> Optional[List[str]]:
+        """Virtual environment directories, or None for the defaults."""
+        return self._action._venv_roots
+
+    @property
+    def DEFAULT_MAX_WORKERS(self) -> int:
+        """Threads a collector may use to scan directories."""
+        return self._action.DEFAULT_MAX_WORKERS
+
+    def _write_json(self, path: str, data: Any) -> None:
+        """
+        Atomically replace a file with the JSON encoding of data.
+
+        :param str path: Destination file path
+        :param Any data: JSON serializable data
+        """
+        self._action._write_json(path, data)
+
+    def _config_value(
+        self, name: str, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Resolve an Ansible setting listed in SETTINGS.
+
+        forks is taken from task_vars['ansible_forks'], which carries
+        the --forks option of the running play. Everything else comes
+        from Ansible's config manager (environment, then config file,
+        then default). Plugin options are resolved without host
+        variables, which describe the connection the action runs over
+        rather than the one the play uses for its hosts.
+
+        :param str name: Setting name
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Any: Resolved setting value
+        """
+        task_vars = task_vars or {}
+        if name == "forks" and task_vars.get("ansible_forks"):
+            return int(task_vars["ansible_forks"])
+
+        setting = self.SETTINGS[name]
+        if isinstance(setting, tuple):
+            plugin_type, plugin_name, option = setting
+            # A plugin's options are only defined once it has been loaded
+            self.PLUGIN_LOADERS[plugin_type].get(plugin_name, class_only=True)
+            return C.config.get_config_value(
+                option, plugin_type=plugin_type, plugin_name=plugin_name
+            )
+
+        # Defaults may be templated on other settings, as in constants
+        return C.config.get_config_value(setting, variables=vars(C))
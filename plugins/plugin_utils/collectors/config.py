@@ -0,0 +1,87 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the Ansible configuration file."""
+
+from __future__ import annotations
+
+import configparser
+from typing import Any, Callable, Dict, Optional
+
+from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class ConfigCollector(CommonCollector):
+    """Collect the config subset from the Ansible configuration file."""
+
+    def config(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Read Ansible config file as specified in task_vars.
+
+        Parses the Ansible configuration file and extracts all sections
+        and their settings for controller introspection.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Configuration dictionary with path and
+            settings information
+        :raises AnsibleActionFail: If ansible_config_file is missing
+            from task_vars
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller Ansible config info...")
+
+        path = task_vars.get("ansible_config_file")
+        if not path:
+            raise AnsibleActionFail(
+                "'ansible_config_file' is missing from task_vars"
+            )
+
+        settings = {}
+        cfg = configparser.ConfigParser()
+        cfg.read(path)
+
+        for section in cfg.sections():
+            settings[section] = dict(cfg.items(section))
+
+        return {"path": path, "settings": settings}
+
+    def _config_resolvers(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Callable[[], Any]]:
+        """
+        Return resolvers for the leaves of the config subset.
+
+        The config file is only parsed when its settings are resolved.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Callable[[], Any]]: Resolvers keyed by dotted
+            key path, in fact order
+        :raises AnsibleActionFail: If ansible_config_file is missing
+            from task_vars
+        """
+        task_vars = task_vars or {}
+        path = task_vars.get("ansible_config_file")
+        if not path:
+            raise AnsibleActionFail(
+                "'ansible_config_file' is missing from task_vars"
+            )
+
+        return {
+            "path": lambda: path,
+            "settings": lambda: self.config(task_vars)["settings"],
+        }
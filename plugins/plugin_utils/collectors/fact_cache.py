@@ -0,0 +1,162 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the health of the fact cache backend."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Dict, Optional
+
+from ansible import constants as C
+from ansible.errors import AnsibleError
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class FactCacheCollector(CommonCollector):
+    """
+    Collect the fact_cache subset from the fact cache settings.
+
+    Expired entries are only removed when fact_cache is in the
+    action's _prune set.
+    """
+
+    # Cache plugins that keep one file per host in fact_caching_connection
+    FILE_CACHE_PLUGINS = ("jsonfile", "yaml", "pickle")
+
+    def fact_cache(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the health of a file-backed fact cache.
+
+        Resolves the fact_caching plugin, its connection, timeout and
+        prefix with Ansible's config manager. For the file-backed plugins
+        the cache directory is streamed with scandir, so only one entry's
+        stat result is held at a time however many hosts are cached.
+        Entries are expired when their mtime is older than
+        fact_caching_timeout (0 never expires), matching the cache
+        plugins. As in their keys(), only the files named with the prefix
+        are host entries, and hidden files are ignored. When pruning is
+        enabled for this subset (and not in check mode) expired entries
+        are deleted during the same pass.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Cache plugin, connection and timeout,
+            and for file-backed plugins the prefix, entry count, total bytes,
+            size distribution, expired count and number pruned
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller fact cache info...")
+
+        plugin = self._config_value("fact_caching", task_vars)
+        connection = self._config_value("fact_caching_connection", task_vars)
+        timeout = self._config_value("fact_caching_timeout", task_vars)
+        file_backed = plugin.rsplit(".", 1)[-1] in self.FILE_CACHE_PLUGINS
+
+        facts = {
+            "plugin": plugin,
+            "connection": connection,
+            "timeout": timeout,
+            "file_backed": file_backed,
+        }
+        if not file_backed or not connection:
+            return facts
+
+        prefix = self._cache_prefix(plugin)
+        path = os.path.expanduser(os.path.expandvars(connection))
+        prune = "fact_cache" in self._prune and not self._task.check_mode
+        entries = 0
+        total = 0
+        sizes = {}
+        expired = 0
+        pruned = 0
+        cutoff = time.time() - timeout
+
+        try:
+            scan = os.scandir(path)
+        except OSError:
+            scan = None
+
+        if scan is not None:
+            with scan:
+                for entry in scan:
+                    name = entry.name
+                    if name.startswith(".") or not name.startswith(prefix):
+                        continue
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+                    entries += 1
+                    total += st.st_size
+                    bucket = 1 << max(0, st.st_size - 1).bit_length()
+                    sizes[bucket] = sizes.get(bucket, 0) + 1
+
+                    if timeout and st.st_mtime < cutoff:
+                        expired += 1
+                        if prune:
+                            try:
+                                os.unlink(entry.path)
+                                pruned += 1
+                            except OSError as e:
+                                self._display.vv(
+                                    f"Unable to prune {entry.path}: {e}"
+                                )
+
+        facts.update(
+            {
+                "prefix": prefix,
+                "path": path,
+                "exists": scan is not None,
+                "entries": entries,
+                "bytes": total,
+                "sizes": {str(b): sizes[b] for b in sorted(sizes)},
+                "expired": expired,
+                "pruned": pruned,
+            }
+        )
+
+        return facts
+
+    def _cache_prefix(self, plugin: str) -> str:
+        """
+        Return the file name prefix of a file-backed cache plugin.
+
+        fact_caching_prefix is an option of the cache plugin itself,
+        where it has no default (unlike the CACHE_PLUGIN_PREFIX setting
+        used by inventory caches), so it is resolved for the plugin.
+
+        :param str plugin: Name of the fact_caching plugin
+        :returns str: Prefix of the cache file names, empty if unset or
+            the plugin cannot be loaded
+        """
+        try:
+            cache = self.PLUGIN_LOADERS["cache"].get(plugin, class_only=True)
+        except AnsibleError as e:
+            self._display.vv(f"Unable to load cache plugin {plugin}: {e}")
+            return ""
+        if cache is None:
+            return ""
+
+        return (
+            C.config.get_config_value(
+                "_prefix", plugin_type="cache", plugin_name=cache._load_name
+            )
+            or ""
+        )
@@ -0,0 +1,350 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the Python interpreters available on the controller."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.python import (
+    PythonCollector,
+)
+
+
+class InterpretersCollector(PythonCollector):
+    """
+    Collect the interpreters subset by probing every Python found.
+
+    Probe results are kept in _survey_index, which is persisted under
+    the action's _index_dir whether or not the fact cache is enabled,
+    since every task runs in a new worker process. The venv roots are
+    taken from its _venv_roots, or INTERPRETERS_VENV_ROOTS when unset.
+    """
+
+    # Survey probe results for every interpreter found, shared by every
+    # instance in a worker process, keyed by path and invalidated by
+    # binary inode and mtime and by site-packages mtime
+    _survey_index: Dict[str, Dict[str, Any]] = {}
+
+    # Directories holding one virtual environment (or one pyenv version)
+    # per subdirectory
+    INTERPRETERS_VENV_ROOTS = (
+        "~/.virtualenvs",
+        "~/.venvs",
+        "~/.pyenv/versions",
+    )
+
+    # Executable names taken for Python interpreters
+    INTERPRETERS_NAMES = re.compile(r"^(python|pypy)(\d+(\.\d+)*)?$")
+
+    # Seconds an interpreter may take to answer the probe
+    INTERPRETERS_PROBE_TIMEOUT = 10
+
+    # Keys of the probe result
+    INTERPRETERS_FIELDS = (
+        "version",
+        "implementation",
+        "executable",
+        "prefix",
+        "venv",
+        "purelib",
+        "ansible_core",
+    )
+
+    # Source run by each interpreter as 'python -c'. It finds ansible
+    # without importing it and also runs on Python 2, so that old
+    # interpreters are reported rather than failing the probe.
+    INTERPRETERS_PROBE = """\
+import json
+import platform
+import sys
+import sysconfig
+
+try:
+    from importlib.util import find_spec
+except ImportError:
+    find_spec = None
+try:
+    from importlib.metadata import version
+except ImportError:
+    version = None
+
+ansible = False
+if find_spec is not None:
+    try:
+        ansible = find_spec("ansible") is not None
+    except (ImportError, ValueError):
+        pass
+core = None
+if ansible and version is not None:
+    try:
+        core = version("ansible-core")
+    except Exception:
+        pass
+
+base_prefix = getattr(sys, "base_prefix", sys.prefix)
+print(json.dumps({
+    "version": platform.python_version(),
+    "implementation": platform.python_implementation(),
+    "executable": sys.executable,
+    "prefix": sys.prefix,
+    "venv": sys.prefix != base_prefix,
+    "purelib": sysconfig.get_paths()["purelib"],
+    "ansible_core": {"importable": ansible, "version": core},
+}))
+"""
+
+    def interpreters(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the Python interpreters on PATH and in the venv roots.
+
+        Candidates are the python and pypy executables in every PATH
+        directory and in the bin directory of every environment under
+        the venv roots, plus ansible_playbook_python. Paths that run the
+        same binary with the same environment are reported once, with
+        the others as aliases. Interpreters are probed concurrently on a
+        bounded pool of subprocesses, each with INTERPRETERS_PROBE. A
+        result, or failure other than a timeout, is reused for as long
+        as the inode and mtime of the binary and the mtime of its
+        site-packages directory are unchanged, so only new or modified
+        interpreters are run again. The results are kept in the index
+        directory, so this holds across tasks and playbook runs.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Scanned venv roots, the interpreters in
+            discovery order with their probe results, the number probed
+            by this survey, and the fastest interpreter able to import
+            ansible-core
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller Python interpreters...")
+
+        roots = [
+            os.path.expanduser(root)
+            for root in (self._venv_roots or self.INTERPRETERS_VENV_ROOTS)
+        ]
+        candidates = self._interpreter_candidates(
+            task_vars.get("ansible_playbook_python"), roots
+        )
+
+        index = self._survey_index
+        index_path = None
+        if self._index_dir:
+            index_path = os.path.join(
+                self._index_dir, "interpreter-index.json"
+            )
+            if not index:
+                try:
+                    with open(index_path, encoding="utf-8") as f:
+                        index.update(json.load(f))
+                except (OSError, ValueError):
+                    pass
+
+        keys = {c["path"]: self._survey_key(c["path"]) for c in candidates}
+        stale = [
+            c["path"]
+            for c in candidates
+            if keys[c["path"]] is None
+            or (index.get(c["path"]) or {}).get("key") != keys[c["path"]]
+        ]
+
+        probed = {}
+        if stale:
+            with ThreadPoolExecutor(
+                max_workers=min(self.DEFAULT_MAX_WORKERS, len(stale))
+            ) as executor:
+                probed = dict(
+                    zip(stale, executor.map(self._survey_probe, stale))
+                )
+
+        # The pool threads have no timing record of their own
+        record = getattr(self._local, "record", None)
+        if record is not None:
+            record["subprocesses"]["count"] += len(probed)
+            record["subprocesses"]["durations"].extend(
+                info["probe_seconds"] for info in probed.values()
+            )
+
+        changed = False
+        interpreters = []
+        for c in candidates:
+            path = c["path"]
+            if path in probed:
+                info = probed[path]
+                if keys[path] is not None and not info["timed_out"]:
+                    # The site-packages mtime is only known once probed
+                    key = self._survey_key(path, info["purelib"])
+                    index[path] = {"key": key, "info": info}
+                    changed = True
+            else:
+                info = index[path]["info"]
+            interpreters.append(
+                {
+                    "path": path,
+                    "aliases": c["aliases"],
+                    **{
+                        k: v
+                        for k, v in info.items()
+                        if k not in ("purelib", "timed_out")
+                    },
+                }
+            )
+
+        if index_path and changed:
+            try:
+                self._write_json(index_path, index)
+            except (OSError, TypeError, ValueError) as e:
+                self._display.vv(f"Unable to write interpreter index: {e}")
+
+        usable = [
+            i
+            for i in interpreters
+            if (i.get("ansible_core") or {}).get("importable")
+        ]
+        fastest = min(usable, key=lambda i: i["probe_seconds"], default=None)
+
+        return {
+            "venv_roots": roots,
+            "count": len(interpreters),
+            "probed": len(probed),
+            "interpreters": interpreters,
+            "fastest_with_ansible": fastest["path"] if fastest else None,
+        }
+
+    def _interpreter_candidates(
+        self, playbook_python: Optional[str], roots: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the interpreter paths to probe, grouped by identity.
+
+        Two paths are the same interpreter when they have the same
+        _interpreter_identity().
+
+        :param Optional[str] playbook_python: ansible_playbook_python
+        :param List[str] roots: Expanded venv root directories
+        :returns List[Dict[str, Any]]: Candidates with the first path
+            found and the other paths to the same interpreter as aliases
+        """
+        bin_dirs = os.environ.get("PATH", "").split(os.pathsep)
+        for root in roots:
+            try:
+                with os.scandir(root) as entries:
+                    bin_dirs.extend(
+                        sorted(
+                            os.path.join(e.path, "bin")
+                            for e in entries
+                            if e.is_dir()
+                        )
+                    )
+            except OSError:
+                continue
+
+        paths = [playbook_python] if playbook_python else []
+        for bin_dir in bin_dirs:
+            if not bin_dir:
+                continue
+            try:
+                with os.scandir(bin_dir) as entries:
+                    names = sorted(
+                        e.name
+                        for e in entries
+                        if self.INTERPRETERS_NAMES.match(e.name)
+                    )
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(bin_dir, name)
+                if os.access(path, os.X_OK) and not os.path.isdir(path):
+                    paths.append(path)
+
+        candidates: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        for path in paths:
+            identity = self._interpreter_identity(path)
+            if identity not in candidates:
+                candidates[identity] = {"path": path, "aliases": []}
+            elif path != candidates[identity]["path"]:
+                if path not in candidates[identity]["aliases"]:
+                    candidates[identity]["aliases"].append(path)
+
+        return list(candidates.values())
+
+    def _survey_key(
+        self, path: str, purelib: Optional[str] = None
+    ) -> Optional[List[Any]]:
+        """
+        Return the values that a survey result for a path depends on.
+
+        :param str path: Interpreter path
+        :param Optional[str] purelib: Site-packages directory reported
+            by the probe, or None to take it from the stored result
+        :returns Optional[List[Any]]: Inode and mtime of the resolved
+            binary and the mtime of site-packages, or None if the binary
+            cannot be read
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        if purelib is None:
+            entry = self._survey_index.get(path) or {}
+            purelib = (entry.get("info") or {}).get("purelib")
+        try:
+            site = os.stat(purelib).st_mtime_ns if purelib else None
+        except OSError:
+            site = None
+
+        return [st.st_ino, st.st_mtime_ns, site]
+
+    def _survey_probe(self, path: str) -> Dict[str, Any]:
+        """
+        Run INTERPRETERS_PROBE with an interpreter.
+
+        :param str path: Interpreter path
+        :returns Dict[str, Any]: INTERPRETERS_FIELDS from the probe (None
+            when missing), the error message if the interpreter could not
+            be probed, whether the probe timed out, and the wall time of
+            the probe in probe_seconds
+        """
+        start = time.perf_counter()
+        data: Dict[str, Any] = {}
+        error = None
+        timed_out = False
+        try:
+            output = self._run_command(
+                [path, "-c", self.INTERPRETERS_PROBE],
+                timeout=self.INTERPRETERS_PROBE_TIMEOUT,
+            )
+            data = json.loads(output.stdout)
+            if not isinstance(data, dict):
+                raise ValueError(f"Unexpected probe output: {data!r}")
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            self._display.vv(f"Unable to probe {path}: {e}")
+            data = {}
+            error = str(e).strip() or type(e).__name__
+            timed_out = isinstance(e, subprocess.TimeoutExpired)
+
+        info = {k: data.get(k) for k in self.INTERPRETERS_FIELDS}
+        info["error"] = error
+        info["timed_out"] = timed_out
+        info["probe_seconds"] = round(time.perf_counter() - start, 3)
+
+        return info
@@ -0,0 +1,171 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the inventory size and hostvars memory footprint."""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Tuple
+
+from ansible import constants as C
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class InventoryCollector(CommonCollector):
+    """Collect the inventory subset from the groups and hostvars."""
+
+    # Hosts whose variables are measured by the inventory subset, objects
+    # visited per variable, and groups and variables reported
+    INVENTORY_SAMPLE = 200
+    INVENTORY_MAX_NODES = 100000
+    INVENTORY_TOP = 10
+
+    def inventory(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return inventory size and an estimate of its memory footprint.
+
+        Counts hosts and groups from task_vars['groups'] and measures
+        the variables of an evenly spaced sample of at most
+        INVENTORY_SAMPLE hosts, read without templating through
+        hostvars.raw_get() when available. Each variable is sized with
+        an iterative walk (see _deep_sizeof) so that deeply nested
+        values cannot exhaust the stack and no walk visits more than
+        INVENTORY_MAX_NODES objects. Group and variable totals are
+        extrapolated from the sample; objects shared between hosts are
+        counted once per host, so the estimates are upper bounds.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Host, group and sample counts, mean and
+            estimated total bytes, and the INVENTORY_TOP heaviest
+            groups and variables
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller inventory footprint...")
+
+        groups = task_vars.get("groups") or {}
+        hostvars = task_vars.get("hostvars") or {}
+        hosts = list(groups.get("all") or hostvars)
+        raw_get = getattr(hostvars, "raw_get", None)
+        skip = (C.INTERNAL_STATIC_VARS - {"ansible_facts"}) | {"omit"}
+
+        step = max(1, math.ceil(len(hosts) / self.INVENTORY_SAMPLE))
+        sizes = {}
+        variables = {}
+        truncated = False
+
+        for host in hosts[::step]:
+            try:
+                hvars = raw_get(host) if raw_get else hostvars[host]
+            except Exception as e:
+                self._display.vv(f"Unable to read hostvars for {host}: {e}")
+                continue
+            if not isinstance(hvars, Mapping):
+                continue
+
+            sizes[host] = 0
+            for name in hvars:
+                if name in skip:
+                    continue
+                size, complete = self._deep_sizeof(hvars[name])
+                truncated = truncated or not complete
+                sizes[host] += size
+                total, count = variables.get(name, (0, 0))
+                variables[name] = (total + size, count + 1)
+
+        sampled = len(sizes)
+        mean = sum(sizes.values()) / sampled if sampled else 0.0
+
+        top_groups = []
+        for name, members in groups.items():
+            members = members or []
+            measured = [sizes[h] for h in members if h in sizes]
+            per_host = sum(measured) / len(measured) if measured else mean
+            top_groups.append(
+                {
+                    "name": name,
+                    "hosts": len(members),
+                    "sampled": len(measured),
+                    "estimated_bytes": round(per_host * len(members)),
+                }
+            )
+        top_groups.sort(key=lambda g: (-g["estimated_bytes"], g["name"]))
+
+        top_variables = [
+            {
+                "name": name,
+                "hosts": count,
+                "mean_bytes": round(total / count),
+                "estimated_bytes": round(total / sampled * len(hosts)),
+            }
+            for name, (total, count) in variables.items()
+        ]
+        top_variables.sort(key=lambda v: (-v["estimated_bytes"], v["name"]))
+
+        return {
+            "hosts": len(hosts),
+            "groups": len(groups),
+            "sampled_hosts": sampled,
+            "bytes": {
+                "mean_per_host": round(mean),
+                "estimated_total": round(mean * len(hosts)),
+            },
+            "top_groups": top_groups[: self.INVENTORY_TOP],
+            "top_variables": top_variables[: self.INVENTORY_TOP],
+            "truncated": truncated,
+        }
+
+    def _deep_sizeof(self, obj: Any) -> Tuple[int, bool]:
+        """
+        Return the deep in-memory size of an object.
+
+        Walks mappings and collections with an explicit stack instead of
+        recursion, counting each object once and stopping after
+        INVENTORY_MAX_NODES objects.
+
+        :param Any obj: Object to measure
+        :returns Tuple[int, bool]: Size in bytes, and whether the walk
+            completed within the node budget
+        """
+        seen = set()
+        stack = [obj]
+        size = 0
+
+        while stack:
+            if len(seen) >= self.INVENTORY_MAX_NODES:
+                return size, False
+
+            item = stack.pop()
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+
+            try:
+                size += sys.getsizeof(item)
+            except TypeError:
+                continue
+
+            if isinstance(item, (str, bytes, bytearray)):
+                continue
+            if isinstance(item, Mapping):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple, set, frozenset)):
+                stack.extend(item)
+
+        return size, True
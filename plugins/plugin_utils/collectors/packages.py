@@ -0,0 +1,412 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the distributions installed for the playbook interpreter."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class PackagesCollector(CommonCollector):
+    """
+    Collect the packages subset from site-packages metadata.
+
+    Scanned directories are kept in _package_index, which is persisted
+    under the action's _cache_dir when the fact cache is enabled, and
+    probe results for other interpreters in _interpreter_index, which is
+    persisted under the action's _index_dir whether or not it is.
+    """
+
+    # Site-packages index shared by every instance in a worker process,
+    # keyed by directory and invalidated by directory mtime
+    _package_index: Dict[str, Dict[str, Any]] = {}
+
+    # Probe results for interpreters other than the running one, shared
+    # by every instance in a worker process, keyed by absolute path and
+    # invalidated by inode and mtime and by site-packages mtimes
+    _interpreter_index: Dict[str, Dict[str, Any]] = {}
+
+    # Source run by the interpreter being probed, as 'python -c', or in
+    # process when it is the interpreter running this plugin. It prints
+    # everything the python and packages subsets need from the
+    # interpreter as one JSON document.
+    PYTHON_PROBE = """\
+import json
+import os
+import platform
+import site
+import sys
+import sysconfig
+
+
+def probe():
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            pip = version("pip")
+        except PackageNotFoundError:
+            pip = None
+    except ImportError:
+        pip = None
+
+    base_prefix = getattr(sys, "base_prefix", sys.prefix)
+    site_dirs = site.getsitepackages()
+    if site.ENABLE_USER_SITE:
+        site_dirs.append(site.getusersitepackages())
+    return {
+        "version": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "executable": os.path.realpath(sys.executable),
+        "prefix": sys.prefix,
+        "base_prefix": base_prefix,
+        "venv": sys.prefix != base_prefix,
+        "paths": sysconfig.get_paths(),
+        "pip": pip,
+        "site_packages": [p for p in sys.path if p in site_dirs],
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(probe()))
+"""
+
+    def packages(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the distributions installed for the playbook interpreter.
+
+        Scans the site-packages directories on the sys.path of
+        ansible_playbook_python (see _site_packages) for ``*.dist-info``
+        and ``*.egg-info`` metadata directly rather than running
+        ``pip list``. Directories whose mtime is unchanged
+        since the last scan are served from the package index.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Site-packages paths, distribution count
+            and a name-sorted list of distributions
+        :raises AnsibleActionFail: If ansible_playbook_python is
+            missing from task_vars or cannot be probed
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller package info...")
+
+        path = task_vars.get("ansible_playbook_python")
+        if not path:
+            raise AnsibleActionFail(
+                "'ansible_playbook_python' is missing from task_vars"
+            )
+
+        site_dirs = self._site_packages(path)
+        distributions = sorted(
+            self._scan_site_packages(site_dirs),
+            key=lambda d: (self._normalize_name(d["name"]), d["path"]),
+        )
+
+        return {
+            "paths": site_dirs,
+            "count": len(distributions),
+            "distributions": distributions,
+        }
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """
+        Return a distribution name normalized as described in PEP 503.
+
+        :param str name: Distribution name
+        :returns str: Lowercase name with runs of '-', '_' and '.'
+            collapsed to '-'
+        """
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    def _site_packages(self, path: str) -> List[str]:
+        """
+        Return the site-packages directories of an interpreter.
+
+        The directories are the site directories on the sys.path of the
+        interpreter, as reported by PYTHON_PROBE, in import order. They
+        are resolved with realpath, as are the keys of _package_index,
+        so that a linked directory is indexed once.
+
+        :param str path: Interpreter path
+        :returns List[str]: Existing site-packages directories
+        :raises AnsibleActionFail: If the interpreter cannot be probed
+        """
+        site_dirs = []
+        for d in self._probe_python(path)["site_packages"]:
+            real = os.path.realpath(d)
+            if os.path.isdir(real) and real not in site_dirs:
+                site_dirs.append(real)
+
+        return site_dirs
+
+    def _probe_python(self, path: str) -> Dict[str, Any]:
+        """
+        Return the PYTHON_PROBE result for an interpreter.
+
+        A result is reused for as long as the inode and mtime of the
+        binary and the mtimes of its site-packages directories are
+        unchanged. The results are kept in the index directory, so a
+        fact cache hit can be validated without running the interpreter
+        again in every new worker process.
+
+        :param str path: Interpreter path
+        :returns Dict[str, Any]: Probe result
+        :raises AnsibleActionFail: If the interpreter cannot be run or
+            does not print a JSON document
+        """
+        if self._interpreter_identity(path) == self._interpreter_identity(
+            sys.executable
+        ):
+            namespace = {"__name__": "o0_controller_probe"}
+            exec(compile(self.PYTHON_PROBE, "<probe>", "exec"), namespace)
+            return namespace["probe"]()
+
+        index = self._interpreter_index
+        index_path = None
+        if self._index_dir:
+            index_path = os.path.join(self._index_dir, "probe-index.json")
+            if not index:
+                try:
+                    with open(index_path, encoding="utf-8") as f:
+                        index.update(json.load(f))
+                except (OSError, ValueError):
+                    pass
+
+        # A venv runs its base interpreter's binary, so the resolved path
+        # would be shared with the base and every other venv made from it
+        real = os.path.abspath(path)
+        entry = index.get(real)
+        if entry:
+            key = self._probe_key(real, entry["info"]["site_packages"])
+            if key and entry["key"] == key:
+                return entry["info"]
+
+        try:
+            output = self._run_command([path, "-c", self.PYTHON_PROBE])
+            info = json.loads(output.stdout)
+        except (OSError, subprocess.CalledProcessError, ValueError) as e:
+            raise AnsibleActionFail(f"Unable to probe {path}: {e}") from e
+
+        key = self._probe_key(real, info["site_packages"])
+        if key:
+            index[real] = {"key": key, "info": info}
+            if index_path:
+                try:
+                    self._write_json(index_path, index)
+                except (OSError, TypeError, ValueError) as e:
+                    self._display.vv(f"Unable to write probe index: {e}")
+
+        return info
+
+    @staticmethod
+    def _interpreter_identity(path: str) -> Tuple[str, Optional[str]]:
+        """
+        Return what tells an interpreter apart from the others.
+
+        Two paths are the same interpreter when they resolve to the same
+        binary and belong to the same virtual environment (a venv runs
+        its base interpreter's binary with its own pyvenv.cfg).
+
+        :param str path: Interpreter path
+        :returns Tuple[str, Optional[str]]: Resolved binary and the
+            directory of the venv holding the path, or None outside a
+            venv
+        """
+        env = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+        if not os.path.exists(os.path.join(env, "pyvenv.cfg")):
+            env = None
+
+        return os.path.realpath(path), env
+
+    @staticmethod
+    def _probe_key(path: str, site_dirs: List[str]) -> Optional[List[Any]]:
+        """
+        Return the stat data a probe result of an interpreter depends on.
+
+        :param str path: Interpreter path
+        :param List[str] site_dirs: Site-packages directories reported
+            by the probe
+        :returns Optional[List[Any]]: Inode and mtime of the binary and
+            the mtime of each site-packages directory (None when it is
+            missing), or None if the binary cannot be read
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key: List[Any] = [st.st_ino, st.st_mtime_ns]
+        for site_dir in site_dirs:
+            try:
+                key.append(os.stat(site_dir).st_mtime_ns)
+            except OSError:
+                key.append(None)
+
+        return key
+
+    def _run_command(
+        self, argv: List[str], timeout: Optional[float] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command for a collector and account for it in _meta.
+
+        The command's duration is added to the timing record of the
+        collector running on the current thread, if any.
+
+        :param List[str] argv: Command and arguments
+        :param Optional[float] timeout: Seconds after which the command
+            is killed, or None to wait
+        :returns subprocess.CompletedProcess: Completed process with
+            text stdout and stderr
+        :raises subprocess.CalledProcessError: If the command fails
+        :raises subprocess.TimeoutExpired: If the command times out
+        """
+        record = getattr(self._local, "record", None)
+        start = time.perf_counter()
+
+        try:
+            return subprocess.run(
+                argv,
+                capture_output=True,
+                encoding="utf-8",
+                check=True,
+                timeout=timeout,
+            )
+        finally:
+            if record is not None:
+                record["subprocesses"]["count"] += 1
+                record["subprocesses"]["durations"].append(
+                    round(time.perf_counter() - start, 6)
+                )
+
+    def _scan_site_packages(
+        self, site_dirs: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Return distributions found in site-packages directories.
+
+        Each directory is parsed at most once per mtime. The index lives
+        in memory for the life of the worker process and, when the fact
+        cache is enabled, is also persisted next to the cache entries so
+        later runs only re-parse directories that have changed.
+
+        :param List[str] site_dirs: Site-packages directories
+        :returns List[Dict[str, Any]]: Distributions with name, version
+            and path keys
+        """
+        index = self._package_index
+        index_path = None
+        if self._cache_dir:
+            index_path = os.path.join(self._cache_dir, "package-index.json")
+            if not index:
+                try:
+                    with open(index_path, encoding="utf-8") as f:
+                        index.update(json.load(f))
+                except (OSError, ValueError):
+                    pass
+
+        dirty = False
+        distributions = []
+        for site_dir in map(os.path.realpath, site_dirs):
+            try:
+                mtime = os.stat(site_dir).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = index.get(site_dir)
+            if not entry or entry.get("mtime_ns") != mtime:
+                self._display.vvv(f"Indexing site-packages: {site_dir}")
+                entry = {
+                    "mtime_ns": mtime,
+                    "distributions": self._read_distributions(site_dir),
+                }
+                index[site_dir] = entry
+                dirty = True
+
+            distributions.extend(entry["distributions"])
+
+        if dirty and index_path:
+            try:
+                self._write_json(index_path, index)
+            except (OSError, TypeError, ValueError) as e:
+                self._display.vv(f"Unable to write package index: {e}")
+
+        return distributions
+
+    @staticmethod
+    def _read_distributions(site_dir: str) -> List[Dict[str, Any]]:
+        """
+        Parse distribution metadata in a single site-packages directory.
+
+        Only the header block of each METADATA or PKG-INFO file is read.
+        If a metadata file is unreadable, the name and version are taken
+        from the directory name instead.
+
+        :param str site_dir: Site-packages directory
+        :returns List[Dict[str, Any]]: Distributions with name, version
+            and path keys
+        """
+        distributions = []
+
+        with os.scandir(site_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext == ".dist-info":
+                    meta = os.path.join(entry.path, "METADATA")
+                elif ext == ".egg-info":
+                    meta = entry.path
+                    if entry.is_dir():
+                        meta = os.path.join(entry.path, "PKG-INFO")
+                else:
+                    continue
+
+                headers = {}
+                try:
+                    with open(meta, encoding="utf-8", errors="replace") as f:
+                        for line in f:
+                            if not line.strip():
+                                break
+                            key, _, value = line.partition(":")
+                            if key in ("Name", "Version"):
+                                headers.setdefault(key, value.strip())
+                            if len(headers) == 2:
+                                break
+                except OSError:
+                    pass
+
+                name, _, version = stem.partition("-")
+                distributions.append(
+                    {
+                        "name": headers.get("Name") or name,
+                        "version": headers.get("Version")
+                        or version.split("-")[0]
+                        or None,
+                        "path": site_dir,
+                    }
+                )
+
+        return distributions
@@ -0,0 +1,248 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the Ansible controller process tree."""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.resources import (
+    ResourcesCollector,
+)
+
+
+class ProcessCollector(ResourcesCollector):
+    """
+    Collect the process subset from /proc.
+
+    The sampling window is taken from the action's _process_sample.
+    """
+
+    # Commands whose process is the root of the tree
+    PROCESS_ROOT_COMMANDS = re.compile(
+        r"^ansible(-playbook|-console|-pull)?$"
+    )
+
+    def process(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the resource usage of the Ansible process tree.
+
+        The root is the ansible-playbook (or ansible, ansible-console
+        or ansible-pull) process that forked this worker, found by
+        walking up the parent PIDs; without one, it is the process
+        running the plugin. Every descendant is listed: the fork workers
+        that are direct children of the root and their own children,
+        such as ssh clients. When _process_sample is positive, the tree
+        is read twice that many seconds apart to add CPU and memory
+        rates. Only /proc is read.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Whether an Ansible root process was
+            found, the sampling window, each process of the tree with
+            its role and usage, and totals over the tree
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller process info...")
+
+        root, found = self._process_root()
+        window = self._process_sample or None
+
+        before = None
+        if window:
+            before = self._process_tree(root)
+            start = time.monotonic()
+            time.sleep(window)
+            window = time.monotonic() - start
+        processes = self._process_tree(root)
+
+        totals: Dict[str, Any] = {
+            "count": len(processes),
+            "workers": sum(p["role"] == "worker" for p in processes),
+        }
+        for key in ("rss_bytes", "cpu_seconds", "fds", "threads"):
+            totals[key] = sum(p[key] or 0 for p in processes)
+        totals["cpu_seconds"] = round(totals["cpu_seconds"], 2)
+
+        if before is not None:
+            previous = {p["pid"]: p for p in before}
+            for key in ("cpu_rate", "rss_rate"):
+                totals[key] = 0.0
+            for p in processes:
+                old = previous.get(p["pid"])
+                if old is None:
+                    p["cpu_rate"] = p["rss_rate"] = None
+                    continue
+                cpu = (p["cpu_seconds"] - old["cpu_seconds"]) / window
+                rss = (p["rss_bytes"] - old["rss_bytes"]) / window
+                p["cpu_rate"] = round(cpu, 3)
+                p["rss_rate"] = round(rss)
+                totals["cpu_rate"] += cpu
+                totals["rss_rate"] += rss
+            totals["cpu_rate"] = round(totals["cpu_rate"], 3)
+            totals["rss_rate"] = round(totals["rss_rate"])
+
+        return {
+            "root_found": found,
+            "sample_window": round(window, 3) if window else None,
+            "processes": processes,
+            "totals": totals,
+        }
+
+    def _process_root(self) -> Tuple[int, bool]:
+        """
+        Return the Ansible command process that this process runs under.
+
+        Fork workers are not exec'd, so they share the command line of
+        the process that forked them: the root is the topmost process
+        of the unbroken chain of ancestors running an Ansible command.
+
+        :returns Tuple[int, bool]: Root PID, and whether it runs an
+            Ansible command
+        """
+        pid = os.getpid()
+        root, found = pid, False
+
+        while pid > 1:
+            if not self._is_ansible_command(pid):
+                break
+            root, found = pid, True
+            stat = self._process_stat(pid)
+            if stat is None:
+                break
+            pid = stat["ppid"]
+
+        return root, found
+
+    def _is_ansible_command(self, pid: int) -> bool:
+        """
+        Return whether a process runs an Ansible command-line tool.
+
+        :param int pid: Process ID
+        :returns bool: Whether the script or executable, the first or
+            second argument (after the interpreter), is an Ansible tool
+        """
+        path = os.path.join(self.PROC_ROOT, str(pid), "cmdline")
+        text = self._read_text(path)
+        if not text:
+            return False
+
+        return any(
+            self.PROCESS_ROOT_COMMANDS.match(os.path.basename(arg))
+            for arg in text.split("\0")[:2]
+        )
+
+    def _process_stat(self, pid: int) -> Optional[Dict[str, Any]]:
+        """
+        Parse /proc/<pid>/stat.
+
+        :param int pid: Process ID
+        :returns Optional[Dict[str, Any]]: Command name, parent PID, CPU
+            seconds, thread count and resident bytes, or None if the
+            process is gone or the file is malformed
+        """
+        path = os.path.join(self.PROC_ROOT, str(pid), "stat")
+        text = self._read_text(path)
+        if not text or ")" not in text:
+            return None
+
+        # The command name is parenthesised and may contain anything
+        head, _, tail = text.rpartition(")")
+        fields = tail.split()
+        try:
+            ticks = int(fields[11]) + int(fields[12])
+            return {
+                "name": head.partition("(")[2],
+                "ppid": int(fields[1]),
+                "cpu_seconds": ticks / os.sysconf("SC_CLK_TCK"),
+                "threads": int(fields[17]),
+                "rss_bytes": int(fields[21]) * os.sysconf("SC_PAGE_SIZE"),
+            }
+        except (IndexError, ValueError):
+            return None
+
+    def _process_tree(self, root: int) -> List[Dict[str, Any]]:
+        """
+        Return the usage of a process and all of its descendants.
+
+        Reads the stat file of every process in /proc, streaming the
+        directory, to find the descendants of the root.
+
+        :param int root: Root process ID
+        :returns List[Dict[str, Any]]: Processes in tree order (parents
+            before their children), each with its pid, ppid, name, role
+            ('parent', 'worker' or 'child'), rss_bytes, cpu_seconds,
+            open fds (None if unreadable) and threads
+        """
+        stats: Dict[int, Dict[str, Any]] = {}
+        children: Dict[int, List[int]] = {}
+        try:
+            with os.scandir(self.PROC_ROOT) as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    pid = int(entry.name)
+                    stat = self._process_stat(pid)
+                    if stat is None:
+                        continue
+                    stats[pid] = stat
+                    children.setdefault(stat["ppid"], []).append(pid)
+        except OSError:
+            pass
+
+        if root not in stats:
+            return []
+
+        processes = []
+        stack = [(root, 0)]
+        while stack:
+            pid, depth = stack.pop()
+            stat = stats[pid]
+            processes.append(
+                {
+                    "pid": pid,
+                    "ppid": stat["ppid"],
+                    "name": stat["name"],
+                    "role": ("parent", "worker", "child")[min(depth, 2)],
+                    "rss_bytes": stat["rss_bytes"],
+                    "cpu_seconds": round(stat["cpu_seconds"], 2),
+                    "fds": self._count_fds(pid),
+                    "threads": stat["threads"],
+                }
+            )
+            stack.extend(
+                (child, depth + 1)
+                for child in sorted(children.get(pid, ()), reverse=True)
+            )
+
+        return processes
+
+    def _count_fds(self, pid: int) -> Optional[int]:
+        """
+        Return the number of file descriptors a process has open.
+
+        :param int pid: Process ID
+        :returns Optional[int]: Entry count of /proc/<pid>/fd, or None
+            if it cannot be read
+        """
+        try:
+            with os.scandir(
+                os.path.join(self.PROC_ROOT, str(pid), "fd")
+            ) as entries:
+                return sum(1 for _ in entries)
+        except OSError:
+            return None
@@ -0,0 +1,145 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the playbook Python interpreter."""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Dict, Optional
+
+from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.packages import (
+    PackagesCollector,
+)
+
+
+class PythonCollector(PackagesCollector):
+    """
+    Collect the python subset by probing ansible_playbook_python.
+
+    The interpreter is probed with the PYTHON_PROBE of PackagesCollector,
+    which keeps the results for other interpreters in the persisted
+    _interpreter_index. The pip version of a single leaf is read from
+    the site-packages index of PackagesCollector.
+    """
+
+    def python(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return Python interpreter info and pip version (if available).
+
+        Describes ansible_playbook_python by running PYTHON_PROBE with
+        it, which reports the version, implementation, resolved
+        executable, prefixes, sysconfig paths and the pip version in a
+        single subprocess. When ansible_playbook_python is the
+        interpreter running this plugin the probe runs in process
+        instead, and results for other interpreters are reused until the
+        binary or its site-packages directories change (see
+        _probe_python).
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Python interpreter and pip information
+        :raises AnsibleActionFail: If ansible_playbook_python is
+            missing from task_vars or cannot be probed
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller Python info...")
+
+        path = task_vars.get("ansible_playbook_python")
+        if not path:
+            raise AnsibleActionFail(
+                "'ansible_playbook_python' is missing from task_vars"
+            )
+
+        info = self._probe_python(path)
+
+        python = {
+            "interpreter": {
+                "path": path,
+                "executable": info["executable"],
+                "implementation": info["implementation"],
+                "version": {"id": info["version"]},
+                "prefix": info["prefix"],
+                "base_prefix": info["base_prefix"],
+                "venv": info["venv"],
+                "paths": info["paths"],
+            }
+        }
+
+        if info["pip"]:
+            python["pip"] = {"version": {"id": info["pip"]}}
+        else:
+            self._display.vv("pip not available for this interpreter")
+            python["pip"] = None
+
+        return python
+
+    def _pip(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the pip version installed for an interpreter.
+
+        The version is read from the site-packages index (see
+        _scan_site_packages) rather than by probing the interpreter.
+
+        :param str path: Interpreter path
+        :returns Optional[Dict[str, Any]]: pip version, or None if pip
+            is not installed
+        """
+        for d in self._scan_site_packages(self._site_packages(path)):
+            if self._normalize_name(d["name"]) == "pip" and d["version"]:
+                return {"version": {"id": d["version"]}}
+
+        self._display.vv("pip not available for this interpreter")
+        return None
+
+    def _python_resolvers(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Callable[[], Any]]:
+        """
+        Return resolvers for the leaves of the python subset.
+
+        The interpreter is probed at most once, and only for the leaves
+        that need it. The path and the pip version do not.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Callable[[], Any]]: Resolvers keyed by dotted
+            key path, in fact order
+        :raises AnsibleActionFail: If ansible_playbook_python is
+            missing from task_vars
+        """
+        task_vars = task_vars or {}
+        path = task_vars.get("ansible_playbook_python")
+        if not path:
+            raise AnsibleActionFail(
+                "'ansible_playbook_python' is missing from task_vars"
+            )
+        probe = functools.lru_cache(maxsize=None)(
+            lambda: self._probe_python(path)
+        )
+
+        def field(name):
+            return lambda: probe()[name]
+
+        return {
+            "interpreter.path": lambda: path,
+            "interpreter.executable": field("executable"),
+            "interpreter.implementation": field("implementation"),
+            "interpreter.version.id": field("version"),
+            "interpreter.prefix": field("prefix"),
+            "interpreter.base_prefix": field("base_prefix"),
+            "interpreter.venv": field("venv"),
+            "interpreter.paths": field("paths"),
+            "pip": lambda: self._pip(path),
+        }
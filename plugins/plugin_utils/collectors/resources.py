@@ -0,0 +1,268 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for controller CPU, memory and resource limits."""
+
+from __future__ import annotations
+
+import functools
+import math
+import os
+import resource
+from typing import Any, Callable, Dict, Optional
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class ResourcesCollector(CommonCollector):
+    """Collect the resources subset from /proc, cgroups and rlimits."""
+
+    PROC_ROOT = "/proc"
+    CGROUP_ROOT = "/sys/fs/cgroup"
+
+    def resources(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return controller CPU, memory, load and resource limit info.
+
+        Reads CPU affinity, the cgroup CPU, memory and pids limits, load
+        averages, /proc/meminfo and the RLIMIT_NOFILE and RLIMIT_NPROC
+        limits of this process. Each source is read once and no
+        subprocesses are spawned. Values that cannot be determined on
+        this platform are None.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Resource information with cpu, load,
+            memory, swap, cgroup and limits keys
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller resource info...")
+
+        cgroup = self._cgroup()
+        meminfo = self._meminfo()
+
+        return {
+            "cpu": self._cpu(cgroup),
+            "load": self._loadavg(),
+            "memory": {
+                "total_bytes": meminfo.get("MemTotal"),
+                "available_bytes": meminfo.get("MemAvailable"),
+            },
+            "swap": {
+                "total_bytes": meminfo.get("SwapTotal"),
+                "free_bytes": meminfo.get("SwapFree"),
+            },
+            "cgroup": cgroup,
+            "limits": {
+                "nofile": self._rlimit("RLIMIT_NOFILE"),
+                "nproc": self._rlimit("RLIMIT_NPROC"),
+            },
+        }
+
+    @staticmethod
+    def _cpu(cgroup: Dict[str, Any]) -> Dict[str, Optional[int]]:
+        """
+        Return the total, available and quota-limited CPU counts.
+
+        :param Dict[str, Any] cgroup: cgroup limits from _cgroup()
+        :returns Dict[str, Optional[int]]: count, available, quota and
+            effective CPUs
+        """
+        try:
+            available = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            available = os.cpu_count()
+
+        quota = cgroup["cpu_quota"]
+        effective = available
+        if quota is not None and available is not None:
+            effective = max(1, min(available, math.ceil(quota)))
+
+        return {
+            "count": os.cpu_count(),
+            "available": available,
+            "quota": quota,
+            "effective": effective,
+        }
+
+    @staticmethod
+    def _loadavg() -> Dict[str, Optional[float]]:
+        """
+        Return the 1, 5 and 15 minute load averages.
+
+        :returns Dict[str, Optional[float]]: Load averages keyed by
+            minutes, None where unsupported
+        """
+        try:
+            load = [round(v, 2) for v in os.getloadavg()]
+        except OSError:
+            load = [None, None, None]
+
+        return {"1": load[0], "5": load[1], "15": load[2]}
+
+    def _meminfo(self) -> Dict[str, int]:
+        """
+        Return the fields of /proc/meminfo in bytes.
+
+        :returns Dict[str, int]: Numeric meminfo fields, empty when
+            /proc/meminfo is unavailable
+        """
+        meminfo = {}
+        text = self._read_text(os.path.join(self.PROC_ROOT, "meminfo"))
+        for line in (text or "").splitlines():
+            key, _, value = line.partition(":")
+            fields = value.split()
+            if fields and fields[0].isdigit():
+                factor = 1024 if fields[1:] == ["kB"] else 1
+                meminfo[key] = int(fields[0]) * factor
+
+        return meminfo
+
+    def _cgroup(self) -> Dict[str, Any]:
+        """
+        Return the CPU, memory and pids limits of this process's cgroup.
+
+        Supports the unified (v2) hierarchy and the per-controller (v1)
+        hierarchies, including hybrid layouts. When the cgroup path from
+        /proc/self/cgroup does not exist under the mount (as inside many
+        containers) the controller root is used instead. Unlimited
+        values are reported as None.
+
+        :returns Dict[str, Any]: cgroup version, CPU quota in CPUs,
+            memory limit and usage in bytes, and pids limit
+        """
+        cgroup = {
+            "version": None,
+            "cpu_quota": None,
+            "memory_limit_bytes": None,
+            "memory_usage_bytes": None,
+            "pids_limit": None,
+        }
+
+        text = self._read_text(os.path.join(self.PROC_ROOT, "self/cgroup"))
+        paths = {}
+        for line in (text or "").splitlines():
+            _, controllers, path = line.split(":", 2)
+            for controller in controllers.split(","):
+                paths[controller] = path.lstrip("/")
+
+        def read(controller, mounts, name):
+            if controller not in paths:
+                return None
+            for mount in mounts:
+                base = os.path.join(self.CGROUP_ROOT, mount)
+                for d in (os.path.join(base, paths[controller]), base):
+                    value = self._read_text(os.path.join(d, name))
+                    if value is not None:
+                        return value.strip()
+            return None
+
+        def number(value):
+            if value is None or not value.lstrip("-").isdigit():
+                return None
+            value = int(value)
+            return value if 0 <= value < 2**60 else None
+
+        cpu_max = read("", [""], "cpu.max")
+        if cpu_max is not None or read("", [""], "memory.max") is not None:
+            cgroup["version"] = 2
+            if cpu_max:
+                limit, _, period = cpu_max.partition(" ")
+                if limit.isdigit() and number(period):
+                    cgroup["cpu_quota"] = int(limit) / int(period)
+            cgroup["memory_limit_bytes"] = number(read("", [""], "memory.max"))
+            cgroup["memory_usage_bytes"] = number(
+                read("", [""], "memory.current")
+            )
+            cgroup["pids_limit"] = number(read("", [""], "pids.max"))
+        elif any(c in paths for c in ("cpu", "memory", "pids")):
+            cgroup["version"] = 1
+            cpu_mounts = ["cpu", "cpu,cpuacct", "cpuacct,cpu"]
+            limit = number(read("cpu", cpu_mounts, "cpu.cfs_quota_us"))
+            period = number(read("cpu", cpu_mounts, "cpu.cfs_period_us"))
+            if limit and period:
+                cgroup["cpu_quota"] = limit / period
+            cgroup["memory_limit_bytes"] = number(
+                read("memory", ["memory"], "memory.limit_in_bytes")
+            )
+            cgroup["memory_usage_bytes"] = number(
+                read("memory", ["memory"], "memory.usage_in_bytes")
+            )
+            cgroup["pids_limit"] = number(read("pids", ["pids"], "pids.max"))
+
+        return cgroup
+
+    @staticmethod
+    def _rlimit(name: str) -> Dict[str, Optional[int]]:
+        """
+        Return the soft and hard values of a resource limit.
+
+        :param str name: Name of a resource module RLIMIT_* constant
+        :returns Dict[str, Optional[int]]: Soft and hard limits, None
+            when unlimited or unsupported
+        """
+        try:
+            soft, hard = resource.getrlimit(getattr(resource, name))
+        except (AttributeError, ValueError, OSError):
+            return {"soft": None, "hard": None}
+
+        def finite(value):
+            return None if value == resource.RLIM_INFINITY else value
+
+        return {"soft": finite(soft), "hard": finite(hard)}
+
+    @staticmethod
+    def _read_text(path: str) -> Optional[str]:
+        """
+        Return the contents of a small text file, or None if unreadable.
+
+        :param str path: File path
+        :returns Optional[str]: File contents
+        """
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _resources_resolvers(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Callable[[], Any]]:
+        """
+        Return resolvers for the leaves of the resources subset.
+
+        The cgroup limits and /proc/meminfo are read at most once, and
+        only for the leaves that need them.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Callable[[], Any]]: Resolvers keyed by dotted
+            key path, in fact order
+        """
+        once = functools.lru_cache(maxsize=None)
+        cgroup = once(self._cgroup)
+        meminfo = once(self._meminfo)
+
+        return {
+            "cpu": lambda: self._cpu(cgroup()),
+            "load": self._loadavg,
+            "memory.total_bytes": lambda: meminfo().get("MemTotal"),
+            "memory.available_bytes": lambda: meminfo().get("MemAvailable"),
+            "swap.total_bytes": lambda: meminfo().get("SwapTotal"),
+            "swap.free_bytes": lambda: meminfo().get("SwapFree"),
+            "cgroup": cgroup,
+            "limits.nofile": lambda: self._rlimit("RLIMIT_NOFILE"),
+            "limits.nproc": lambda: self._rlimit("RLIMIT_NPROC"),
+        }
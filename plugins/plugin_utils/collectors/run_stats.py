@@ -0,0 +1,57 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the task and host timings of the current run."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+from ansible_collections.o0_o.controller.plugins.plugin_utils.timing import (
+    recorder,
+)
+
+
+class RunStatsCollector(CommonCollector):
+    """Collect the run_stats subset from the timing callback's recorder."""
+
+    # Number of slowest tasks and hosts listed
+    RUN_STATS_TOP = 10
+
+    def run_stats(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the durations of the tasks run so far in this playbook.
+
+        Reads the aggregate kept by the o0_o.controller.timing callback
+        in the process that forked this worker, so it covers the results
+        received before the current task started. Nothing is measured
+        here and no files are read.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Whether the callback is enabled and,
+            when it is, the run start time and elapsed seconds, overall
+            and per-module duration quantiles, and the RUN_STATS_TOP
+            slowest tasks and hosts
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller run timing info...")
+
+        timings = recorder()
+        if timings is None:
+            return {"enabled": False}
+
+        return {"enabled": True, **timings.summary(top=self.RUN_STATS_TOP)}
@@ -0,0 +1,131 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for SSH ControlMaster sockets."""
+
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import time
+from typing import Any, Dict, Optional
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class SshCollector(CommonCollector):
+    """
+    Collect the ssh subset from the ControlMaster socket directory.
+
+    Stale sockets are only removed when ssh is in the action's
+    _prune set.
+    """
+
+    # Seconds to wait for a ControlMaster socket to accept a connection
+    SSH_PROBE_TIMEOUT = 0.5
+
+    def ssh(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return an inventory of SSH ControlMaster sockets.
+
+        Scans the control_path_dir used by the ssh connection plugin and
+        probes every Unix socket in it. A socket that accepts a
+        connection has a live master behind it; one that refuses is
+        stale, left behind by a master that exited without cleaning up.
+        Ages are measured from the socket's mtime. When pruning is
+        enabled for this subset (and not in check mode) stale sockets
+        are removed.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Control path directory, live, stale and
+            unknown socket counts, ages of live sockets in seconds, and
+            the number of sockets pruned
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller SSH multiplexing info...")
+
+        path = task_vars.get("ansible_control_path_dir") or (
+            self._config_value("control_path_dir", task_vars)
+        )
+        path = os.path.expanduser(path)
+        prune = "ssh" in self._prune and not self._task.check_mode
+
+        counts = {"live": 0, "stale": 0, "unknown": 0}
+        ages = []
+        pruned = 0
+        now = time.time()
+
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            entries = None
+
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if not stat.S_ISSOCK(st.st_mode):
+                        continue
+
+                    state = self._probe_socket(entry.path)
+                    counts[state] += 1
+                    if state == "live":
+                        ages.append(max(0.0, now - st.st_mtime))
+                    elif state == "stale" and prune:
+                        try:
+                            os.unlink(entry.path)
+                            pruned += 1
+                        except OSError as e:
+                            self._display.vv(
+                                f"Unable to prune {entry.path}: {e}"
+                            )
+
+        return {
+            "control_path_dir": path,
+            "exists": entries is not None,
+            "sockets": counts,
+            "age": {
+                "min": round(min(ages), 3) if ages else None,
+                "max": round(max(ages), 3) if ages else None,
+                "mean": round(sum(ages) / len(ages), 3) if ages else None,
+            },
+            "pruned": pruned,
+        }
+
+    def _probe_socket(self, path: str) -> str:
+        """
+        Return whether a Unix socket has a process listening on it.
+
+        :param str path: Socket path
+        :returns str: 'live' if a connection is accepted, 'stale' if it
+            is refused or the socket vanished, otherwise 'unknown'
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.SSH_PROBE_TIMEOUT)
+        try:
+            sock.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return "stale"
+        except OSError:
+            return "unknown"
+        finally:
+            sock.close()
+
+        return "live"
@@ -0,0 +1,262 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the Ansible home and temporary directories."""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible import constants as C
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class StorageCollector(CommonCollector):
+    """
+    Collect the storage subset from the Ansible temporary directories.
+
+    Stale temporary directories are only removed when storage is in the
+    action's _prune set.
+    """
+
+    # Temporary directories and the group holding the PID of the process
+    # that created them: ansible-local-<pid><8 random characters> from
+    # tempfile.mkdtemp() in every controller process, and
+    # ansible-tmp-<time>-<pid>-<random> from the action plugins of
+    # workers connecting to the controller itself
+    STORAGE_TEMP_DIRS = (
+        re.compile(r"ansible-local-(\d+)[a-z0-9_]{8}$"),
+        re.compile(r"ansible-tmp-[\d.]+-(\d+)-\d+$"),
+    )
+
+    # Seconds since a temporary directory was last modified before it
+    # can be stale: an async job keeps using the ansible-tmp-* directory
+    # of a worker that has already exited
+    STORAGE_STALE_AGE = 24 * 60 * 60
+
+    def storage(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return free space in the Ansible directories and stale temp dirs.
+
+        Reports free and total bytes and inodes of the filesystems
+        holding the Ansible home directory and the local_tmp and
+        remote_tmp directories. The temporary directories are scanned
+        for ansible-local-* and ansible-tmp-* directories, which are
+        live while the process named in them runs or they were modified
+        within STORAGE_STALE_AGE, and stale once both have passed
+        without the process cleaning up; the size of the stale ones is
+        measured with a walk that holds one directory iterator per
+        level. When pruning is enabled for this subset (and not in check
+        mode) stale directories owned by the effective user are removed.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: Home directory, temporary directories
+            with their filesystem usage, temp dir counts and stale
+            sizes, and the number of directories pruned
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller storage info...")
+
+        home = os.path.expanduser(self._config_value("home", task_vars))
+        remote_tmp = os.path.expanduser(
+            self._config_value("remote_tmp", task_vars)
+        )
+        prune = "storage" in self._prune and not self._task.check_mode
+
+        # C.DEFAULT_LOCAL_TMP is this run's own ansible-local-* directory
+        tmp_dirs: Dict[str, Dict[str, Any]] = {}
+        for name, path in (
+            ("local_tmp", os.path.dirname(C.DEFAULT_LOCAL_TMP)),
+            ("remote_tmp", remote_tmp),
+        ):
+            key = os.path.realpath(path)
+            tmp_dirs.setdefault(key, {"path": path, "settings": []})
+            tmp_dirs[key]["settings"].append(name)
+
+        pruned = 0
+        tmp = []
+        for entry in tmp_dirs.values():
+            scan = self._scan_temp_dirs(entry["path"], prune)
+            pruned += scan.pop("pruned")
+            tmp.append(
+                {
+                    **entry,
+                    "filesystem": self._filesystem(entry["path"]),
+                    **scan,
+                }
+            )
+
+        return {
+            "home": {"path": home, "filesystem": self._filesystem(home)},
+            "tmp": tmp,
+            "pruned": pruned,
+        }
+
+    def _scan_temp_dirs(self, path: str, prune: bool) -> Dict[str, Any]:
+        """
+        Count the live and stale Ansible temporary directories in a path.
+
+        :param str path: Directory holding the temporary directories
+        :param bool prune: Whether to remove stale directories owned by
+            the effective user
+        :returns Dict[str, Any]: Whether the directory could be read,
+            live, stale and unknown counts, bytes and inodes used by
+            stale directories, and the number removed
+        """
+        counts = {"live": 0, "stale": 0, "unknown": 0}
+        stale_bytes = stale_inodes = pruned = 0
+        euid = os.geteuid()
+        cutoff = time.time() - self.STORAGE_STALE_AGE
+
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            entries = None
+
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    for pattern in self.STORAGE_TEMP_DIRS:
+                        match = pattern.match(entry.name)
+                        if match:
+                            break
+                    else:
+                        continue
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+                    state = self._pid_state(int(match.group(1)))
+                    if state == "stale" and st.st_mtime > cutoff:
+                        state = "live"
+                    counts[state] += 1
+                    if state != "stale":
+                        continue
+
+                    size, inodes = self._disk_usage(entry.path)
+                    stale_bytes += size
+                    stale_inodes += inodes
+                    if prune and st.st_uid == euid:
+                        try:
+                            shutil.rmtree(entry.path)
+                            pruned += 1
+                        except OSError as e:
+                            self._display.vv(
+                                f"Unable to prune {entry.path}: {e}"
+                            )
+
+        return {
+            "exists": entries is not None,
+            "temp_dirs": counts,
+            "stale_bytes": stale_bytes,
+            "stale_inodes": stale_inodes,
+            "pruned": pruned,
+        }
+
+    def _filesystem(self, path: str) -> Optional[Dict[str, int]]:
+        """
+        Return the free and total space of the filesystem holding a path.
+
+        :param str path: Path on the filesystem
+        :returns Optional[Dict[str, int]]: Bytes and inodes available to
+            unprivileged users and in total, or None if the path cannot
+            be read
+        """
+        try:
+            st = os.statvfs(path)
+        except OSError:
+            return None
+
+        return {
+            "free_bytes": st.f_bavail * st.f_frsize,
+            "total_bytes": st.f_blocks * st.f_frsize,
+            "free_inodes": st.f_favail,
+            "total_inodes": st.f_files,
+        }
+
+    def _pid_state(self, pid: int) -> str:
+        """
+        Return whether the process with a PID is running.
+
+        A PID reused by an unrelated process reads as live, so that a
+        directory is never taken for stale while its owner might run.
+
+        :param int pid: Process ID
+        :returns str: 'live' if the process exists, 'stale' if it does
+            not, otherwise 'unknown'
+        """
+        if pid <= 0:
+            return "unknown"
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return "stale"
+        except PermissionError:
+            return "live"
+        except (OSError, OverflowError):
+            return "unknown"
+
+        return "live"
+
+    def _disk_usage(self, path: str) -> Tuple[int, int]:
+        """
+        Return the disk usage of a directory tree without following links.
+
+        Walks the tree depth-first with one open os.scandir() iterator
+        per level, so memory grows with the depth of the tree and not
+        with the number of entries.
+
+        :param str path: Directory path
+        :returns Tuple[int, int]: Bytes allocated and number of inodes,
+            including the directory itself
+        """
+        try:
+            size = os.lstat(path).st_blocks * 512
+        except OSError:
+            return 0, 0
+        inodes = 1
+
+        try:
+            stack: List[Any] = [os.scandir(path)]
+        except OSError:
+            return size, inodes
+
+        try:
+            while stack:
+                entry = next(stack[-1], None)
+                if entry is None:
+                    stack.pop().close()
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    size += st.st_blocks * 512
+                    inodes += 1
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(os.scandir(entry.path))
+                except OSError:
+                    continue
+        finally:
+            for entries in stack:
+                entries.close()
+
+        return size, inodes
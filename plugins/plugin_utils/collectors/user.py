@@ -0,0 +1,142 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""Collector for the user running the controller."""
+
+from __future__ import annotations
+
+import functools
+import grp
+import os
+import pwd
+from typing import Any, Callable, Dict, List, Optional
+
+from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.common import (
+    CommonCollector,
+)
+
+
+class UserCollector(CommonCollector):
+    """Collect the user subset from the passwd and group databases."""
+
+    def user(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return current controller user ID, username, and group info.
+
+        Collects information about the user running the Ansible
+        controller process including user ID, username, primary and
+        supplementary groups, home directory, and login shell. All
+        lookups go through the passwd and group databases in-process,
+        so no subprocesses are spawned.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Any]: User information dictionary with id,
+            name, group, groups, home, and shell details
+        :raises AnsibleActionFail: If the user has no passwd entry
+        """
+        task_vars = task_vars or {}
+        self._display.v("Collecting controller user info...")
+
+        user_id = os.geteuid()
+        pw = self._passwd(user_id)
+        groups = self._groups(pw)
+
+        return {
+            "id": user_id,
+            "name": pw.pw_name,
+            "group": groups[0],
+            "groups": groups,
+            "home": pw.pw_dir,
+            "shell": pw.pw_shell,
+        }
+
+    @staticmethod
+    def _passwd(user_id: int) -> pwd.struct_passwd:
+        """
+        Return the passwd entry of a user ID.
+
+        :param int user_id: User ID
+        :returns pwd.struct_passwd: passwd entry
+        :raises AnsibleActionFail: If the user has no passwd entry
+        """
+        try:
+            return pwd.getpwuid(user_id)
+        except KeyError as e:
+            raise AnsibleActionFail(
+                f"Failed to get user info: no passwd entry for {user_id}"
+            ) from e
+
+    def _groups(self, pw: pwd.struct_passwd) -> List[Dict[str, Any]]:
+        """
+        Return the primary and supplementary groups of a user.
+
+        :param pwd.struct_passwd pw: passwd entry of the user
+        :returns List[Dict[str, Any]]: Groups with id and name keys,
+            primary group first
+        """
+        try:
+            group_ids = os.getgrouplist(pw.pw_name, pw.pw_gid)
+        except OSError:
+            self._display.vv("Unable to list supplementary groups")
+            group_ids = []
+
+        groups = []
+        for gid in [pw.pw_gid, *group_ids]:
+            group = {"id": str(gid), "name": self._group_name(gid)}
+            if group not in groups:
+                groups.append(group)
+
+        return groups
+
+    @staticmethod
+    def _group_name(gid: int) -> Optional[str]:
+        """
+        Return the name of a group ID, or None if it has no entry.
+
+        :param int gid: Group ID
+        :returns Optional[str]: Group name
+        """
+        try:
+            return grp.getgrgid(gid).gr_name
+        except KeyError:
+            return None
+
+    def _user_resolvers(
+        self, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Callable[[], Any]]:
+        """
+        Return resolvers for the leaves of the user subset.
+
+        The passwd entry and the group list are looked up at most once,
+        and only for the leaves that need them.
+
+        :param Optional[Dict[str, Any]] task_vars: Task variables
+            dictionary
+        :returns Dict[str, Callable[[], Any]]: Resolvers keyed by dotted
+            key path, in fact order
+        """
+        once = functools.lru_cache(maxsize=None)
+        user_id = os.geteuid()
+        pw = once(lambda: self._passwd(user_id))
+        groups = once(lambda: self._groups(pw()))
+
+        return {
+            "id": lambda: user_id,
+            "name": lambda: pw().pw_name,
+            "group": lambda: groups()[0],
+            "groups": groups,
+            "home": lambda: pw().pw_dir,
+            "shell": lambda: pw().pw_shell,
+        }
@@ -0,0 +1,259 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""
+Streaming aggregation of task and host durations.
+
+The timing callback plugin records into the TimingRecorder returned by
+start_recording(). Task workers are forked from the process running the
+callback, so the run_stats collector reads the same recorder, as it was
+when the worker started, through recorder().
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Histogram:
+    """
+    Log-bucketed histogram of durations in seconds.
+
+    Each bucket spans a factor of GROWTH, so quantiles are estimated
+    within half a bucket (under 5%) of the true value. Durations from
+    MINIMUM to a day fit in fewer than 300 buckets, whatever the number
+    of values added.
+    """
+
+    MINIMUM = 0.001
+    GROWTH = 1.1
+
+    __slots__ = ("buckets", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """
+        Add a duration to the histogram.
+
+        :param float value: Duration in seconds
+        """
+        value = max(0.0, value)
+        index = 0
+        if value > self.MINIMUM:
+            index = int(math.log(value / self.MINIMUM, self.GROWTH)) + 1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile from the bucket counts.
+
+        :param float q: Quantile between 0 and 1
+        :returns Optional[float]: Geometric midpoint of the bucket
+            holding the quantile, clamped to the observed range, or None
+            if the histogram is empty
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                break
+
+        if index == 0:
+            value = self.MINIMUM / 2
+        else:
+            value = self.MINIMUM * self.GROWTH ** (index - 0.5)
+
+        return min(max(value, self.min), self.max)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Return the count, total and quantiles of the histogram.
+
+        :returns Dict[str, Any]: count, total, p50, p95, p99 and max,
+            with durations rounded to milliseconds
+        """
+
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value, 3)
+
+        return {
+            "count": self.count,
+            "total": rounded(self.total),
+            "p50": rounded(self.quantile(0.5)),
+            "p95": rounded(self.quantile(0.95)),
+            "p99": rounded(self.quantile(0.99)),
+            "max": rounded(self.max),
+        }
+
+
+class TimingRecorder:
+    """
+    Aggregate the duration of every task on every host of a run.
+
+    Only the start times of the host tasks in flight are kept. Finished
+    durations are added to one histogram per task and per module, and
+    to a count, total and maximum per host.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self.started = time.time()
+        self.start = clock()
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.modules: Dict[str, Histogram] = {}
+        self.hosts: Dict[str, List[Any]] = {}
+        self.overall = Histogram()
+        self.running: Dict[Tuple[str, str], float] = {}
+
+    def task_start(self, uuid: str, name: str, action: str) -> None:
+        """
+        Record the start of a task.
+
+        :param str uuid: Task UUID
+        :param str name: Task name
+        :param str action: Module or action plugin name
+        """
+        if uuid not in self.tasks:
+            self.tasks[uuid] = {
+                "name": name,
+                "action": action,
+                "start": self.clock(),
+                "histogram": Histogram(),
+            }
+
+    def host_start(self, host: str, uuid: str) -> None:
+        """
+        Record the start of a task on a host.
+
+        :param str host: Inventory host name
+        :param str uuid: Task UUID
+        """
+        self.running[(host, uuid)] = self.clock()
+
+    def host_end(self, host: str, uuid: str, failed: bool = False) -> None:
+        """
+        Record the result of a task on a host.
+
+        The duration runs from host_start(), or from task_start() for
+        results that were not announced (such as skipped hosts on older
+        versions of Ansible).
+
+        :param str host: Inventory host name
+        :param str uuid: Task UUID
+        :param bool failed: Whether the task failed or the host was
+            unreachable
+        """
+        task = self.tasks.get(uuid)
+        start = self.running.pop((host, uuid), None)
+        if start is None:
+            if task is None:
+                return
+            start = task["start"]
+        duration = max(0.0, self.clock() - start)
+
+        if task is not None:
+            task["histogram"].add(duration)
+            action = task["action"]
+            if action not in self.modules:
+                self.modules[action] = Histogram()
+            self.modules[action].add(duration)
+        self.overall.add(duration)
+
+        stats = self.hosts.setdefault(host, [0, 0.0, 0.0, 0])
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = max(stats[2], duration)
+        stats[3] += bool(failed)
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Return the aggregated timings of the run so far.
+
+        :param int top: Number of slowest tasks and hosts to list
+        :returns Dict[str, Any]: Run start time and elapsed seconds,
+            overall and per-module duration summaries, and the slowest
+            tasks by p95 and hosts by total duration
+        """
+        tasks = [
+            {
+                "name": task["name"],
+                "action": task["action"],
+                **task["histogram"].summary(),
+            }
+            for task in self.tasks.values()
+            if task["histogram"].count
+        ]
+        tasks.sort(key=lambda t: (-t["p95"], -t["total"], t["name"]))
+
+        hosts = [
+            {
+                "name": name,
+                "count": count,
+                "total": round(total, 3),
+                "max": round(longest, 3),
+                "failed": failed,
+            }
+            for name, (count, total, longest, failed) in self.hosts.items()
+        ]
+        hosts.sort(key=lambda h: (-h["total"], h["name"]))
+
+        return {
+            "started": round(self.started, 3),
+            "elapsed": round(self.clock() - self.start, 3),
+            "overall": self.overall.summary(),
+            "modules": {
+                name: histogram.summary()
+                for name, histogram in sorted(self.modules.items())
+            },
+            "slowest_tasks": tasks[:top],
+            "slowest_hosts": hosts[:top],
+        }
+
+
+_RECORDER: Optional[TimingRecorder] = None
+
+
+def start_recording() -> TimingRecorder:
+    """
+    Create the recorder of this run and return it.
+
+    :returns TimingRecorder: New recorder, also returned by recorder()
+    """
+    global _RECORDER
+    _RECORDER = TimingRecorder()
+
+    return _RECORDER
+
+
+def recorder() -> Optional[TimingRecorder]:
+    """
+    Return the recorder of this run.
+
+    :returns Optional[TimingRecorder]: Recorder created by the timing
+        callback, or None if the callback is not enabled
+    """
+    return _RECORDER
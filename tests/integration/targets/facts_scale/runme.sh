@@ -0,0 +1,14 @@
+#!/usr/bin/env bash
+# vim: ts=4:sw=4:sts=4:et:ft=sh
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+set -eux
+
+python "$(dirname "$0")/scale.py" "$@"
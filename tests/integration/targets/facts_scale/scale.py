@@ -0,0 +1,285 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""
+End-to-end scale harness for the facts action.
+
+Generates inventories of local hosts, runs scale.yml with
+ansible-playbook against each of them with and without run_once, and
+reports the wall time, the peak memory and size of the controller
+process tree and the subprocesses spawned by the facts action (as
+counted in its _meta), with the exponent of each one's growth with the
+host count (0 for constant, 1 for linear).
+Nothing connects to another machine and nothing needs root.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PLAYBOOK = Path(__file__).parent / "scale.yml"
+PROC_ROOT = "/proc"
+MODES = {"run_once": True, "per_host": False}
+METRICS = ("wall_seconds", "peak_rss_bytes", "subprocesses")
+
+
+def write_inventory(path: Path, hosts: int) -> None:
+    """
+    Write a YAML inventory of local hosts.
+
+    :param Path path: Inventory file path
+    :param int hosts: Number of hosts
+    """
+    with path.open("w", encoding="utf-8") as f:
+        f.write("all:\n  vars:\n    ansible_connection: local\n")
+        f.write(f"    ansible_python_interpreter: {sys.executable}\n")
+        f.write("  hosts:\n")
+        for i in range(hosts):
+            f.write(f"    host{i:05d}:\n")
+
+
+def tree_usage(root: int) -> Tuple[int, int]:
+    """
+    Return the resident memory of a process and its descendants.
+
+    :param int root: Root process ID
+    :returns Tuple[int, int]: Sum of the resident bytes read from /proc,
+        and the number of processes in the tree
+    """
+    rss: Dict[int, int] = {}
+    children: Dict[int, List[int]] = {}
+    page = os.sysconf("SC_PAGE_SIZE")
+    for name in os.listdir(PROC_ROOT):
+        if not name.isdigit():
+            continue
+        try:
+            with open(os.path.join(PROC_ROOT, name, "stat")) as f:
+                fields = f.read().rpartition(")")[2].split()
+        except OSError:
+            continue
+        pid = int(name)
+        rss[pid] = int(fields[21]) * page
+        children.setdefault(int(fields[1]), []).append(pid)
+
+    total, count, stack = 0, 0, [root]
+    while stack:
+        pid = stack.pop()
+        if pid in rss:
+            total += rss[pid]
+            count += 1
+        stack.extend(children.get(pid, ()))
+
+    return total, count
+
+
+def run(
+    workdir: Path,
+    hosts: int,
+    mode: str,
+    profile: str,
+    forks: Optional[int],
+    interval: float,
+) -> Dict[str, Any]:
+    """
+    Run the playbook once and measure it.
+
+    :param Path workdir: Directory for the inventory and report
+    :param int hosts: Number of hosts in the inventory
+    :param str mode: Key of MODES
+    :param str profile: gather_profile of the facts task
+    :param Optional[int] forks: ansible-playbook --forks, or None for
+        the configured value
+    :param float interval: Seconds between memory samples
+    :returns Dict[str, Any]: Host count, mode, wall time, peak tree
+        RSS, largest single process RSS, peak number of processes in
+        the tree, and the facts results and their subprocess count
+    """
+    inventory = workdir / f"hosts-{hosts}.yml"
+    if not inventory.exists():
+        write_inventory(inventory, hosts)
+    report = workdir / f"report-{hosts}-{mode}.json"
+    # The config subset reports on the config file, so one must be found
+    config = workdir / "ansible.cfg"
+    config.write_text("[defaults]\nretry_files_enabled = false\n")
+
+    argv = [
+        "ansible-playbook",
+        "-i",
+        str(inventory),
+        "-e",
+        json.dumps(
+            {
+                "scale_run_once": MODES[mode],
+                "scale_profile": profile,
+                "scale_report": str(report),
+            }
+        ),
+        str(PLAYBOOK),
+    ]
+    if forks:
+        argv[1:1] = ["--forks", str(forks)]
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        env={**os.environ, "ANSIBLE_CONFIG": str(config)},
+    )
+    peak = {"rss": 0, "processes": 0}
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(interval):
+            rss, processes = tree_usage(proc.pid)
+            peak["rss"] = max(peak["rss"], rss)
+            peak["processes"] = max(peak["processes"], processes)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    # wait4 reports the largest RSS of the process and its descendants
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    done.set()
+    sampler.join()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise SystemExit(
+            f"ansible-playbook failed with {hosts} hosts ({mode}): "
+            f"exit {proc.returncode}"
+        )
+
+    counts = json.loads(report.read_text())
+    return {
+        "hosts": hosts,
+        "mode": mode,
+        "wall_seconds": round(wall, 3),
+        "peak_rss_bytes": peak["rss"],
+        "max_process_rss_bytes": usage.ru_maxrss * 1024,
+        "peak_processes": peak["processes"],
+        "results": counts["results"],
+        "subprocesses": counts["subprocesses"],
+    }
+
+
+def growth(runs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the growth exponent of each metric per mode.
+
+    The exponent between two host counts is the slope of the metric
+    against the host count on a log-log scale.
+
+    :param List[Dict[str, Any]] runs: Results of run()
+    :returns Dict[str, Dict[str, Any]]: Per mode and metric, the
+        exponents between consecutive host counts, None where a value
+        is zero
+    """
+    exponents: Dict[str, Dict[str, Any]] = {}
+    for mode in MODES:
+        series = sorted(
+            (r for r in runs if r["mode"] == mode), key=lambda r: r["hosts"]
+        )
+        if len(series) < 2:
+            continue
+        exponents[mode] = {}
+        for metric in METRICS:
+            slopes = []
+            for a, b in zip(series, series[1:]):
+                if a[metric] > 0 and b[metric] > 0:
+                    slopes.append(
+                        round(
+                            math.log(b[metric] / a[metric])
+                            / math.log(b["hosts"] / a["hosts"]),
+                            2,
+                        )
+                    )
+                else:
+                    slopes.append(None)
+            exponents[mode][metric] = slopes
+
+    return exponents
+
+
+def main() -> None:
+    """Parse arguments, run every size and mode, and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--hosts",
+        type=lambda s: [int(n) for n in s.split(",")],
+        default=[100, 1000, 10000],
+        help="comma-separated host counts (default: 100,1000,10000)",
+    )
+    parser.add_argument(
+        "--modes",
+        type=lambda s: s.split(","),
+        default=list(MODES),
+        help="comma-separated modes: run_once, per_host (default: both)",
+    )
+    parser.add_argument("--profile", default="default")
+    parser.add_argument("--forks", type=int)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.05,
+        help="seconds between memory samples (default: 0.05)",
+    )
+    parser.add_argument("--output", help="also write the report as JSON")
+    args = parser.parse_args()
+    for mode in args.modes:
+        if mode not in MODES:
+            parser.error(f"invalid mode: {mode}")
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="facts-scale-") as workdir:
+        for hosts in args.hosts:
+            for mode in args.modes:
+                result = run(
+                    Path(workdir),
+                    hosts,
+                    mode,
+                    args.profile,
+                    args.forks,
+                    args.interval,
+                )
+                runs.append(result)
+                print(
+                    f"{hosts:>6} hosts {mode:<9}"
+                    f" {result['wall_seconds']:>9.2f}s"
+                    f" {result['peak_rss_bytes'] / 2**20:>9.1f} MiB"
+                    f" {result['peak_processes']:>4} processes"
+                    f" {result['subprocesses']:>7} subprocesses",
+                    flush=True,
+                )
+
+    exponents = growth(runs)
+    for mode, metrics in exponents.items():
+        print(
+            f"{mode} growth exponents: "
+            + ", ".join(f"{m} {s}" for m, s in metrics.items())
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"runs": runs, "growth": exponents}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,33 @@ from ansible_collections.o0_o.controller.plugins.action.facts import (
 )
 
 
+def pytest_configure(config):
+    """Register the benchmark marker."""
+    config.addinivalue_line(
+        "markers", "benchmark: collector latency budgets, run with -m"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect the benchmarks unless a -m expression names them."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    benchmarks = [
+        item for item in items if item.get_closest_marker("benchmark")
+    ]
+    if benchmarks:
+        config.hook.pytest_deselected(items=benchmarks)
+        items[:] = [item for item in items if item not in benchmarks]
+
+
+@pytest.fixture(autouse=True)
+def cache_home(monkeypatch, tmp_path):
+    """Keep the default cache and index directory out of the home."""
+    monkeypatch.setattr(
+        ActionModule, "DEFAULT_CACHE_PATH", str(tmp_path / "o0_cache")
+    )
+
+
 @pytest.fixture
 def action_base() -> Generator[ActionModule, None, None]:
     """Provide a mock-initialized ActionModule for unit testing."""
@@ -32,3 +59,13 @@ def action_base() -> Generator[ActionModule, None, None]:
         templar=MagicMock(),
         shared_loader_obj=MagicMock(),
     )
+
+
+@pytest.fixture
+def stub_collector(monkeypatch, action_base):
+    """Provide a function replacing the collector method of a subset."""
+
+    def stub(subset, collect):
+        monkeypatch.setattr(action_base._collector(subset), subset, collect)
+
+    return stub
@@ -0,0 +1,121 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import pytest
+
+RESOURCES = {
+    "cpu": {"count": 8, "available": 8, "quota": None, "effective": 8},
+    "memory": {"total_bytes": 2**34, "available_bytes": 2**33},
+    "cgroup": {
+        "version": 2,
+        "cpu_quota": None,
+        "memory_limit_bytes": None,
+        "memory_usage_bytes": None,
+        "pids_limit": None,
+    },
+    "limits": {
+        "nofile": {"soft": 1024, "hard": 4096},
+        "nproc": {"soft": 4096, "hard": 4096},
+    },
+}
+
+
+@pytest.fixture
+def advise(monkeypatch, action_base):
+    """Return a function running advisor() for forks, settings and hosts."""
+    advisor = action_base._collector("advisor")
+    monkeypatch.setattr(advisor, "resources", lambda **_: RESOURCES)
+    for var in (
+        "ANSIBLE_PIPELINING",
+        "ANSIBLE_STRATEGY",
+        "ANSIBLE_GATHERING",
+        "ANSIBLE_CACHE_PLUGIN",
+        "ANSIBLE_SSH_ARGS",
+    ):
+        monkeypatch.delenv(var, raising=False)
+
+    def advise(forks, env, hosts):
+        for var, value in env.items():
+            monkeypatch.setenv(var, value)
+        return advisor.advisor(
+            task_vars={
+                "ansible_forks": forks,
+                "groups": {"all": [f"h{i}" for i in range(hosts)]},
+            }
+        )
+
+    return advise
+
+
+def test_advisor_forks_nofile(advise) -> None:
+    """Test forks above the RLIMIT_NOFILE headroom are flagged."""
+    result = advise(300, {}, 5000)
+    forks = [r for r in result["recommendations"] if r["setting"] == "forks"]
+
+    assert result["settings"]["forks"] == 300
+    assert result["forks"]["ceilings"]["nofile"] == (1024 - 64) // 4
+    assert result["forks"]["recommended"] == 80
+    assert len(forks) == 3  # cpu, nofile and memory ceilings
+    assert all(r["severity"] == "warning" for r in forks)
+    assert forks[1]["rationale"].startswith(
+        "forks=300 exceeds RLIMIT_NOFILE headroom for ssh multiplexing"
+    )
+    assert forks[1]["rationale"].endswith("allows at most 240")
+
+
+def test_advisor_tuned_config(advise) -> None:
+    """Test a well tuned config only gets the remaining advice."""
+    env = {
+        "ANSIBLE_GATHERING": "smart",
+        "ANSIBLE_CACHE_PLUGIN": "jsonfile",
+        "ANSIBLE_STRATEGY": "free",
+        "ANSIBLE_PIPELINING": "True",
+        "ANSIBLE_SSH_ARGS": "-o ControlMaster=auto -o ControlPersist=10m",
+    }
+
+    result = advise(50, env, 40)
+
+    assert result["settings"]["pipelining"] is True
+    assert sorted(result["settings"]) == [
+        "fact_caching",
+        "forks",
+        "gathering",
+        "internal_poll_interval",
+        "pipelining",
+        "ssh_args",
+        "strategy",
+    ]
+    assert result["recommendations"] == [
+        {
+            "setting": "forks",
+            "value": 50,
+            "recommended": 40,
+            "severity": "info",
+            "rationale": (
+                "forks=50 exceeds the 40 inventory hosts; the extra "
+                "workers are never used"
+            ),
+        }
+    ]
+
+
+def test_advisor_control_persist(advise) -> None:
+    """Test disabled multiplexing is flagged."""
+    env = {"ANSIBLE_SSH_ARGS": "-o ControlMaster=no"}
+
+    result = advise(5, env, 10)
+    ssh = [r for r in result["recommendations"] if r["setting"] == "ssh_args"]
+
+    assert result["settings"]["ssh_args"] == "-o ControlMaster=no"
+    assert ssh[0]["severity"] == "warning"
+    assert "ControlPersist" in ssh[0]["rationale"]
@@ -0,0 +1,400 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+"""
+Latency and subprocess budgets for the controller fact collectors.
+
+Each benchmark runs a collector against local stand-ins (a fake pip
+interpreter script, a synthetic site-packages tree and a large
+ansible.cfg) and fails when its median latency exceeds the budget in
+benchmark_baseline.json or when it spawns more subprocesses than
+allowed. The baseline figures in that file are informational and are
+attached to each test with record_property.
+
+The benchmarks are marked benchmark and only run when selected with
+``-m benchmark``, since their timings depend on the machine and its
+load.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+from ansible import constants as C
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.collections import (
+    CollectionsCollector,
+)
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.packages import (
+    PackagesCollector,
+)
+
+pytestmark = pytest.mark.benchmark
+
+BASELINE = json.loads(
+    (Path(__file__).parent / "benchmark_baseline.json").read_text()
+)
+
+
+@pytest.fixture
+def controller(tmp_path) -> Dict[str, Any]:
+    """
+    Build a fake controller environment for benchmarking.
+
+    The interpreter is a shell script that prints a canned probe result
+    so probing forks a process without starting a real interpreter. The
+    venv links to it and has 500 distributions including pip.
+    """
+    probe = {
+        "version": "3.12.1",
+        "implementation": "CPython",
+        "executable": str(tmp_path / "base" / "bin" / "python"),
+        "prefix": str(tmp_path / "base"),
+        "base_prefix": str(tmp_path / "base"),
+        "venv": False,
+        "paths": {},
+        "pip": "24.0",
+    }
+    site_dir = tmp_path / "venv" / "lib" / "python3.12" / "site-packages"
+    probe["site_packages"] = [str(site_dir)]
+    fake_python = tmp_path / "base" / "bin" / "python"
+    fake_python.parent.mkdir(parents=True)
+    fake_python.write_text(f"#!/bin/sh\necho '{json.dumps(probe)}'\n")
+    fake_python.chmod(0o755)
+
+    python = tmp_path / "venv" / "bin" / "python"
+    python.parent.mkdir(parents=True)
+    python.symlink_to(fake_python)
+    site_dir.mkdir(parents=True)
+    for i in range(500):
+        name = "pip" if i == 0 else f"pkg{i}"
+        dist_info = site_dir / f"{name}-1.{i}.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.{i}\n\n"
+            + "Description\n" * 50
+        )
+
+    cfg = tmp_path / "ansible.cfg"
+    with cfg.open("w") as f:
+        for section in range(50):
+            f.write(f"[section{section}]\n")
+            for key in range(200):
+                f.write(f"key{key} = value{key}\n")
+
+    return {
+        "probe": {
+            "ansible_config_file": str(cfg),
+            "ansible_playbook_python": str(fake_python),
+        },
+        "self": {
+            "ansible_config_file": str(cfg),
+            "ansible_playbook_python": sys.executable,
+        },
+        "indexed": {
+            "ansible_config_file": str(cfg),
+            "ansible_playbook_python": str(python),
+        },
+    }
+
+
+@pytest.fixture
+def isolated(monkeypatch, tmp_path, controller) -> Dict[str, Any]:
+    """
+    Confine the expensive subsets to empty stand-ins under tmp_path.
+
+    PATH only holds the fake interpreter, and the SSH control path, the
+    fact cache, the Ansible home and temporary directories and the
+    collection paths are empty directories, so gathering every subset
+    does not depend on the machine running the tests.
+
+    :returns Dict[str, Any]: collector() arguments with the venv roots
+    """
+    dirs = {
+        name: tmp_path / "isolated" / name
+        for name in ("cp", "facts", "home", "tmp", "collections", "venvs")
+    }
+    for path in dirs.values():
+        path.mkdir(parents=True)
+
+    monkeypatch.setenv("PATH", str(tmp_path / "base" / "bin"))
+    monkeypatch.setenv("ANSIBLE_SSH_CONTROL_PATH_DIR", str(dirs["cp"]))
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN", "jsonfile")
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN_CONNECTION", str(dirs["facts"]))
+    monkeypatch.setenv("ANSIBLE_HOME", str(dirs["home"]))
+    monkeypatch.setenv("ANSIBLE_REMOTE_TEMP", str(dirs["tmp"]))
+    monkeypatch.setattr(
+        C, "DEFAULT_LOCAL_TMP", str(dirs["tmp"] / "ansible-local-1abcdefgh")
+    )
+    monkeypatch.setenv("ANSIBLE_COLLECTIONS_PATH", str(dirs["collections"]))
+    monkeypatch.setenv("ANSIBLE_COLLECTIONS_SCAN_SYS_PATH", "false")
+
+    return {
+        "task_vars": controller["indexed"],
+        "venv_roots": [str(dirs["venvs"])],
+    }
+
+
+def measure(
+    monkeypatch, fn: Callable[[], Any], rounds: int
+) -> Tuple[float, float]:
+    """
+    Return the median latency and subprocesses spawned per call.
+
+    :param monkeypatch: pytest monkeypatch fixture
+    :param Callable[[], Any] fn: Function to benchmark
+    :param int rounds: Number of timed calls after one warm-up call
+    :returns Tuple[float, float]: Median milliseconds and subprocess
+        count per call
+    """
+    spawned = []
+    popen = subprocess.Popen
+
+    class CountingPopen(popen):
+        def __init__(self, *args, **kwargs):
+            spawned.append(args[0] if args else kwargs.get("args"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", CountingPopen)
+
+    fn()
+    spawned.clear()
+
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples), len(spawned) / rounds
+
+
+def check_budget(name: str, ms: float, forks: float, record_property) -> None:
+    """Assert a measurement is within the budgets for a benchmark."""
+    budget = BASELINE[name]
+    record_property("median_ms", round(ms, 3))
+    record_property("baseline_ms", budget["baseline_ms"])
+    record_property("subprocesses", forks)
+
+    assert forks <= budget["max_subprocesses"], (
+        f"{name} spawned {forks} subprocesses per call "
+        f"(budget {budget['max_subprocesses']})"
+    )
+    assert ms <= budget["budget_ms"], (
+        f"{name} took {ms:.3f}ms per call (budget {budget['budget_ms']}ms, "
+        f"baseline {budget['baseline_ms']}ms)"
+    )
+
+
+def test_benchmark_user(monkeypatch, record_property, action_base) -> None:
+    """Benchmark the in-process user collector."""
+    ms, forks = measure(monkeypatch, action_base._collector("user").user, 200)
+    check_budget("user", ms, forks, record_property)
+
+
+def test_benchmark_config(
+    monkeypatch, record_property, controller, action_base
+) -> None:
+    """Benchmark parsing a 10,000 key ansible.cfg."""
+    task_vars = controller["indexed"]
+
+    def config():
+        return action_base._collector("config").config(task_vars=task_vars)
+
+    ms, forks = measure(monkeypatch, config, 10)
+    check_budget("config", ms, forks, record_property)
+
+
+@pytest.mark.parametrize("env", ["probe_cold", "probe_warm", "self"])
+def test_benchmark_python(
+    monkeypatch, record_property, controller, action_base, env
+) -> None:
+    """
+    Benchmark the python collector.
+
+    A cold probe matches a fresh worker process asked about another
+    interpreter, which has to run it once.
+    """
+    task_vars = controller[env.split("_")[0]]
+
+    def python():
+        if env == "probe_cold":
+            monkeypatch.setattr(PackagesCollector, "_interpreter_index", {})
+        return action_base._collector("python").python(task_vars=task_vars)
+
+    ms, forks = measure(monkeypatch, python, 10)
+    check_budget(f"python_{env}", ms, forks, record_property)
+
+
+@pytest.mark.parametrize("index", ["cold", "warm"])
+def test_benchmark_packages(
+    monkeypatch, record_property, controller, action_base, index
+) -> None:
+    """
+    Benchmark listing 500 distributions.
+
+    A cold index matches a fresh worker process without the fact cache,
+    which has to parse every METADATA file.
+    """
+    task_vars = controller["indexed"]
+
+    def packages():
+        if index == "cold":
+            monkeypatch.setattr(PackagesCollector, "_package_index", {})
+        return action_base._collector("packages").packages(task_vars=task_vars)
+
+    ms, forks = measure(monkeypatch, packages, 20)
+    check_budget(f"packages_{index}", ms, forks, record_property)
+
+
+@pytest.mark.parametrize("index", ["cold", "warm"])
+def test_benchmark_collections(
+    monkeypatch, record_property, tmp_path, action_base, index
+) -> None:
+    """Benchmark listing 300 collections across 30 namespaces."""
+    root = tmp_path / "collections"
+    for i in range(300):
+        path = root / "ansible_collections" / f"ns{i % 30}" / f"col{i}"
+        path.mkdir(parents=True)
+        (path / "MANIFEST.json").write_text(
+            json.dumps({"collection_info": {"version": f"1.{i}.0"}})
+        )
+    monkeypatch.setenv("ANSIBLE_COLLECTIONS_PATH", str(root))
+    monkeypatch.setenv("ANSIBLE_COLLECTIONS_SCAN_SYS_PATH", "false")
+    monkeypatch.setattr(CollectionsCollector, "_collection_index", {})
+
+    def collections():
+        if index == "cold":
+            monkeypatch.setattr(CollectionsCollector, "_collection_index", {})
+        return action_base._collector("collections").collections(task_vars={})
+
+    ms, forks = measure(monkeypatch, collections, 20)
+    check_budget(f"collections_{index}", ms, forks, record_property)
+
+
+def test_benchmark_collector(
+    monkeypatch, record_property, isolated, action_base
+) -> None:
+    """
+    Benchmark gathering every subset through collector().
+
+    The config file is parsed afresh on every call, as in a new worker
+    process.
+    """
+
+    def collector():
+        return action_base.collector(gather_profile="full", **isolated)
+
+    ms, forks = measure(monkeypatch, collector, 10)
+    check_budget("collector", ms, forks, record_property)
+
+
+def test_benchmark_collector_fast(
+    monkeypatch, record_property, controller, action_base
+) -> None:
+    """
+    Benchmark the fast profile used for pre-flight checks.
+
+    Its budget is the 50ms that gather_timeout must guarantee for it,
+    and every cheap subset must finish within it.
+    """
+    task_vars = controller["indexed"]
+
+    def collector():
+        return action_base.collector(
+            task_vars=task_vars,
+            gather_profile="fast",
+            gather_timeout=0.05,
+            meta=True,
+        )
+
+    ms, forks = measure(monkeypatch, collector, 20)
+    check_budget("collector_fast", ms, forks, record_property)
+
+    facts = collector()["o0_controller"]
+    meta = facts.pop("_meta")
+    expected = ["user", "resources", "run_stats"]
+    assert list(facts) == expected
+    assert action_base._skipped == []
+    assert list(meta["collectors"]) == expected
+    for record in meta["collectors"].values():
+        assert record["wall"] is not None
+        assert record["subprocesses"]["count"] == 0
+
+
+def test_benchmark_run(
+    monkeypatch, record_property, controller, action_base
+) -> None:
+    """Benchmark the end-to-end run() entry point."""
+    monkeypatch.setattr(action_base._task, "args", {})
+    monkeypatch.setattr(action_base._task, "run_once", True)
+    monkeypatch.setattr(action_base._task, "async_val", 0)
+    task_vars = controller["indexed"]
+
+    def run():
+        return action_base.run(task_vars=task_vars)
+
+    ms, forks = measure(monkeypatch, run, 10)
+    check_budget("run", ms, forks, record_property)
+
+
+def test_benchmark_plugin_import(record_property) -> None:
+    """
+    Benchmark loading the action plugin with python -X importtime.
+
+    Ansible is imported first, as it already is in a worker process, so
+    only the plugin and what it imports itself are measured. Bytecode
+    caching is disabled because Ansible's collection loader compiles
+    collection source on every load. No collector module may be
+    imported until its subset is used.
+    """
+    module = "ansible_collections.o0_o.controller.plugins.action.facts"
+    code = f"import ansible.plugins.action\nimport {module}"
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(filter(None, sys.path)),
+        PYTHONDONTWRITEBYTECODE="1",
+    )
+
+    samples = []
+    for _ in range(5):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            encoding="utf-8",
+            check=True,
+            env=env,
+        )
+        cumulative = {}
+        for line in proc.stderr.splitlines():
+            _, _, fields = line.partition("import time:")
+            _, us, name = (f.strip() for f in fields.split("|"))
+            if us.isdigit():
+                cumulative[name] = int(us)
+        samples.append(cumulative[module] / 1000)
+
+    collectors = [
+        name
+        for name in cumulative
+        if ".collectors." in name and not name.endswith(".common")
+    ]
+    assert collectors == []
+    check_budget(
+        "plugin_import", statistics.median(samples), 0, record_property
+    )
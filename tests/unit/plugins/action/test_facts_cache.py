@@ -0,0 +1,89 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import os
+import time
+
+
+def test_cache_reuses_subset(tmp_path, action_base, stub_collector) -> None:
+    """Test a warm cache returns stored data without running collectors."""
+    calls = []
+
+    def fake_user(**_):
+        calls.append("user")
+        return {"u": len(calls)}
+
+    stub_collector("user", fake_user)
+
+    kwargs = {
+        "gather_subset": ["user"],
+        "cache": True,
+        "cache_path": str(tmp_path),
+    }
+
+    first = action_base.collector(**kwargs)
+    second = action_base.collector(**kwargs)
+
+    assert first == second == {"o0_controller": {"user": {"u": 1}}}
+    assert calls == ["user"]
+
+
+def test_cache_invalidated_on_change(tmp_path, action_base) -> None:
+    """Test a config cache entry is recomputed when the file changes."""
+    cfg = tmp_path / "ansible.cfg"
+    cfg.write_text("[defaults]\nforks = 5\n")
+    task_vars = {"ansible_config_file": str(cfg)}
+    kwargs = {
+        "gather_subset": ["config"],
+        "task_vars": task_vars,
+        "cache": True,
+        "cache_path": str(tmp_path / "cache"),
+    }
+
+    first = action_base.collector(**kwargs)["o0_controller"]["config"]
+
+    cfg.write_text("[defaults]\nforks = 50\n")
+    st = os.stat(cfg)
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    second = action_base.collector(**kwargs)["o0_controller"]["config"]
+
+    assert first["settings"]["defaults"]["forks"] == "5"
+    assert second["settings"]["defaults"]["forks"] == "50"
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_cache_expires_after_ttl(
+    monkeypatch, tmp_path, action_base, stub_collector
+) -> None:
+    """Test cache entries older than the TTL are recomputed."""
+    calls = []
+
+    def fake_user(**_):
+        calls.append("user")
+        return {"u": len(calls)}
+
+    stub_collector("user", fake_user)
+    kwargs = {
+        "gather_subset": ["user"],
+        "cache": True,
+        "cache_ttl": 60,
+        "cache_path": str(tmp_path),
+    }
+
+    action_base.collector(**kwargs)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    result = action_base.collector(**kwargs)
+
+    assert result["o0_controller"]["user"] == {"u": 2}
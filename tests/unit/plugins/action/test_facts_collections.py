@@ -0,0 +1,109 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.collections import (
+    CollectionsCollector,
+)
+
+
+def install(root, namespace, name, version, manifest=True) -> str:
+    """Create a collection under root/ansible_collections."""
+    path = root / "ansible_collections" / namespace / name
+    path.mkdir(parents=True)
+    if manifest:
+        (path / "MANIFEST.json").write_text(
+            json.dumps({"collection_info": {"version": version}})
+        )
+    else:
+        (path / "galaxy.yml").write_text(
+            f"namespace: {namespace}\nname: {name}\nversion: '{version}'\n"
+        )
+    return str(path)
+
+
+@pytest.fixture
+def roots(tmp_path, monkeypatch, action_base):
+    """Provide two collection roots where the first shadows the second."""
+    monkeypatch.setattr(CollectionsCollector, "_collection_index", {})
+    user = tmp_path / "user"
+    system = tmp_path / "system"
+    install(user, "community", "general", "9.0.0")
+    install(user, "o0_o", "controller", "1.1.0", manifest=False)
+    install(system, "community", "general", "8.0.0")
+    install(system, "ansible", "posix", "1.5.4")
+
+    monkeypatch.setenv(
+        "ANSIBLE_COLLECTIONS_PATH", os.pathsep.join([str(user), str(system)])
+    )
+    monkeypatch.setenv("ANSIBLE_COLLECTIONS_SCAN_SYS_PATH", "false")
+
+    return user, system
+
+
+def test_collections(roots, action_base) -> None:
+    """Test collections are listed in search order with shadowing."""
+    user, system = roots
+
+    result = action_base._collector("collections").collections(task_vars={})
+
+    assert result["paths"] == [
+        str(user / "ansible_collections"),
+        str(system / "ansible_collections"),
+    ]
+    assert result["count"] == 3
+    assert result["shadowed"] == 1
+    assert [
+        (c["namespace"], c["name"], c["version"], c["shadowed_by"])
+        for c in result["collections"]
+    ] == [
+        ("community", "general", "9.0.0", None),
+        ("o0_o", "controller", "1.1.0", None),
+        ("ansible", "posix", "1.5.4", None),
+        (
+            "community",
+            "general",
+            "8.0.0",
+            str(user / "ansible_collections" / "community" / "general"),
+        ),
+    ]
+
+
+def test_collections_memoized(roots, tmp_path, action_base) -> None:
+    """Test manifests are only re-read when their mtime changes."""
+    collections = action_base._collector("collections")
+    user, _ = roots
+    action_base._cache_dir = str(tmp_path / "cache")
+    manifest = (
+        user / "ansible_collections" / "community" / "general"
+    ) / "MANIFEST.json"
+
+    collections.collections(task_vars={})
+    st = os.stat(manifest)
+    manifest.write_text(json.dumps({"collection_info": {"version": "10"}}))
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    # The persisted index is reused by a fresh worker process
+    CollectionsCollector._collection_index.clear()
+    cached = collections.collections(task_vars={})
+
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    fresh = collections.collections(task_vars={})
+
+    assert cached["collections"][0]["version"] == "9.0.0"
+    assert fresh["collections"][0]["version"] == "10"
+    assert os.path.exists(tmp_path / "cache" / "collection-index.json")
@@ -11,31 +11,39 @@
 
 from __future__ import annotations
 
+import threading
+import time
+
 import pytest
 
 from ansible.errors import AnsibleActionFail
 
+SUBSETS = ["user", "config", "python", "packages"]
+
 
-def test_collector_all(monkeypatch, action_base) -> None:
+def test_collector_all(action_base, stub_collector) -> None:
     """Test collector gathers all subsets when 'all' is passed."""
-    monkeypatch.setattr(action_base, "user", lambda **_: {"u": 1})
-    monkeypatch.setattr(action_base, "config", lambda **_: {"c": 2})
-    monkeypatch.setattr(action_base, "python", lambda **_: {"p": 3})
+    stub_collector("user", lambda **_: {"u": 1})
+    stub_collector("config", lambda **_: {"c": 2})
+    stub_collector("python", lambda **_: {"p": 3})
+    stub_collector("packages", lambda **_: {"k": 4})
 
     result = action_base.collector(gather_subset=["all"])
 
     assert result["o0_controller"]["user"] == {"u": 1}
     assert result["o0_controller"]["config"] == {"c": 2}
     assert result["o0_controller"]["python"] == {"p": 3}
+    assert result["o0_controller"]["packages"] == {"k": 4}
 
 
-def test_collector_exclude(monkeypatch, action_base) -> None:
+def test_collector_exclude(action_base, stub_collector) -> None:
     """
     Test collector excludes specific subsets using '!subset' syntax.
     """
-    monkeypatch.setattr(action_base, "user", lambda **_: {"u": 1})
-    monkeypatch.setattr(action_base, "config", lambda **_: {"c": 2})
-    monkeypatch.setattr(action_base, "python", lambda **_: {"p": 3})
+    stub_collector("user", lambda **_: {"u": 1})
+    stub_collector("config", lambda **_: {"c": 2})
+    stub_collector("python", lambda **_: {"p": 3})
+    stub_collector("packages", lambda **_: {"k": 4})
 
     result = action_base.collector(gather_subset=["all", "!config"])
 
@@ -50,3 +58,172 @@ def test_collector_invalid_subset(action_base) -> None:
         action_base.collector(gather_subset=["bogus"])
 
     assert "Invalid gather_subset" in str(excinfo.value)
+
+
+def _sleeper(delay, value):
+    """Return a fake collector that sleeps before returning value."""
+
+    def collect(**_):
+        time.sleep(delay)
+        return value
+
+    return collect
+
+
+def test_collector_parallel_wall_time(action_base, stub_collector) -> None:
+    """
+    Test parallel collection takes roughly as long as the slowest one.
+
+    Sequentially these collectors take 0.7s; in parallel they should
+    finish in a little over 0.3s.
+    """
+    stub_collector("user", _sleeper(0.1, {"u": 1}))
+    stub_collector("config", _sleeper(0.2, {"c": 2}))
+    stub_collector("python", _sleeper(0.3, {"p": 3}))
+    stub_collector("packages", _sleeper(0.1, {"k": 4}))
+
+    start = time.perf_counter()
+    result = action_base.collector(gather_subset=SUBSETS, parallel=True)
+    elapsed = time.perf_counter() - start
+
+    assert list(result["o0_controller"]) == SUBSETS
+    assert result["o0_controller"]["python"] == {"p": 3}
+    assert elapsed < 0.5, f"parallel collection took {elapsed:.3f}s"
+
+
+def test_collector_parallel_timeout(
+    monkeypatch, action_base, stub_collector
+) -> None:
+    """Test a timed out collector is reported as None with a warning."""
+    stub_collector("user", _sleeper(0, {"u": 1}))
+    stub_collector("config", _sleeper(2, {"c": 2}))
+    stub_collector("python", _sleeper(0, {"p": 3}))
+    stub_collector("packages", _sleeper(0, {"k": 4}))
+    warnings = []
+    monkeypatch.setattr(action_base._display, "warning", warnings.append)
+
+    start = time.perf_counter()
+    result = action_base.collector(
+        gather_subset=SUBSETS, parallel=True, collector_timeout=0.2
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result["o0_controller"] == {
+        "user": {"u": 1},
+        "config": None,
+        "python": {"p": 3},
+        "packages": {"k": 4},
+    }
+    assert "'config' timed out" in warnings[0]
+    assert elapsed < 1, f"timed out collection took {elapsed:.3f}s"
+
+
+def test_collector_timeout_daemon(action_base, stub_collector) -> None:
+    """Test an abandoned collector cannot hold up the worker's exit."""
+    threads = []
+    release = threading.Event()
+
+    def hang(**_):
+        threads.append(threading.current_thread())
+        release.wait(5)
+        return {"c": 2}
+
+    stub_collector("user", _sleeper(0, {"u": 1}))
+    stub_collector("config", hang)
+
+    try:
+        result = action_base.collector(
+            gather_subset=["user", "config"],
+            parallel=True,
+            collector_timeout=0.1,
+        )
+    finally:
+        release.set()
+
+    assert result["o0_controller"]["config"] is None
+    assert threads[0].daemon
+
+
+def test_collector_timeout_queued(action_base, stub_collector) -> None:
+    """Test a collector timed out while queued is never started."""
+    calls = []
+    release = threading.Event()
+
+    def hang(**_):
+        calls.append("user")
+        release.wait(5)
+        return {"u": 1}
+
+    def config(**_):
+        calls.append("config")
+        return {"c": 2}
+
+    stub_collector("user", hang)
+    stub_collector("config", config)
+
+    try:
+        result = action_base.collector(
+            gather_subset=["user", "config"],
+            parallel=True,
+            max_workers=1,
+            collector_timeout=0.1,
+        )
+    finally:
+        release.set()
+
+    assert result["o0_controller"] == {"user": None, "config": None}
+    assert calls == ["user"]
+
+
+def test_collector_timeout_meta(action_base, stub_collector) -> None:
+    """Test every abandoned collector is flagged as timed out in _meta."""
+    release = threading.Event()
+
+    def hang(**_):
+        release.wait(5)
+        return {"u": 1}
+
+    stub_collector("user", hang)
+    stub_collector("config", _sleeper(0, {"c": 2}))
+
+    try:
+        result = action_base.collector(
+            gather_subset=["user", "config"],
+            parallel=True,
+            max_workers=1,
+            collector_timeout=0.1,
+            meta=True,
+        )
+    finally:
+        release.set()
+
+    collectors = result["o0_controller"]["_meta"]["collectors"]
+    assert action_base._timed_out == ["user", "config"]
+    # The hung collector started and has a timing record of its own
+    assert collectors["user"]["timed_out"] is True
+    assert collectors["user"]["wall"] is None
+    assert collectors["config"] == {"timed_out": True}
+
+
+def test_collector_parallel_error(action_base, stub_collector) -> None:
+    """Test a failing collector is re-raised after the others finish."""
+    finished = []
+
+    def fail(**_):
+        raise AnsibleActionFail("config failed")
+
+    def slow(**_):
+        time.sleep(0.1)
+        finished.append("python")
+        return {"p": 3}
+
+    stub_collector("user", _sleeper(0, {"u": 1}))
+    stub_collector("config", fail)
+    stub_collector("python", slow)
+    stub_collector("packages", _sleeper(0, {"k": 4}))
+
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        action_base.collector(gather_subset=SUBSETS, parallel=True)
+
+    assert "config failed" in str(excinfo.value)
+    assert finished == ["python"]
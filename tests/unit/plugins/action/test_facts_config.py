@@ -28,7 +28,7 @@ def test_config_reads_ini(action_base) -> None:
 
     task_vars = {"ansible_config_file": path}
 
-    result = action_base.config(task_vars=task_vars)
+    result = action_base._collector("config").config(task_vars=task_vars)
 
     assert result["path"] == path
     assert result["settings"]["defaults"]["inventory"] == "./hosts"
@@ -37,6 +37,6 @@ def test_config_reads_ini(action_base) -> None:
 def test_config_raises_without_var(action_base) -> None:
     """Test config raises error when ansible_config_file missing."""
     with pytest.raises(AnsibleActionFail) as excinfo:
-        action_base.config(task_vars={})
+        action_base._collector("config").config(task_vars={})
 
     assert "ansible_config_file" in str(excinfo.value)
@@ -0,0 +1,184 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import os
+import re
+import stat
+import sys
+
+import pytest
+
+# One sample line of the Prometheus text format
+SAMPLE = re.compile(
+    r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_][a-zA-Z0-9_]*="[^"]*",?)*\})? '
+    r"\S+$"
+)
+
+
+@pytest.fixture
+def export_run(tmp_path, action_base, stub_collector):
+    """Provide a run() helper with fake resources and packages."""
+    resources = {
+        "cpu": {"count": 8, "quota": None},
+        "load": {"1": 0.5, "5": 0.25},
+        "limits": {"nofile": {"soft": 1024, "hard": 4096}},
+        "cgroup": {"version": 2},
+    }
+    packages = {"count": 2, "distributions": [{"name": 'we"ird'}]}
+    stub_collector("resources", lambda **_: resources)
+    stub_collector("packages", lambda **_: packages)
+    stub_collector("ssh", lambda **_: {"exists": True})
+    path = tmp_path / "textfile" / "controller.prom"
+
+    def run(check_mode=False, **args):
+        action_base._task.args = {
+            "gather_subset": ["resources", "packages", "ssh"],
+            "export": str(path),
+            **args,
+        }
+        action_base._task.run_once = True
+        action_base._task.async_val = 0
+        action_base._task.check_mode = check_mode
+        action_base._task.diff = False
+        return action_base.run(
+            task_vars={"ansible_playbook_python": sys.executable}
+        )
+
+    return run, path
+
+
+def samples(text):
+    """Return the sample lines of a textfile as a name to value dict."""
+    return {
+        line.rpartition(" ")[0]: line.rpartition(" ")[2]
+        for line in text.splitlines()
+        if not line.startswith("#")
+    }
+
+
+def test_export_textfile(export_run) -> None:
+    """Test numeric facts and timings are written in the text format."""
+    run, path = export_run
+
+    result = run()
+
+    assert result.get("changed", False) is False
+    text = path.read_text()
+    assert text.endswith("\n")
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o644
+    assert not [p for p in os.listdir(path.parent) if p.startswith(".tmp-")]
+    lines = text.splitlines()
+    for line in lines:
+        assert line.startswith(("# HELP ", "# TYPE ")) or SAMPLE.match(line)
+
+    values = samples(text)
+    assert values["o0_controller_resources_cpu_count"] == "8"
+    assert values["o0_controller_resources_limits_nofile_soft"] == "1024"
+    assert values['o0_controller_resources_load{minutes="5"}'] == "0.25"
+    assert values["o0_controller_packages_count"] == "2"
+    assert values["o0_controller_ssh_exists"] == "1"
+    assert "o0_controller_resources_cpu_quota" not in values
+    assert not [k for k in values if "distributions" in k]
+    assert values['o0_controller_collector_cached{subset="ssh"}'] == "0"
+    assert values['o0_controller_collector_subprocesses{subset="ssh"}'] == "0"
+    assert float(values['o0_controller_collector_seconds{subset="ssh"}']) >= 0
+    assert "o0_controller_cache_hits" not in values
+    assert values["o0_controller_skipped_subsets"] == "0"
+    assert float(values["o0_controller_gather_seconds"]) >= 0
+
+    # Each metric has one HELP and TYPE line, before its samples
+    index = lines.index("# TYPE o0_controller_resources_load gauge")
+    assert lines[index - 1].startswith("# HELP o0_controller_resources_load ")
+    assert lines[index + 1 : index + 3] == [
+        'o0_controller_resources_load{minutes="1"} 0.5',
+        'o0_controller_resources_load{minutes="5"} 0.25',
+    ]
+    types = [line for line in lines if line.startswith("# TYPE ")]
+    assert len(types) == len({k.partition("{")[0] for k in values})
+
+
+def test_export_cache_hits(export_run, tmp_path) -> None:
+    """Test cache hits and misses are exported when caching is on."""
+    run, path = export_run
+    cache = {"cache": True, "cache_path": str(tmp_path / "cache")}
+
+    run(**cache)
+    cold = samples(path.read_text())
+    run(**cache)
+    warm = samples(path.read_text())
+
+    # Only packages can be cached among the subsets gathered
+    assert cold["o0_controller_cache_hits"] == "0"
+    assert cold["o0_controller_cache_misses"] == "1"
+    assert warm["o0_controller_cache_hits"] == "1"
+    assert warm["o0_controller_cache_misses"] == "0"
+    assert warm['o0_controller_collector_cached{subset="packages"}'] == "1"
+    assert warm['o0_controller_collector_cached{subset="ssh"}'] == "0"
+
+
+def test_export_check_mode(export_run) -> None:
+    """Test nothing is written in check mode."""
+    run, path = export_run
+
+    run(check_mode=True)
+
+    assert not path.exists()
+
+
+def test_export_cache_misses_filtered(export_run, tmp_path) -> None:
+    """Test subsets resolved through a filter are not cache misses."""
+    run, path = export_run
+
+    run(
+        gather_subset=["user"],
+        filter=["user.id"],
+        cache=True,
+        cache_path=str(tmp_path / "cache"),
+    )
+
+    values = samples(path.read_text())
+    assert values["o0_controller_cache_hits"] == "0"
+    assert values["o0_controller_cache_misses"] == "0"
+
+
+def test_export_special_values(export_run, stub_collector) -> None:
+    """Test infinities, NaN, bucket labels and name collisions."""
+    run, path = export_run
+    stub_collector(
+        "ssh",
+        lambda **_: {
+            "high": float("inf"),
+            "low": float("-inf"),
+            "odd": float("nan"),
+            "a-b": 1,
+            "a_b": 2,
+        },
+    )
+    stub_collector(
+        "fact_cache",
+        lambda **_: {"sizes": {"4096": 3, "65536": 1}},
+    )
+
+    run(gather_subset=["ssh", "fact_cache"])
+
+    text = path.read_text()
+    for line in text.splitlines():
+        assert line.startswith(("# HELP ", "# TYPE ")) or SAMPLE.match(line)
+    values = samples(text)
+    assert values["o0_controller_ssh_high"] == "+Inf"
+    assert values["o0_controller_ssh_low"] == "-Inf"
+    assert values["o0_controller_ssh_odd"] == "NaN"
+    assert values["o0_controller_ssh_a_b"] == "1"
+    assert text.count("# TYPE o0_controller_ssh_a_b ") == 1
+    assert values['o0_controller_fact_cache_sizes{bucket="4096"}'] == "3"
+    assert values['o0_controller_fact_cache_sizes{bucket="65536"}'] == "1"
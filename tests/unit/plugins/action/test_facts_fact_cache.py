@@ -0,0 +1,135 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Provide a jsonfile cache with two fresh and one expired entry."""
+    cache = tmp_path / "facts"
+    cache.mkdir()
+    (cache / "web1").write_text("x" * 100)
+    (cache / "web2").write_text("x" * 3000)
+    (cache / "old").write_text("x" * 100)
+    (cache / "subdir").mkdir()
+    old = time.time() - 7200
+    os.utime(cache / "old", (old, old))
+
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN", "ansible.builtin.jsonfile")
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN_CONNECTION", str(cache))
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN_TIMEOUT", "3600")
+    monkeypatch.delenv("ANSIBLE_CACHE_PLUGIN_PREFIX", raising=False)
+
+    return cache, {}
+
+
+def test_fact_cache_stats(cache_dir, action_base) -> None:
+    """Test fact_cache reports entries, sizes and expired files."""
+    cache, task_vars = cache_dir
+    action_base._task.check_mode = False
+
+    collector = action_base._collector("fact_cache")
+    result = collector.fact_cache(task_vars=task_vars)
+
+    assert result["plugin"] == "ansible.builtin.jsonfile"
+    assert result["timeout"] == 3600
+    assert result["file_backed"] is True
+    assert result["prefix"] == ""
+    assert result["path"] == str(cache)
+    assert result["entries"] == 3
+    assert result["bytes"] == 3200
+    assert result["sizes"] == {"128": 2, "4096": 1}
+    assert result["expired"] == 1
+    assert result["pruned"] == 0
+    assert (cache / "old").exists()
+
+
+def test_fact_cache_prune(cache_dir, action_base) -> None:
+    """Test expired entries are removed when pruning is enabled."""
+    cache, task_vars = cache_dir
+    action_base._task.check_mode = False
+
+    result = action_base.collector(
+        gather_subset=["fact_cache"], task_vars=task_vars, prune=["fact_cache"]
+    )
+
+    assert result["o0_controller"]["fact_cache"]["pruned"] == 1
+    assert sorted(os.listdir(cache)) == ["subdir", "web1", "web2"]
+
+
+def test_fact_cache_prefix(cache_dir, monkeypatch, action_base) -> None:
+    """Test only files named with fact_caching_prefix are entries."""
+    cache, task_vars = cache_dir
+    action_base._task.check_mode = False
+    # Without the collection loader only the short name can be loaded
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN", "jsonfile")
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN_PREFIX", "facts_")
+    (cache / "facts_web3").write_text("x" * 100)
+    (cache / "facts_stale").write_text("x" * 100)
+    (cache / ".facts_hidden").write_text("x" * 100)
+    old = time.time() - 7200
+    os.utime(cache / "facts_stale", (old, old))
+
+    result = action_base.collector(
+        gather_subset=["fact_cache"], task_vars=task_vars, prune=["fact_cache"]
+    )
+
+    facts = result["o0_controller"]["fact_cache"]
+    assert facts["prefix"] == "facts_"
+    assert facts["entries"] == 2
+    assert facts["bytes"] == 200
+    assert facts["expired"] == 1
+    assert facts["pruned"] == 1
+    assert sorted(os.listdir(cache)) == [
+        ".facts_hidden",
+        "facts_web3",
+        "old",
+        "subdir",
+        "web1",
+        "web2",
+    ]
+
+
+def test_fact_cache_no_timeout(cache_dir, monkeypatch, action_base) -> None:
+    """Test entries never expire with a timeout of 0."""
+    _, task_vars = cache_dir
+    monkeypatch.setenv("ANSIBLE_CACHE_PLUGIN_TIMEOUT", "0")
+
+    collector = action_base._collector("fact_cache")
+    result = collector.fact_cache(task_vars=task_vars)
+
+    assert result["timeout"] == 0
+    assert result["expired"] == 0
+
+
+def test_fact_cache_memory(monkeypatch, action_base) -> None:
+    """Test non file-backed plugins only report their settings."""
+    for var in (
+        "ANSIBLE_CACHE_PLUGIN",
+        "ANSIBLE_CACHE_PLUGIN_CONNECTION",
+        "ANSIBLE_CACHE_PLUGIN_TIMEOUT",
+    ):
+        monkeypatch.delenv(var, raising=False)
+
+    result = action_base._collector("fact_cache").fact_cache(task_vars={})
+
+    assert result == {
+        "plugin": "memory",
+        "connection": None,
+        "timeout": 86400,
+        "file_backed": False,
+    }
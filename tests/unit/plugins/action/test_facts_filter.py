@@ -0,0 +1,146 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.resources import (
+    ResourcesCollector,
+)
+
+
+@pytest.fixture
+def no_subprocess(monkeypatch):
+    """Fail the test if a collector starts a subprocess."""
+
+    def mock_run(*args, **kwargs):
+        raise AssertionError(f"Unexpected subprocess: {args}")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+
+def test_filter_interpreter_path(no_subprocess, action_base) -> None:
+    """Test the interpreter path is returned without probing it."""
+    path = "/nonexistent/bin/python"
+
+    result = action_base.collector(
+        task_vars={"ansible_playbook_python": path},
+        filter=["python.interpreter.path"],
+    )
+
+    assert result["o0_controller"] == {
+        "python": {"interpreter": {"path": path}}
+    }
+
+
+def test_filter_config_path(action_base, stub_collector) -> None:
+    """Test the config path is returned without parsing the file."""
+
+    def mock_config(**_):
+        raise AssertionError("Unexpected config parse")
+
+    stub_collector("config", mock_config)
+
+    result = action_base.collector(
+        task_vars={"ansible_config_file": "/etc/ansible/ansible.cfg"},
+        filter=["config.path"],
+    )
+
+    assert result["o0_controller"] == {
+        "config": {"path": "/etc/ansible/ansible.cfg"}
+    }
+
+
+def test_filter_globs(no_subprocess, action_base) -> None:
+    """Test globs match one key each and select whole subtrees."""
+    result = action_base.collector(
+        gather_subset=["user", "resources"],
+        filter=["user.gr*", "resources.*.nofile"],
+    )
+
+    facts = result["o0_controller"]
+    assert set(facts) == {"user", "resources"}
+    assert set(facts["user"]) == {"group", "groups"}
+    assert facts["user"]["group"] == facts["user"]["groups"][0]
+    assert facts["resources"] == {
+        "limits": {"nofile": ResourcesCollector._rlimit("RLIMIT_NOFILE")}
+    }
+
+
+def test_filter_soft_limits(no_subprocess, action_base) -> None:
+    """Test the soft limit glob from the module documentation."""
+    result = action_base.collector(
+        gather_subset=["resources"], filter=["resources.limits.*.soft"]
+    )
+
+    limits = result["o0_controller"]["resources"]["limits"]
+    assert set(limits) == {"nofile", "nproc"}
+    for name, limit in limits.items():
+        rlimit = ResourcesCollector._rlimit(f"RLIMIT_{name.upper()}")
+        assert limit == {"soft": rlimit["soft"]}
+
+
+def test_filter_drops_emptied_subsets(action_base, stub_collector) -> None:
+    """Test a subset in which no key matches is left out."""
+    stub_collector("packages", lambda **_: {"count": 2})
+    stub_collector("ssh", lambda **_: {"live": 0})
+
+    result = action_base.collector(
+        gather_subset=["packages", "ssh"],
+        filter=["packages.count", "ssh.nonexistent"],
+    )
+
+    assert result["o0_controller"] == {"packages": {"count": 2}}
+
+
+def test_filter_skips_unmatched_subsets(action_base, stub_collector) -> None:
+    """Test subsets that cannot match the filter are not collected."""
+    calls = []
+
+    def collector(name, value):
+        def collect(**_):
+            calls.append(name)
+            return value
+
+        return collect
+
+    stub_collector("packages", collector("packages", {"count": 2}))
+    stub_collector("ssh", collector("ssh", {"live": 0}))
+
+    result = action_base.collector(
+        gather_subset=["packages", "ssh"], filter=["packages.count"]
+    )
+
+    assert calls == ["packages"]
+    assert result["o0_controller"] == {"packages": {"count": 2}}
+
+
+def _shape(tree):
+    """Return the nested keys of a fact tree."""
+    if not isinstance(tree, dict):
+        return None
+    return {k: _shape(v) for k, v in tree.items()}
+
+
+def test_filter_matches_full_collection(no_subprocess, action_base) -> None:
+    """Test resolved leaves have the same keys as the full collectors."""
+    subsets = ["user", "resources"]
+    full = action_base.collector(gather_subset=subsets)["o0_controller"]
+    leaves = action_base.collector(
+        gather_subset=subsets, filter=["user.*", "resources.*.*"]
+    )["o0_controller"]
+
+    assert leaves["user"] == full["user"]
+    assert list(leaves["resources"]) == list(full["resources"])
+    assert _shape(leaves) == _shape(full)
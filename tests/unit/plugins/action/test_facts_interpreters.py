@@ -0,0 +1,171 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.interpreters import (
+    InterpretersCollector,
+)
+
+
+def fake_python(path, log, version, ansible=False, venv=False) -> str:
+    """Write a script answering the probe like an interpreter would."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    info = {
+        "version": version,
+        "implementation": "CPython",
+        "executable": str(path),
+        "prefix": str(path.parent.parent),
+        "venv": venv,
+        "purelib": str(path.parent.parent / "site-packages"),
+        "ansible_core": {
+            "importable": ansible,
+            "version": "2.19.0" if ansible else None,
+        },
+    }
+    path.write_text(
+        "#!/bin/sh\n"
+        f"echo \"$0\" >> '{log}'\n"
+        f"echo '{json.dumps(info)}'\n"
+    )
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def pythons(tmp_path, monkeypatch, action_base):
+    """Provide a PATH and a venv root with fake interpreters."""
+    monkeypatch.setattr(InterpretersCollector, "_survey_index", {})
+    log = tmp_path / "probes.log"
+    log.write_text("")
+    system = tmp_path / "usr" / "bin"
+    fake_python(system / "python3", log, "3.9.18")
+    (system / "python3-config").write_text("")
+    (system / "python").symlink_to("python3")
+    broken = system / "python2"
+    broken.write_text("#!/bin/sh\nexit 1\n")
+    broken.chmod(0o755)
+
+    venvs = tmp_path / "venvs"
+    venv = venvs / "ansible" / "bin" / "python"
+    fake_python(venv, log, "3.12.1", ansible=True, venv=True)
+    (venvs / "ansible" / "pyvenv.cfg").write_text("")
+    (venvs / "ansible" / "site-packages").mkdir()
+
+    monkeypatch.setenv("PATH", str(system))
+
+    return str(system), str(venvs), log
+
+
+def probes(log) -> list:
+    """Return the interpreters run so far."""
+    return log.read_text().split()
+
+
+def test_interpreters_survey(pythons, action_base) -> None:
+    """Test interpreters are discovered, deduplicated and probed."""
+    system, venvs, log = pythons
+    action_base._venv_roots = [venvs]
+
+    result = action_base._collector("interpreters").interpreters(task_vars={})
+
+    assert result["venv_roots"] == [venvs]
+    assert result["count"] == 3
+    assert result["probed"] == 3
+    by_path = {i["path"]: i for i in result["interpreters"]}
+    assert list(by_path) == [
+        os.path.join(system, "python"),
+        os.path.join(system, "python2"),
+        os.path.join(venvs, "ansible", "bin", "python"),
+    ]
+    system_python = by_path[os.path.join(system, "python")]
+    assert system_python["aliases"] == [os.path.join(system, "python3")]
+    assert system_python["version"] == "3.9.18"
+    assert system_python["ansible_core"]["importable"] is False
+    assert system_python["error"] is None
+    assert by_path[os.path.join(system, "python2")]["version"] is None
+    assert by_path[os.path.join(system, "python2")]["error"]
+    venv_python = by_path[os.path.join(venvs, "ansible", "bin", "python")]
+    assert venv_python["venv"] is True
+    assert venv_python["ansible_core"] == {
+        "importable": True,
+        "version": "2.19.0",
+    }
+    assert "purelib" not in venv_python
+    assert result["fastest_with_ansible"] == venv_python["path"]
+    assert len(probes(log)) == 2
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_interpreters_reuse_results(
+    pythons, tmp_path, action_base, cache
+) -> None:
+    """
+    Test a re-survey only probes changed interpreters, across runs.
+
+    The index is kept on disk whether or not the fact cache is enabled.
+    """
+    system, venvs, log = pythons
+    cache_path = str(tmp_path / "cache")
+
+    cold = action_base.collector(
+        gather_subset=["interpreters"],
+        venv_roots=[venvs],
+        cache=cache,
+        cache_path=cache_path,
+        meta=True,
+    )["o0_controller"]["_meta"]["collectors"]["interpreters"]
+    assert len(probes(log)) == 2
+    assert cold["subprocesses"]["count"] == 3
+
+    # A new worker process starts with an empty index
+    InterpretersCollector._survey_index.clear()
+    result = action_base.collector(
+        gather_subset=["interpreters"],
+        venv_roots=[venvs],
+        cache=cache,
+        cache_path=cache_path,
+    )["o0_controller"]["interpreters"]
+    assert result["probed"] == 0  # failures are remembered as well
+    assert len(probes(log)) == 2
+
+    # Installing a package changes the mtime of site-packages
+    site = os.path.join(venvs, "ansible", "site-packages")
+    os.utime(site, ns=(0, 0))
+    result = action_base._collector("interpreters").interpreters(task_vars={})
+    assert result["probed"] == 1
+    assert probes(log)[-1] == os.path.join(venvs, "ansible", "bin", "python")
+
+
+def test_interpreters_playbook_python(monkeypatch, tmp_path, action_base):
+    """Test the playbook interpreter is probed for real and listed first."""
+    monkeypatch.setattr(InterpretersCollector, "_survey_index", {})
+    monkeypatch.setenv("PATH", str(tmp_path))
+    action_base._venv_roots = [str(tmp_path / "missing")]
+
+    result = action_base._collector("interpreters").interpreters(
+        task_vars={"ansible_playbook_python": sys.executable}
+    )
+
+    assert result["count"] == 1
+    interpreter = result["interpreters"][0]
+    assert interpreter["path"] == sys.executable
+    assert interpreter["version"] == ".".join(
+        str(v) for v in sys.version_info[:3]
+    )
+    assert interpreter["ansible_core"]["importable"] is True
+    assert interpreter["probe_seconds"] > 0
@@ -0,0 +1,111 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import sys
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.inventory import (
+    InventoryCollector,
+)
+
+
+class RawHostVars(dict):
+    """Stand-in for HostVars that records raw_get() calls."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def raw_get(self, host):
+        self.calls.append(host)
+        return self[host]
+
+
+def inventory(hosts: int) -> dict:
+    """Return task_vars for web and db groups with a heavy db variable."""
+    names = [f"host{i:05d}" for i in range(hosts)]
+    half = hosts // 2
+    web, db = names[:half], names[half:]
+    hostvars = RawHostVars()
+    for name in web:
+        hostvars[name] = {"role": "web", "inventory_hostname": name}
+    for name in db:
+        hostvars[name] = {"role": "db", "schema": ["x" * 100] * 50}
+
+    return {
+        "groups": {"all": names, "ungrouped": [], "web": web, "db": db},
+        "hostvars": hostvars,
+    }
+
+
+def test_inventory_footprint(action_base) -> None:
+    """Test inventory counts hosts and ranks groups and variables."""
+    task_vars = inventory(10)
+
+    result = action_base._collector("inventory").inventory(task_vars=task_vars)
+
+    assert result["hosts"] == 10
+    assert result["groups"] == 4
+    assert result["sampled_hosts"] == 10
+    assert task_vars["hostvars"].calls == task_vars["groups"]["all"]
+    assert result["top_groups"][0]["name"] == "all"
+    assert result["top_groups"][1]["name"] == "db"
+    assert result["top_groups"][1]["hosts"] == 5
+    assert result["top_variables"][0]["name"] == "schema"
+    assert result["top_variables"][0]["hosts"] == 5
+    assert "inventory_hostname" not in {
+        v["name"] for v in result["top_variables"]
+    }
+    assert result["truncated"] is False
+
+
+def test_inventory_samples_large(monkeypatch, action_base) -> None:
+    """Test only a bounded sample of hosts is measured."""
+    monkeypatch.setattr(InventoryCollector, "INVENTORY_SAMPLE", 20)
+    task_vars = inventory(1000)
+
+    result = action_base._collector("inventory").inventory(task_vars=task_vars)
+
+    assert result["hosts"] == 1000
+    assert result["sampled_hosts"] == 20
+    assert len(task_vars["hostvars"].calls) == 20
+    db = next(g for g in result["top_groups"] if g["name"] == "db")
+    assert db["sampled"] == 10
+    assert db["estimated_bytes"] > 500 * sys.getsizeof(["x"] * 50)
+
+
+def test_deep_sizeof_iterative(monkeypatch, action_base) -> None:
+    """Test nesting deeper than the recursion limit is measured."""
+    inventory = action_base._collector("inventory")
+    nested = []
+    for _ in range(sys.getrecursionlimit() * 2):
+        nested = [nested]
+
+    size, complete = inventory._deep_sizeof(nested)
+
+    assert complete is True
+    assert size >= sys.getsizeof([]) * sys.getrecursionlimit() * 2
+
+    monkeypatch.setattr(InventoryCollector, "INVENTORY_MAX_NODES", 10)
+    _, complete = inventory._deep_sizeof(nested)
+
+    assert complete is False
+
+
+def test_deep_sizeof_shared(action_base) -> None:
+    """Test objects referenced twice are counted once."""
+    inventory = action_base._collector("inventory")
+    item = "x" * 1000
+    once, _ = inventory._deep_sizeof([item])
+    twice, _ = inventory._deep_sizeof([item, item])
+
+    assert twice - once == sys.getsizeof([item, item]) - sys.getsizeof([item])
@@ -0,0 +1,67 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import pstats
+
+
+def test_meta_timings(tmp_path, action_base, stub_collector) -> None:
+    """Test _meta reports timings, subprocesses and cache hits."""
+
+    def fake_python(**_):
+        action_base._collector("python")._run_command(["true"])
+        return {"p": 3}
+
+    stub_collector("user", lambda **_: {"u": 1})
+    stub_collector("python", fake_python)
+    kwargs = {
+        "gather_subset": ["user", "python"],
+        "meta": True,
+        "cache": True,
+        "cache_path": str(tmp_path),
+        "task_vars": {"ansible_playbook_python": "/nonexistent/python"},
+    }
+
+    cold = action_base.collector(**kwargs)["o0_controller"]["_meta"]
+    warm = action_base.collector(**kwargs)["o0_controller"]["_meta"]
+
+    python = cold["collectors"]["python"]
+    assert python["subprocesses"]["count"] == 1
+    assert len(python["subprocesses"]["durations"]) == 1
+    assert python["wall"] >= python["subprocesses"]["durations"][0]
+    assert python["cpu"] >= 0
+    assert cold["collectors"]["user"]["cached"] is False
+    assert warm["collectors"]["user"]["cached"] is True
+    assert warm["collectors"]["python"]["subprocesses"]["count"] == 0
+
+
+def test_meta_disabled_by_default(action_base, stub_collector) -> None:
+    """Test _meta is only added when requested."""
+    stub_collector("user", lambda **_: {"u": 1})
+
+    result = action_base.collector(gather_subset=["user"])
+
+    assert "_meta" not in result["o0_controller"]
+
+
+def test_profile_env(monkeypatch, tmp_path, action_base) -> None:
+    """Test run() writes a pstats file when profiling is requested."""
+    monkeypatch.setenv(action_base.PROFILE_ENV, str(tmp_path))
+    monkeypatch.setattr(action_base._task, "args", {"gather_subset": ["user"]})
+    monkeypatch.setattr(action_base._task, "run_once", True)
+    monkeypatch.setattr(action_base._task, "async_val", 0)
+
+    action_base.run(task_vars={})
+
+    (profile,) = tmp_path.glob("o0_controller-*.pstats")
+    stats = pstats.Stats(str(profile))
+    assert any(func[2] == "user" for func in stats.stats)
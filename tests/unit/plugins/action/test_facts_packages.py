@@ -0,0 +1,122 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+
+import pytest
+
+from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.packages import (
+    PackagesCollector,
+)
+
+
+@pytest.fixture
+def venv(monkeypatch, tmp_path):
+    """
+    Create a fake virtual environment with installed metadata.
+
+    Its interpreter reports the site-packages directory through a
+    symlink, and probing it runs no subprocess.
+    """
+    site_dir = tmp_path / "lib" / "python3.12" / "site-packages"
+    dist_info = site_dir / "Jinja2-3.1.4.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: Jinja2\nVersion: 3.1.4\n\nBody\n"
+    )
+    (site_dir / "legacy-1.0-py3.12.egg-info").write_text(
+        "Metadata-Version: 1.0\nName: legacy\nVersion: 1.0\n"
+    )
+    (site_dir / "ansible_core-2.17.0.dist-info").mkdir()
+    (site_dir / "jinja2").mkdir()
+    (tmp_path / "lib64").symlink_to("lib")
+    (tmp_path / "lib" / "python3.12" / "dist-packages").mkdir()
+    python = tmp_path / "bin" / "python"
+    python.parent.mkdir()
+    python.write_text("")
+
+    probe = {
+        "site_packages": [
+            str(tmp_path / "lib64" / "python3.12" / "site-packages"),
+            str(tmp_path / "missing"),
+        ]
+    }
+
+    def mock_run(args, capture_output, encoding, check, timeout):
+        return type("Result", (), {"stdout": json.dumps(probe)})()
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    monkeypatch.setattr(PackagesCollector, "_interpreter_index", {})
+
+    return tmp_path
+
+
+def test_packages(monkeypatch, venv, action_base) -> None:
+    """Test packages collector lists dist-info and egg-info metadata."""
+    monkeypatch.setattr(PackagesCollector, "_package_index", {})
+
+    result = action_base._collector("packages").packages(
+        task_vars={"ansible_playbook_python": str(venv / "bin" / "python")}
+    )
+
+    assert result["paths"] == [
+        os.path.realpath(venv / "lib" / "python3.12" / "site-packages")
+    ]
+    assert result["count"] == 3
+    assert [(d["name"], d["version"]) for d in result["distributions"]] == [
+        ("ansible_core", "2.17.0"),
+        ("Jinja2", "3.1.4"),
+        ("legacy", "1.0"),
+    ]
+
+
+def test_packages_index_skips_unchanged(
+    monkeypatch, venv, tmp_path, action_base
+) -> None:
+    """Test unchanged site-packages directories are not re-parsed."""
+    packages = action_base._collector("packages")
+    monkeypatch.setattr(PackagesCollector, "_package_index", {})
+    action_base._cache_dir = str(tmp_path / "cache")
+    task_vars = {"ansible_playbook_python": str(venv / "bin" / "python")}
+    scans = []
+    read = packages._read_distributions
+
+    def counting_read(site_dir):
+        scans.append(site_dir)
+        return read(site_dir)
+
+    monkeypatch.setattr(packages, "_read_distributions", counting_read)
+
+    packages.packages(task_vars=task_vars)
+    PackagesCollector._package_index.clear()
+    packages.packages(task_vars=task_vars)
+
+    site_dir = venv / "lib" / "python3.12" / "site-packages"
+    (site_dir / "new-0.1.dist-info").mkdir()
+    st = os.stat(site_dir)
+    os.utime(site_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    result = packages.packages(task_vars=task_vars)
+
+    assert len(scans) == 2
+    assert result["count"] == 4
+
+
+def test_packages_raises_without_interpreter(action_base) -> None:
+    """Test packages raises error when ansible_playbook_python missing."""
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        action_base._collector("packages").packages(task_vars={})
+
+    assert "ansible_playbook_python" in str(excinfo.value)
@@ -0,0 +1,122 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.process import (
+    ProcessCollector,
+)
+
+PLAYBOOK = "/usr/bin/python3\0/usr/bin/ansible-playbook\0site.yml\0"
+
+
+def stat_line(pid, name, ppid, ticks, threads, pages) -> str:
+    """Return a /proc/<pid>/stat line with the fields the collector uses."""
+    fields = ["S", ppid] + [0] * 9 + [ticks, ticks] + [0] * 4 + [threads]
+    fields += [0] * 3 + [pages] + [0] * 20
+    return f"{pid} ({name}) " + " ".join(str(f) for f in fields) + "\n"
+
+
+@pytest.fixture
+def proc(monkeypatch, tmp_path, action_base):
+    """Provide a /proc with ansible-playbook, two workers and an ssh."""
+    root = tmp_path / "proc"
+    worker = os.getpid()
+    tree = [
+        # pid, name, ppid, ticks, threads, pages, cmdline, fds
+        (100, "ansible-playboo", 1, 500, 3, 1000, PLAYBOOK, 3),
+        (worker, "ansible-playboo", 100, 50, 1, 500, PLAYBOOK, 2),
+        (150, "ansible-playboo", 100, 10, 1, 400, PLAYBOOK, 2),
+        (300, "ssh (mux)", worker, 1, 1, 100, "ssh\0host\0", 1),
+        (400, "bash", 1, 1, 1, 100, "bash\0", 1),
+        (1, "init", 0, 1, 1, 100, "/sbin/init\0", 1),
+    ]
+    for pid, name, ppid, ticks, threads, pages, cmdline, fds in tree:
+        path = root / str(pid)
+        (path / "fd").mkdir(parents=True)
+        for fd in range(fds):
+            (path / "fd" / str(fd)).write_text("")
+        (path / "stat").write_text(
+            stat_line(pid, name, ppid, ticks, threads, pages)
+        )
+        (path / "cmdline").write_text(cmdline)
+    (root / "self").mkdir()
+    (root / "meminfo").write_text("")
+    monkeypatch.setattr(ProcessCollector, "PROC_ROOT", str(root))
+
+    return worker
+
+
+def test_process_tree(proc, action_base) -> None:
+    """Test process reports the tree under ansible-playbook."""
+    tick = 1 / os.sysconf("SC_CLK_TCK")
+    page = os.sysconf("SC_PAGE_SIZE")
+
+    result = action_base._collector("process").process()
+
+    assert result["root_found"] is True
+    assert result["sample_window"] is None
+    # Children are listed in PID order, each followed by its own
+    expected = [(100, "parent")]
+    for pid in sorted([150, proc]):
+        expected.append((pid, "worker"))
+        if pid == proc:
+            expected.append((300, "child"))
+    assert [(p["pid"], p["role"]) for p in result["processes"]] == expected
+    parent = result["processes"][0]
+    assert parent["name"] == "ansible-playboo"
+    assert parent["rss_bytes"] == 1000 * page
+    assert parent["cpu_seconds"] == round(1000 * tick, 2)
+    assert parent["fds"] == 3
+    assert parent["threads"] == 3
+    assert "cpu_rate" not in parent
+    ssh = [p for p in result["processes"] if p["pid"] == 300]
+    assert ssh[0]["name"] == "ssh (mux)"
+    assert result["totals"] == {
+        "count": 4,
+        "workers": 2,
+        "rss_bytes": 2000 * page,
+        "cpu_seconds": round(
+            sum(round(t * 2 * tick, 2) for t in (500, 50, 10, 1)), 2
+        ),
+        "fds": 8,
+        "threads": 6,
+    }
+
+
+def test_process_sample_rates(proc, action_base) -> None:
+    """Test a sampling window adds rates."""
+    result = action_base.collector(
+        gather_subset=["process"], process_sample=0.01
+    )
+
+    process = result["o0_controller"]["process"]
+    assert process["sample_window"] >= 0.01
+    assert process["totals"]["cpu_rate"] == 0.0
+    assert process["totals"]["rss_rate"] == 0
+    assert all(p["cpu_rate"] == 0.0 for p in process["processes"])
+
+
+def test_process_without_ansible(action_base) -> None:
+    """Test the tree starts at this process outside of Ansible."""
+    result = action_base._collector("process").process()
+
+    assert result["root_found"] is False
+    parent = result["processes"][0]
+    assert parent["pid"] == os.getpid()
+    assert parent["role"] == "parent"
+    assert parent["rss_bytes"] > 0
+    assert parent["fds"] > 0
+    assert result["totals"]["count"] >= 1
@@ -0,0 +1,181 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+from ansible.errors import AnsibleActionFail
+
+
+@pytest.fixture
+def fake_collectors(action_base, stub_collector):
+    """Replace every collector with one recording its calls."""
+    calls = []
+
+    def fake(name, delay=0):
+        def collect(**_):
+            calls.append(name)
+            time.sleep(delay)
+            return {"name": name}
+
+        return collect
+
+    for name in action_base.COSTS:
+        stub_collector(name, fake(name))
+
+    def slow(name, delay):
+        stub_collector(name, fake(name, delay))
+
+    return calls, slow
+
+
+def test_every_collector_has_a_cost(action_base) -> None:
+    """Test each cost class is gathered by some profile."""
+    classes = set(action_base.PROFILES["full"])
+
+    assert set(action_base.COSTS.values()) <= classes
+
+
+def test_profiles_documented(action_base) -> None:
+    """Test the README lists the subsets each profile adds."""
+    readme = Path(__file__).parents[4] / "README.md"
+    documented = {
+        m.group(1): set(re.findall(r"`(\w+)`", m.group(2)))
+        for m in re.finditer(
+            r"^- `(\w+)`: (.*(?:\n  .*)*)", readme.read_text(), re.M
+        )
+        if m.group(1) in action_base.PROFILES
+    }
+
+    gathered = set()
+    for profile, costs in action_base.PROFILES.items():
+        subsets = {s for s, c in action_base.COSTS.items() if c in costs}
+        assert documented[profile] == subsets - gathered, profile
+        gathered = subsets
+
+
+@pytest.mark.parametrize(
+    "profile, expected",
+    [
+        ("fast", ["user", "resources", "run_stats"]),
+        (
+            "default",
+            [
+                "user",
+                "config",
+                "python",
+                "packages",
+                "resources",
+                "advisor",
+                "process",
+                "run_stats",
+            ],
+        ),
+        ("full", None),
+    ],
+)
+def test_profile_limits_all(
+    fake_collectors, action_base, profile, expected
+) -> None:
+    """Test each profile gathers the collectors of its cost classes."""
+    calls, _ = fake_collectors
+
+    action_base.collector(gather_profile=profile)
+
+    assert calls == (expected or list(action_base.COSTS))
+
+
+def test_profile_keeps_named_subsets(fake_collectors, action_base) -> None:
+    """Test subsets named in gather_subset ignore the profile."""
+    calls, _ = fake_collectors
+
+    action_base.collector(
+        gather_subset=["all", "inventory"], gather_profile="fast"
+    )
+
+    assert calls == ["user", "resources", "inventory", "run_stats"]
+
+
+def test_profile_invalid(action_base) -> None:
+    """Test collector raises error for invalid profile names."""
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        action_base.collector(gather_profile="bogus")
+
+    assert "Invalid gather_profile" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_gather_timeout_partial(
+    fake_collectors, action_base, parallel
+) -> None:
+    """Test collection stops at the deadline with partial facts."""
+    _, slow = fake_collectors
+    slow("config", 1.0)
+
+    start = time.monotonic()
+    result = action_base.collector(
+        gather_subset=["user", "config", "python"],
+        gather_timeout=0.1,
+        parallel=parallel,
+    )
+    elapsed = time.monotonic() - start
+
+    facts = result["o0_controller"]
+    assert elapsed < 0.5
+    assert "user" in facts
+    assert "config" not in facts
+    assert ("python" in facts) is parallel
+    assert action_base._skipped == (
+        ["config"] if parallel else ["config", "python"]
+    )
+
+
+def test_gather_timeout_meta(fake_collectors, action_base) -> None:
+    """Test subsets skipped at the deadline are timed out in _meta."""
+    _, slow = fake_collectors
+    slow("config", 1.0)
+
+    result = action_base.collector(
+        gather_subset=["user", "config"],
+        gather_timeout=0.1,
+        parallel=True,
+        meta=True,
+    )
+
+    collectors = result["o0_controller"]["_meta"]["collectors"]
+    assert "timed_out" not in collectors["user"]
+    assert collectors["config"]["timed_out"] is True
+    assert "subprocesses" in collectors["config"]
+
+
+def test_gather_timeout_run(monkeypatch, fake_collectors, action_base) -> None:
+    """Test run() lists the skipped subsets."""
+    _, slow = fake_collectors
+    slow("resources", 1.0)
+    monkeypatch.setattr(
+        action_base._task,
+        "args",
+        {"gather_profile": "fast", "gather_timeout": 0.05},
+    )
+    monkeypatch.setattr(action_base._task, "run_once", True)
+    monkeypatch.setattr(action_base._task, "async_val", 0)
+
+    result = action_base.run(task_vars={})
+
+    assert result["skipped_subsets"] == ["resources", "run_stats"]
+    assert result["ansible_facts"]["o0_controller"] == {
+        "user": {"name": "user"}
+    }
@@ -0,0 +1,151 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+
+import pytest
+
+from ansible import constants as C
+from ansible.errors import AnsibleActionFail
+from ansible.inventory.manager import InventoryManager
+from ansible.parsing.dataloader import DataLoader
+from ansible.vars.manager import VariableManager
+
+HOSTS = 200
+
+
+@pytest.fixture
+def publish_run(monkeypatch, tmp_path, action_base, stub_collector):
+    """Provide a run() helper with a fake collector of about 40 KiB."""
+    monkeypatch.setattr(C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    facts = {f"key{i}": "x" * 400 for i in range(100)}
+    stub_collector("user", lambda **_: facts)
+    task_vars = {"groups": {"all": ["localhost", "web1"]}}
+
+    def run(run_once=True, **args):
+        if args.get("publish") == "host_vars":
+            args.setdefault("publish_host", "localhost")
+        action_base._task.args = {"gather_subset": ["user"], **args}
+        action_base._task.run_once = run_once
+        action_base._task.async_val = 0
+        return action_base.run(task_vars=task_vars)
+
+    return run
+
+
+def test_publish_host_vars(publish_run) -> None:
+    """Test host_vars mode returns add_host data instead of facts."""
+    result = publish_run(publish="host_vars")
+
+    assert "ansible_facts" not in result
+    assert result["add_host"]["host_name"] == "localhost"
+    assert result["add_host"]["groups"] == []
+    published = result["add_host"]["host_vars"]["o0_controller_published"]
+    assert len(published["user"]) == 100
+
+
+def test_publish_host_required(publish_run) -> None:
+    """Test host_vars mode needs an explicit publish_host."""
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        publish_run(publish="host_vars", publish_host=None)
+
+    assert "publish_host" in str(excinfo.value)
+
+
+def test_publish_over_stale_fact(publish_run) -> None:
+    """Test a prior o0_controller fact does not hide the published one."""
+    loader = DataLoader()
+    inventory = InventoryManager(loader=loader)
+    inventory.add_host("localhost", "all")
+    variables = VariableManager(loader=loader, inventory=inventory)
+    variables.set_host_facts("localhost", {"o0_controller": {"stale": 1}})
+    result = publish_run(publish="host_vars")
+
+    inventory.add_dynamic_host(result["add_host"], result)
+    host_vars = variables.get_vars(host=inventory.get_host("localhost"))
+
+    assert result["changed"] is True
+    assert host_vars["o0_controller"] == {"stale": 1}
+    assert len(host_vars["o0_controller_published"]["user"]) == 100
+
+    again = publish_run(publish="host_vars")
+    inventory.add_dynamic_host(again["add_host"], again)
+
+    assert again["changed"] is False
+
+
+def test_publish_once_per_task(publish_run) -> None:
+    """Test only the worker that computes the facts publishes them."""
+    leader = publish_run(run_once=False, publish="host_vars")
+    follower = publish_run(run_once=False, publish="host_vars")
+
+    assert "add_host" in leader
+    assert "add_host" not in follower
+    assert "ansible_facts" not in follower
+
+
+def test_publish_host_must_exist(publish_run) -> None:
+    """Test publishing to a host outside the inventory fails."""
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        publish_run(publish="host_vars", publish_host="missing")
+
+    assert "missing" in str(excinfo.value)
+
+
+def apply_results(results) -> int:
+    """
+    Apply one result per host the way the strategy does.
+
+    Each host's result is a separate copy, as it is when it arrives from
+    that host's worker process. Facts are set on the host; add_host data
+    is merged into the variables of the host it names.
+
+    :returns int: Bytes allocated by the inventory and variables
+    """
+    loader = DataLoader()
+    inventory = InventoryManager(loader=loader)
+    inventory.add_group("web")
+    for i in range(HOSTS):
+        inventory.add_host(f"web{i}", "web")
+    inventory.add_host("localhost", "all")
+    variables = VariableManager(loader=loader, inventory=inventory)
+    wire = [json.dumps(r) for r in results]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(HOSTS):
+        item = json.loads(wire[min(i, len(wire) - 1)])
+        if "add_host" in item:
+            inventory.add_dynamic_host(item["add_host"], item)
+        if "ansible_facts" in item:
+            variables.set_host_facts(f"web{i}", item["ansible_facts"].copy())
+        del item
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return growth
+
+
+def test_publish_memory_growth(publish_run) -> None:
+    """Test publishing once keeps memory flat as hosts are added."""
+    facts = apply_results([publish_run(run_once=False)])
+    published = apply_results(
+        [
+            publish_run(run_once=False, publish="host_vars"),
+            publish_run(run_once=False, publish="host_vars"),
+        ]
+    )
+
+    assert facts > HOSTS * 40000
+    assert published * 20 < facts
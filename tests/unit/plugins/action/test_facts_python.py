@@ -11,35 +11,161 @@
 
 from __future__ import annotations
 
+import json
+import os
+import platform
 import subprocess
 import sys
 
 import pytest
 
 from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.packages import (
+    PackagesCollector,
+)
 
+PROBE = {
+    "version": "3.12.1",
+    "implementation": "CPython",
+    "executable": "/usr/bin/python3.12",
+    "prefix": "/srv/venv",
+    "base_prefix": "/usr",
+    "venv": True,
+    "paths": {"purelib": "/srv/venv/lib/python3.12/site-packages"},
+    "pip": "24.0",
+    "site_packages": ["/srv/venv/lib/python3.12/site-packages"],
+}
 
-def test_python_info(monkeypatch, action_base) -> None:
-    """Test python collector returns interpreter and pip information."""
-    monkeypatch.setattr(sys, "version", "3.12.1 (main, Jan 1 2025) ...")
 
-    def mock_run(args, capture_output, encoding, check):
-        return type("Result", (), {"stdout": "pip 24.0 from ..."})()
+@pytest.fixture
+def interpreter(monkeypatch, tmp_path, action_base):
+    """Provide an interpreter path whose probe runs are recorded."""
+    monkeypatch.setattr(PackagesCollector, "_interpreter_index", {})
+    path = tmp_path / "venv" / "bin" / "python"
+    path.parent.mkdir(parents=True)
+    path.write_text("")
+    calls = []
+
+    def mock_run(args, capture_output, encoding, check, timeout):
+        calls.append(args)
+        return type("Result", (), {"stdout": json.dumps(PROBE)})()
 
     monkeypatch.setattr(subprocess, "run", mock_run)
 
-    result = action_base.python(
-        task_vars={"ansible_playbook_python": "/usr/bin/python3"}
-    )
+    return str(path), calls
+
+
+def test_python_info(interpreter, action_base) -> None:
+    """Test python collector reports one probe of the interpreter."""
+    python = action_base._collector("python")
+    path, calls = interpreter
 
-    assert result["interpreter"]["path"] == "/usr/bin/python3"
+    result = python.python(task_vars={"ansible_playbook_python": path})
+
+    assert calls == [[path, "-c", python.PYTHON_PROBE]]
+    assert result["interpreter"]["path"] == path
+    assert result["interpreter"]["executable"] == "/usr/bin/python3.12"
     assert result["interpreter"]["version"]["id"] == "3.12.1"
+    assert result["interpreter"]["venv"] is True
+    assert result["interpreter"]["base_prefix"] == "/usr"
     assert result["pip"]["version"]["id"] == "24.0"
 
 
+def test_python_probe_memoized(interpreter, action_base) -> None:
+    """Test the probe only runs again when the interpreter changes."""
+    python = action_base._collector("python")
+    path, calls = interpreter
+    task_vars = {"ansible_playbook_python": path}
+
+    python.python(task_vars=task_vars)
+    python.python(task_vars=task_vars)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    python.python(task_vars=task_vars)
+
+    assert len(calls) == 2
+
+
+def test_python_cache_hit_without_probe(
+    interpreter, tmp_path, action_base
+) -> None:
+    """Test a new worker validates a cache entry without probing."""
+    path, calls = interpreter
+    kwargs = {
+        "gather_subset": ["python"],
+        "task_vars": {"ansible_playbook_python": path},
+        "cache": True,
+        "cache_path": str(tmp_path / "cache"),
+    }
+
+    first = action_base.collector(**kwargs)
+    # As in the next task, run by a new worker process
+    PackagesCollector._interpreter_index.clear()
+    second = action_base.collector(**kwargs)
+
+    assert first == second
+    assert len(calls) == 1
+    assert action_base._timings["python"]["cached"] is True
+    assert action_base._timings["python"]["subprocesses"]["count"] == 0
+
+
+def test_python_self_in_process(monkeypatch, action_base) -> None:
+    """Test the running interpreter is described without forking."""
+
+    def mock_run(*args, **kwargs):
+        raise AssertionError(f"Unexpected subprocess: {args}")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    result = action_base._collector("python").python(
+        task_vars={"ansible_playbook_python": sys.executable}
+    )
+
+    interpreter = result["interpreter"]
+    assert interpreter["version"]["id"] == platform.python_version()
+    assert interpreter["executable"] == os.path.realpath(sys.executable)
+    assert interpreter["prefix"] == sys.prefix
+    assert "purelib" in interpreter["paths"]
+
+
+def test_python_venv_of_running_interpreter(
+    monkeypatch, tmp_path, action_base
+) -> None:
+    """Test a venv made from the running interpreter is probed apart."""
+    monkeypatch.setattr(PackagesCollector, "_interpreter_index", {})
+    venv = tmp_path / "venv"
+    subprocess.run(
+        [sys.executable, "-m", "venv", "--without-pip", str(venv)],
+        check=True,
+    )
+    path = str(venv / "bin" / "python")
+
+    result = action_base._collector("python").python(
+        task_vars={"ansible_playbook_python": path}
+    )
+
+    interpreter = result["interpreter"]
+    assert os.path.realpath(path) == os.path.realpath(sys.executable)
+    assert interpreter["venv"] is True
+    assert os.path.realpath(interpreter["prefix"]) == os.path.realpath(venv)
+    assert interpreter["prefix"] != sys.prefix
+
+
+def test_python_probe_failure(monkeypatch, tmp_path, action_base) -> None:
+    """Test an interpreter that cannot be probed raises an error."""
+    python = action_base._collector("python")
+    monkeypatch.setattr(PackagesCollector, "_interpreter_index", {})
+    path = str(tmp_path / "missing" / "python")
+
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        python.python(task_vars={"ansible_playbook_python": path})
+
+    assert path in str(excinfo.value)
+
+
 def test_python_raises_without_interpreter(action_base) -> None:
     """Test python raises error when ansible_playbook_python missing."""
     with pytest.raises(AnsibleActionFail) as excinfo:
-        action_base.python(task_vars={})
+        action_base._collector("python").python(task_vars={})
 
     assert "ansible_playbook_python" in str(excinfo.value)
@@ -0,0 +1,102 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import os
+import resource
+import subprocess
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.resources import (
+    ResourcesCollector,
+)
+
+MEMINFO = """\
+MemTotal:       16384000 kB
+MemFree:         1024000 kB
+MemAvailable:    8192000 kB
+SwapTotal:       2048000 kB
+SwapFree:        1024000 kB
+"""
+
+
+def write(path, text) -> None:
+    """Write text to path, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_resources_cgroup_v2(monkeypatch, tmp_path, action_base) -> None:
+    """Test resources reads meminfo, cgroup v2 limits and rlimits."""
+    proc = tmp_path / "proc"
+    cgroup = tmp_path / "cgroup"
+    write(proc / "meminfo", MEMINFO)
+    write(proc / "self" / "cgroup", "0::/ansible.slice\n")
+    write(cgroup / "ansible.slice" / "cpu.max", "150000 100000\n")
+    write(cgroup / "ansible.slice" / "memory.max", "4294967296\n")
+    write(cgroup / "ansible.slice" / "memory.current", "1073741824\n")
+    write(cgroup / "ansible.slice" / "pids.max", "max\n")
+    monkeypatch.setattr(ResourcesCollector, "PROC_ROOT", str(proc))
+    monkeypatch.setattr(ResourcesCollector, "CGROUP_ROOT", str(cgroup))
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2, 3})
+    monkeypatch.setattr(
+        resource,
+        "getrlimit",
+        lambda which: (1024, resource.RLIM_INFINITY),
+    )
+
+    def mock_run(*args, **kwargs):
+        raise AssertionError(f"Unexpected subprocess: {args}")
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    result = action_base._collector("resources").resources()
+
+    assert result["cpu"]["available"] == 4
+    assert result["cpu"]["quota"] == 1.5
+    assert result["cpu"]["effective"] == 2
+    assert result["memory"] == {
+        "total_bytes": 16384000 * 1024,
+        "available_bytes": 8192000 * 1024,
+    }
+    assert result["swap"]["free_bytes"] == 1024000 * 1024
+    assert result["cgroup"] == {
+        "version": 2,
+        "cpu_quota": 1.5,
+        "memory_limit_bytes": 4294967296,
+        "memory_usage_bytes": 1073741824,
+        "pids_limit": None,
+    }
+    assert result["limits"]["nofile"] == {"soft": 1024, "hard": None}
+
+
+def test_resources_cgroup_v1(monkeypatch, tmp_path, action_base) -> None:
+    """Test resources reads cgroup v1 limits from the controller root."""
+    proc = tmp_path / "proc"
+    cgroup = tmp_path / "cgroup"
+    write(
+        proc / "self" / "cgroup",
+        "4:memory:/docker/abc\n2:cpu,cpuacct:/docker/abc\n1:pids:/\n",
+    )
+    write(cgroup / "cpu,cpuacct" / "cpu.cfs_quota_us", "-1\n")
+    write(cgroup / "cpu,cpuacct" / "cpu.cfs_period_us", "100000\n")
+    write(cgroup / "memory" / "memory.limit_in_bytes", "9223372036854771712\n")
+    write(cgroup / "pids" / "pids.max", "4096\n")
+    monkeypatch.setattr(ResourcesCollector, "PROC_ROOT", str(proc))
+    monkeypatch.setattr(ResourcesCollector, "CGROUP_ROOT", str(cgroup))
+
+    result = action_base._collector("resources").resources()
+
+    assert result["cgroup"]["version"] == 1
+    assert result["cgroup"]["cpu_quota"] is None
+    assert result["cgroup"]["memory_limit_bytes"] is None
+    assert result["cgroup"]["pids_limit"] == 4096
+    assert result["memory"]["available_bytes"] is None
@@ -0,0 +1,44 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+from ansible_collections.o0_o.controller.plugins.plugin_utils import timing
+from ansible_collections.o0_o.controller.plugins.plugin_utils.collectors.run_stats import (
+    RunStatsCollector,
+)
+
+
+def test_run_stats_without_callback(monkeypatch, action_base) -> None:
+    """Test run_stats reports the callback as disabled."""
+    monkeypatch.setattr(timing, "_RECORDER", None)
+    collector = action_base._collector("run_stats")
+
+    assert collector.run_stats() == {"enabled": False}
+
+
+def test_run_stats_reads_recorder(monkeypatch, action_base) -> None:
+    """Test run_stats summarizes the recorder and limits the top lists."""
+    monkeypatch.setattr(timing, "_RECORDER", None)
+    recorder = timing.start_recording()
+    recorder.task_start("u1", "setup", "ansible.builtin.setup")
+    for i in range(15):
+        recorder.host_start(f"host{i:02}", "u1")
+        recorder.host_end(f"host{i:02}", "u1")
+
+    result = action_base.collector(gather_subset=["run_stats"])
+
+    run_stats = result["o0_controller"]["run_stats"]
+    assert run_stats["enabled"] is True
+    assert run_stats["overall"]["count"] == 15
+    assert list(run_stats["modules"]) == ["ansible.builtin.setup"]
+    assert len(run_stats["slowest_tasks"]) == 1
+    assert len(run_stats["slowest_hosts"]) == RunStatsCollector.RUN_STATS_TOP
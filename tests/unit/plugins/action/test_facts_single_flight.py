@@ -0,0 +1,73 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+
+from ansible import constants as C
+
+
+def test_single_flight_computes_once(
+    monkeypatch, tmp_path, action_base
+) -> None:
+    """Test concurrent worker processes share one computed result."""
+    monkeypatch.setattr(C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    calls = tmp_path / "calls"
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+
+    def compute():
+        with open(calls, "a") as f:
+            f.write("x")
+        time.sleep(0.2)
+        return {"o0_controller": {"user": {"id": 1}}}
+
+    def worker():
+        queue.put(action_base._single_flight("key", compute))
+
+    procs = [ctx.Process(target=worker) for _ in range(8)]
+    for p in procs:
+        p.start()
+    results = [queue.get(timeout=10) for _ in procs]
+    for p in procs:
+        p.join()
+
+    assert calls.read_text() == "x"
+    assert all(r == {"o0_controller": {"user": {"id": 1}}} for r in results)
+
+
+def test_single_flight_run(
+    monkeypatch, tmp_path, action_base, stub_collector
+) -> None:
+    """Test run() shares facts between hosts of the same task."""
+    monkeypatch.setattr(C, "DEFAULT_LOCAL_TMP", str(tmp_path))
+    monkeypatch.setattr(action_base._task, "run_once", False)
+    monkeypatch.setattr(
+        action_base._task,
+        "args",
+        {"gather_subset": ["user"], "single_flight": True},
+    )
+    monkeypatch.setattr(action_base._task, "async_val", 0)
+    calls = []
+
+    def fake_user(**_):
+        calls.append("user")
+        return {"u": 1}
+
+    stub_collector("user", fake_user)
+
+    first = action_base.run(task_vars={})
+    second = action_base.run(task_vars={})
+
+    assert calls == ["user"]
+    assert first["ansible_facts"] == second["ansible_facts"]
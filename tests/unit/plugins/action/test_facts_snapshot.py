@@ -0,0 +1,101 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def snapshot_run(tmp_path, action_base, stub_collector):
+    """Provide a run() helper with fake user and python collectors."""
+    facts = {
+        "user": {"id": "1000", "groups": ["wheel"]},
+        "python": {"interpreter": {"version": {"id": "3.12.1"}}},
+    }
+    stub_collector("user", lambda **_: facts["user"])
+    stub_collector("python", lambda **_: facts["python"])
+    path = tmp_path / "snapshot.json"
+
+    def run(check_mode=False, diff=False, meta=False):
+        action_base._task.args = {
+            "gather_subset": ["user", "python"],
+            "snapshot_path": str(path),
+            "meta": meta,
+        }
+        action_base._task.run_once = True
+        action_base._task.async_val = 0
+        action_base._task.check_mode = check_mode
+        action_base._task.diff = diff
+        return action_base.run(task_vars={})
+
+    return run, facts, path
+
+
+def test_snapshot_first_run(snapshot_run) -> None:
+    """Test the first run reports every fact and writes the snapshot."""
+    run, facts, path = snapshot_run
+
+    result = run()
+
+    assert result["changed"] is True
+    assert result["changed_keys"] == ["python", "user"]
+    assert result["ansible_facts"]["o0_controller"] == facts
+    assert json.loads(path.read_text()) == facts
+    assert " " not in path.read_text()
+
+
+def test_snapshot_reports_only_changes(snapshot_run) -> None:
+    """Test later runs return only the keys that differ."""
+    run, facts, path = snapshot_run
+    run()
+
+    unchanged = run()
+    facts["python"]["interpreter"]["version"]["id"] = "3.13.0"
+    changed = run(diff=True, meta=True)
+
+    assert unchanged.get("changed", False) is False
+    assert unchanged["changed_keys"] == []
+    assert unchanged["ansible_facts"]["o0_controller"] == {}
+    assert changed["changed"] is True
+    assert changed["changed_keys"] == ["python.interpreter.version.id"]
+    namespace = changed["ansible_facts"]["o0_controller"]
+    assert set(namespace) == {"python", "_meta"}
+    assert namespace["python"] == facts["python"]
+    assert changed["diff"] == {
+        "before": {"python": {"interpreter": {"version": {"id": "3.12.1"}}}},
+        "after": {"python": {"interpreter": {"version": {"id": "3.13.0"}}}},
+    }
+    assert json.loads(path.read_text()) == facts
+
+
+def test_snapshot_removed_key(snapshot_run) -> None:
+    """Test removed keys are listed but absent from the facts."""
+    run, facts, _ = snapshot_run
+    run()
+
+    del facts["user"]["groups"]
+    result = run()
+
+    assert result["changed_keys"] == ["user.groups"]
+    assert result["ansible_facts"]["o0_controller"] == {}
+
+
+def test_snapshot_check_mode(snapshot_run) -> None:
+    """Test check mode reports changes without writing the snapshot."""
+    run, _, path = snapshot_run
+
+    result = run(check_mode=True)
+
+    assert result["changed"] is True
+    assert not path.exists()
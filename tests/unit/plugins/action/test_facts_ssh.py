@@ -0,0 +1,94 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import socket
+
+import pytest
+
+
+@pytest.fixture
+def control_path(tmp_path):
+    """Provide a control path dir with one live and one stale socket."""
+    cp = tmp_path / "cp"
+    cp.mkdir()
+
+    # A listening socket stands in for a running ControlMaster
+    live = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    live.bind(str(cp / "live"))
+    live.listen(1)
+
+    # A bound socket that was never listened on refuses connections,
+    # like one left behind by a master that has exited
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(cp / "stale"))
+    stale.close()
+
+    (cp / "not-a-socket").write_text("")
+
+    yield cp
+
+    live.close()
+
+
+def test_ssh_counts_sockets(control_path, action_base) -> None:
+    """Test ssh tells live sockets from stale ones without pruning."""
+    action_base._task.check_mode = False
+    task_vars = {"ansible_control_path_dir": str(control_path)}
+
+    result = action_base._collector("ssh").ssh(task_vars=task_vars)
+
+    assert result["control_path_dir"] == str(control_path)
+    assert result["exists"] is True
+    assert result["sockets"] == {"live": 1, "stale": 1, "unknown": 0}
+    assert result["age"]["min"] is not None
+    assert result["pruned"] == 0
+    assert (control_path / "stale").exists()
+
+
+def test_ssh_prunes_stale_sockets(control_path, action_base) -> None:
+    """Test run() removes stale sockets and reports a change."""
+    action_base._task.args = {"gather_subset": ["ssh"], "prune": ["ssh"]}
+    action_base._task.run_once = True
+    action_base._task.async_val = 0
+    action_base._task.check_mode = False
+    task_vars = {"ansible_control_path_dir": str(control_path)}
+
+    result = action_base.run(task_vars=task_vars)
+
+    assert result["changed"] is True
+    assert result["ansible_facts"]["o0_controller"]["ssh"]["pruned"] == 1
+    assert not (control_path / "stale").exists()
+    assert (control_path / "live").exists()
+
+
+def test_ssh_prune_check_mode(control_path, action_base) -> None:
+    """Test nothing is pruned in check mode."""
+    action_base._task.check_mode = True
+    action_base.collector(
+        gather_subset=["ssh"],
+        task_vars={"ansible_control_path_dir": str(control_path)},
+        prune=["ssh"],
+    )
+
+    assert (control_path / "stale").exists()
+
+
+def test_ssh_missing_dir(tmp_path, action_base) -> None:
+    """Test ssh reports a missing control path dir."""
+    task_vars = {"ansible_control_path_dir": str(tmp_path / "missing")}
+
+    result = action_base._collector("ssh").ssh(task_vars=task_vars)
+
+    assert result["exists"] is False
+    assert result["sockets"] == {"live": 0, "stale": 0, "unknown": 0}
+    assert result["age"]["mean"] is None
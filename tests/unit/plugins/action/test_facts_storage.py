@@ -0,0 +1,166 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+import os
+import subprocess
+
+import pytest
+from ansible import constants as C
+
+
+@pytest.fixture
+def dead_pid():
+    """Provide the PID of a process that has exited."""
+    proc = subprocess.Popen(["true"])
+    proc.wait()
+    return proc.pid
+
+
+@pytest.fixture
+def ansible_tmp(monkeypatch, tmp_path, dead_pid):
+    """Provide an Ansible tmp dir with live and stale temp dirs."""
+    tmp = tmp_path / "tmp"
+    tmp.mkdir()
+    pid = os.getpid()
+
+    # This run's own local tmp dir and a worker's remote tmp dir
+    own = tmp / f"ansible-local-{pid}ab12cd34"
+    own.mkdir()
+    (tmp / f"ansible-tmp-1700000000.1-{pid}-42").mkdir()
+
+    # Left behind by a run that crashed, with a nested tree
+    stale = tmp / f"ansible-local-{dead_pid}0a1b2c3d"
+    (stale / "ansible_collections" / "ns").mkdir(parents=True)
+    (stale / "ansible_collections" / "ns" / "plugin.py").write_text("x" * 10)
+    (tmp / f"ansible-tmp-1700000000.2-{dead_pid}-7").mkdir()
+    old = 1700000000
+    os.utime(stale, (old, old))
+    os.utime(tmp / f"ansible-tmp-1700000000.2-{dead_pid}-7", (old, old))
+
+    (tmp / "ansible-local-notapid").mkdir()
+    (tmp / f"ansible-tmp-1700000000.3-{dead_pid}-8").write_text("")
+
+    monkeypatch.setattr(C, "DEFAULT_LOCAL_TMP", str(own))
+    monkeypatch.setenv("ANSIBLE_REMOTE_TEMP", str(tmp))
+    monkeypatch.setenv("ANSIBLE_HOME", str(tmp_path))
+
+    return tmp
+
+
+def test_storage_counts_temp_dirs(ansible_tmp, action_base) -> None:
+    """Test storage tells live temp dirs from stale ones without pruning."""
+    action_base._task.check_mode = False
+
+    result = action_base._collector("storage").storage()
+
+    assert result["home"]["path"] == str(ansible_tmp.parent)
+    assert result["home"]["filesystem"]["total_bytes"] > 0
+    assert len(result["tmp"]) == 1
+    tmp = result["tmp"][0]
+    assert tmp["path"] == str(ansible_tmp)
+    assert tmp["settings"] == ["local_tmp", "remote_tmp"]
+    assert tmp["exists"] is True
+    assert tmp["filesystem"]["free_inodes"] <= tmp["filesystem"][
+        "total_inodes"
+    ]
+    assert tmp["temp_dirs"] == {"live": 2, "stale": 2, "unknown": 0}
+    # Two stale directories, plus two subdirectories and a file
+    assert tmp["stale_inodes"] == 5
+    assert tmp["stale_bytes"] > 0
+    assert result["pruned"] == 0
+    assert len(list(ansible_tmp.iterdir())) == 6
+
+
+def test_storage_prunes_stale_temp_dirs(ansible_tmp, action_base) -> None:
+    """Test run() removes stale temp dirs and reports a change."""
+    action_base._task.args = {
+        "gather_subset": ["storage"],
+        "prune": ["storage"],
+    }
+    action_base._task.run_once = True
+    action_base._task.async_val = 0
+    action_base._task.check_mode = False
+
+    result = action_base.run(task_vars={})
+
+    assert result["changed"] is True
+    assert result["ansible_facts"]["o0_controller"]["storage"]["pruned"] == 2
+    remaining = sorted(p.name for p in ansible_tmp.iterdir())
+    assert len(remaining) == 4
+    pid = str(os.getpid())
+    assert sum(pid in name for name in remaining) == 2
+
+
+def test_storage_keeps_recent_temp_dirs(
+    ansible_tmp, action_base, dead_pid
+) -> None:
+    """Test a recently modified temp dir is live after its worker exits."""
+    # An async job still running in the dir of an exited worker
+    job = ansible_tmp / f"ansible-tmp-1700000000.4-{dead_pid}-9"
+    job.mkdir()
+    action_base._task.check_mode = False
+
+    result = action_base.collector(
+        gather_subset=["storage"], prune=["storage"]
+    )
+
+    storage = result["o0_controller"]["storage"]
+    assert storage["tmp"][0]["temp_dirs"]["live"] == 3
+    assert storage["pruned"] == 2
+    assert job.is_dir()
+
+
+def test_storage_prune_check_mode(ansible_tmp, action_base) -> None:
+    """Test nothing is removed in check mode."""
+    action_base._task.check_mode = True
+
+    result = action_base.collector(
+        gather_subset=["storage"], prune=["storage"]
+    )
+
+    assert result["o0_controller"]["storage"]["pruned"] == 0
+    assert len(list(ansible_tmp.iterdir())) == 6
+
+
+def test_storage_separate_dirs(monkeypatch, tmp_path, action_base) -> None:
+    """Test local_tmp and remote_tmp are scanned separately."""
+    local = tmp_path / "local"
+    (local / "ansible-local-1ab12cd34").mkdir(parents=True)
+    monkeypatch.setattr(
+        C, "DEFAULT_LOCAL_TMP", str(local / "ansible-local-1ab12cd34")
+    )
+    monkeypatch.setenv("ANSIBLE_REMOTE_TEMP", str(tmp_path / "missing"))
+
+    result = action_base._collector("storage").storage()
+
+    local_tmp, remote_tmp = result["tmp"]
+    assert local_tmp["settings"] == ["local_tmp"]
+    assert remote_tmp["settings"] == ["remote_tmp"]
+    assert remote_tmp["exists"] is False
+    assert remote_tmp["filesystem"] is None
+    assert remote_tmp["temp_dirs"] == {"live": 0, "stale": 0, "unknown": 0}
+
+
+def test_disk_usage_streams_deep_trees(tmp_path, action_base) -> None:
+    """Test the walk sizes deep trees and does not follow symlinks."""
+    path = tmp_path
+    for depth in range(50):
+        path = path / f"d{depth}"
+    path.mkdir(parents=True)
+    (path / "link").symlink_to("/")
+
+    storage = action_base._collector("storage")
+    size, inodes = storage._disk_usage(str(tmp_path / "d0"))
+
+    assert inodes == 51
+    assert size > 0
@@ -11,28 +11,89 @@
 
 from __future__ import annotations
 
+import grp
 import os
+import pwd
 import subprocess
+import time
+
+import pytest
+
+from ansible.errors import AnsibleActionFail
 
 
 def test_user(monkeypatch, action_base) -> None:
     """Test user collector gathers controller user information."""
     monkeypatch.setattr(os, "geteuid", lambda: 1000)
+    monkeypatch.setattr(
+        pwd,
+        "getpwuid",
+        lambda uid: pwd.struct_passwd(
+            ("testuser", "x", uid, 1000, "", "/home/testuser", "/bin/sh")
+        ),
+    )
+    monkeypatch.setattr(
+        os, "getgrouplist", lambda name, gid: [gid, 27, 1000, 4242]
+    )
+    names = {1000: "testgroup", 27: "sudo"}
 
-    def mock_run(args, capture_output, encoding, check):
-        if "-un" in args:
-            return type("Result", (), {"stdout": "testuser\n"})()
-        if "-g" in args:
-            return type("Result", (), {"stdout": "1000\n"})()
-        if "-gn" in args:
-            return type("Result", (), {"stdout": "testgroup\n"})()
-        raise ValueError(f"Unexpected args: {args}")
+    def mock_getgrgid(gid):
+        if gid not in names:
+            raise KeyError(gid)
+        return grp.struct_group((names[gid], "x", gid, []))
 
+    def mock_run(*args, **kwargs):
+        raise AssertionError(f"Unexpected subprocess: {args}")
+
+    monkeypatch.setattr(grp, "getgrgid", mock_getgrgid)
     monkeypatch.setattr(subprocess, "run", mock_run)
 
-    result = action_base.user()
+    result = action_base._collector("user").user()
 
     assert result["id"] == 1000
     assert result["name"] == "testuser"
     assert result["group"]["id"] == "1000"
     assert result["group"]["name"] == "testgroup"
+    assert result["groups"] == [
+        {"id": "1000", "name": "testgroup"},
+        {"id": "27", "name": "sudo"},
+        {"id": "4242", "name": None},
+    ]
+    assert result["home"] == "/home/testuser"
+    assert result["shell"] == "/bin/sh"
+
+
+def test_user_raises_without_passwd_entry(monkeypatch, action_base) -> None:
+    """Test user raises error when the euid has no passwd entry."""
+
+    def mock_getpwuid(uid):
+        raise KeyError(uid)
+
+    monkeypatch.setattr(pwd, "getpwuid", mock_getpwuid)
+
+    with pytest.raises(AnsibleActionFail) as excinfo:
+        action_base._collector("user").user()
+
+    assert "no passwd entry" in str(excinfo.value)
+
+
+def test_user_faster_than_fork(action_base) -> None:
+    """
+    Test in-process user lookup beats a single 'id' fork per call.
+
+    The previous implementation spawned three 'id' processes, so even
+    one fork is a conservative bound for the latency improvement.
+    """
+    rounds = 20
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        action_base._collector("user").user()
+    in_process = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        subprocess.run(["id", "-un"], capture_output=True, check=True)
+    fork = (time.perf_counter() - start) / rounds
+
+    assert in_process < fork
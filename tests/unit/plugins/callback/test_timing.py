@@ -0,0 +1,132 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.controller Ansible Collection.
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansible_collections.o0_o.controller.plugins.callback.timing import (
+    CallbackModule,
+)
+from ansible_collections.o0_o.controller.plugins.plugin_utils import timing
+
+
+@pytest.fixture
+def clock():
+    """Provide a clock that only moves when told to."""
+
+    class Clock:
+        now = 0.0
+
+        def __call__(self):
+            return self.now
+
+    return Clock()
+
+
+@pytest.fixture
+def callback(monkeypatch, clock):
+    """Provide a timing callback recording with the fake clock."""
+    monkeypatch.setattr(timing, "_RECORDER", None)
+    plugin = CallbackModule()
+    plugin._recorder.clock = clock
+    plugin._recorder.start = clock()
+    return plugin
+
+
+def _task(uuid, name, action):
+    task = MagicMock(_uuid=uuid, resolved_action=action)
+    task.get_name.return_value = name
+    return task
+
+
+def _host(name):
+    host = MagicMock()
+    host.get_name.return_value = name
+    return host
+
+
+def _result(host, task):
+    return MagicMock(_host=host, _task=task)
+
+
+def test_histogram_quantiles() -> None:
+    """Test quantiles are within a bucket of the exact values."""
+    histogram = timing.Histogram()
+    for ms in range(1, 1001):
+        histogram.add(ms / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.05)
+    assert histogram.quantile(0.95) == pytest.approx(0.95, rel=0.05)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.quantile(1.0) == 1.0
+    assert histogram.quantile(0.0) == 0.001
+
+
+def test_histogram_constant_memory() -> None:
+    """Test the number of buckets is bounded by the range of values."""
+    histogram = timing.Histogram()
+    for i in range(100000):
+        histogram.add((i % 86400) + 0.5)
+
+    assert histogram.count == 100000
+    assert len(histogram.buckets) < 300
+    assert timing.Histogram().summary()["p95"] is None
+
+
+def test_callback_records_tasks(callback, clock) -> None:
+    """Test the callback aggregates per task, module and host."""
+    ping = _task("u1", "ping all", "ansible.builtin.ping")
+    copy = _task("u2", "copy file", "ansible.builtin.copy")
+    web, db = _host("web"), _host("db")
+
+    callback.v2_playbook_on_task_start(ping, False)
+    callback.v2_runner_on_start(web, ping)
+    callback.v2_runner_on_start(db, ping)
+    clock.now = 1.0
+    callback.v2_runner_on_ok(_result(web, ping))
+    clock.now = 3.0
+    callback.v2_runner_on_unreachable(_result(db, ping))
+
+    callback.v2_playbook_on_task_start(copy, False)
+    callback.v2_runner_on_start(web, copy)
+    clock.now = 13.0
+    callback.v2_runner_on_failed(_result(web, copy))
+    # Skipped without a start event counts from the task start
+    callback.v2_runner_on_skipped(_result(db, copy))
+
+    summary = callback._recorder.summary()
+
+    assert summary["elapsed"] == 13.0
+    assert summary["overall"]["count"] == 4
+    assert summary["overall"]["max"] == 10.0
+    assert set(summary["modules"]) == {
+        "ansible.builtin.copy",
+        "ansible.builtin.ping",
+    }
+    assert summary["modules"]["ansible.builtin.ping"]["total"] == 4.0
+    assert [t["name"] for t in summary["slowest_tasks"]] == [
+        "copy file",
+        "ping all",
+    ]
+    assert summary["slowest_hosts"] == [
+        {"name": "db", "count": 2, "total": 13.0, "max": 10.0, "failed": 1},
+        {"name": "web", "count": 2, "total": 11.0, "max": 10.0, "failed": 1},
+    ]
+    assert callback._recorder.running == {}
+
+
+def test_callback_sets_recorder(callback) -> None:
+    """Test the callback's recorder is the one the facts plugin reads."""
+    assert timing.recorder() is callback._recorder